@@ -0,0 +1,96 @@
+"""Benchmark slide extraction on a synthetic deck.
+
+Each slide has a title, a group nested GROUP_DEPTH deep with a linked
+shape at every level, a TABLE_ROWS x TABLE_COLUMNS table with a link in
+every cell, and linked speaker notes. The deck is extracted at several
+sizes so the time per element shows whether extraction stays linear.
+
+Usage: python benchmarks/bench_extract.py
+"""
+
+import time
+
+from google_slidebot.slides import extract_slides_from_presentation
+
+GROUP_DEPTH = 200
+TABLE_ROWS = 50
+TABLE_COLUMNS = 10
+ROUNDS = 3
+
+
+def linked_text(content: str, url: str) -> dict:
+    """A text body with a single linked run."""
+    return {
+        "textElements": [
+            {"textRun": {"content": content, "style": {"link": {"url": url}}}}
+        ]
+    }
+
+
+def make_slide(number: int) -> tuple[dict, int]:
+    """Build one synthetic slide, returning it and its element count."""
+    nested = {"shape": {"text": linked_text("Leaf", f"https://x/{number}/leaf")}}
+    for depth in range(GROUP_DEPTH):
+        shape = {"shape": {"text": linked_text("Level", f"https://x/{number}/{depth}")}}
+        nested = {"elementGroup": {"children": [shape, nested]}}
+
+    table = {
+        "table": {
+            "tableRows": [
+                {
+                    "tableCells": [
+                        {"text": linked_text("Cell", f"https://x/{number}/{row}/{col}")}
+                        for col in range(TABLE_COLUMNS)
+                    ]
+                }
+                for row in range(TABLE_ROWS)
+            ]
+        }
+    }
+
+    slide = {
+        "objectId": f"p{number}",
+        "pageElements": [
+            {"shape": {"text": linked_text(f"Slide {number}", "https://x/title")}},
+            nested,
+            table,
+        ],
+        "slideProperties": {
+            "notesPage": {
+                "pageElements": [
+                    {"shape": {"text": linked_text("Notes", "https://x/notes")}}
+                ]
+            }
+        },
+    }
+    elements = 2 * GROUP_DEPTH + 1 + 1 + TABLE_ROWS * TABLE_COLUMNS + 2
+    return slide, elements
+
+
+def make_deck(slide_count: int) -> tuple[dict, int]:
+    """Build a synthetic presentation, returning it and its element count."""
+    slides = []
+    total = 0
+    for number in range(1, slide_count + 1):
+        slide, elements = make_slide(number)
+        slides.append(slide)
+        total += elements
+    return {"slides": slides}, total
+
+
+def main() -> None:
+    for slide_count in (10, 20, 40, 80):
+        deck, elements = make_deck(slide_count)
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            slides = extract_slides_from_presentation(deck)
+        elapsed = (time.perf_counter() - start) / ROUNDS
+        links = sum(len(slide.links) for slide in slides)
+        print(
+            f"{slide_count:3} slides  {elements:6} elements  {links:6} links  "
+            f"{elapsed * 1000:7.1f} ms  {elapsed * 1e9 / elements:6.0f} ns/element"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark the memory a day's worth of decks takes once loaded.
+
+Loads several synthetic decks, as the daemon does over a conference
+day, and measures what their Slide and Link objects keep allocated after
+the API responses are gone. Compares the slotted model with interned link
+strings against the plain dataclasses it replaced, which had an instance
+dict each and their own copy of every string.
+
+Decks are parsed from JSON, so as with real API responses every
+occurrence of a string starts out as a separate object. A share of links
+recur across slides and decks, as footer and repo links do.
+
+Usage: python benchmarks/bench_memory.py [DECKS] [SLIDES]
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from unittest.mock import patch
+
+from synthetic import make_presentation
+
+from google_slidebot import slides
+
+LINKS_PER_SLIDE = 10
+SHARED_LINKS = 0.3
+
+
+@dataclass
+class PlainLink:
+    text: str
+    url: str
+    source: str = "text"
+
+
+@dataclass
+class PlainSlide:
+    number: int
+    title: str
+    links: list = field(default_factory=list)
+    object_id: str = ""
+    loaded: bool = True
+
+
+def loaded_size(responses: list[str]) -> int:
+    """Bytes still allocated after extracting every deck from its response."""
+    gc.collect()
+    tracemalloc.start()
+    decks = [
+        slides.extract_slides_from_presentation(json.loads(response))
+        for response in responses
+    ]
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del decks
+    return size
+
+
+def main() -> None:
+    decks = int(sys.argv[1]) if len(sys.argv) > 1 else 24
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    responses = [
+        json.dumps(
+            make_presentation(
+                count, seed=seed, links=LINKS_PER_SLIDE, shared=SHARED_LINKS
+            )
+        )
+        for seed in range(decks)
+    ]
+
+    with (
+        patch.object(slides, "Link", PlainLink),
+        patch.object(slides, "Slide", PlainSlide),
+    ):
+        before = loaded_size(responses)
+    after = loaded_size(responses)
+
+    print(f"{decks} decks of {count} slides, {LINKS_PER_SLIDE} links each")
+    print(f"plain dataclasses:          {before / 1024 / 1024:7.1f} MiB")
+    print(f"slotted, interned strings:  {after / 1024 / 1024:7.1f} MiB")
+    print(f"saving:                     {1 - after / before:7.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark ASCII normalisation of chat messages.
+
+Compares the old per-mapping str.replace() loop with the single-pass
+translation table in zoom_chat.py over a long list of link texts, the
+way format_links_message() calls it: once per title and link, mostly
+plain ASCII with some smart punctuation and accented letters mixed in.
+
+Usage: python benchmarks/bench_normalize.py
+"""
+
+import time
+
+from google_slidebot.zoom_chat import normalize_to_ascii
+
+ROUNDS = 200
+
+LEGACY_REPLACEMENTS = {
+    "‘": "'",
+    "’": "'",
+    "“": '"',
+    "”": '"',
+    "–": "-",
+    "—": "-",
+    "…": "...",
+    "•": "*",
+    " ": " ",
+}
+
+LINKS = 1000
+ASCII_LINK = "Quarterly results - see the appendix"
+UNICODE_LINK = "“Café résumé” — it’s naïve…"
+
+
+def legacy(text: str) -> str:
+    """The replace-loop implementation this benchmark replaces."""
+    for unicode_char, ascii_char in LEGACY_REPLACEMENTS.items():
+        text = text.replace(unicode_char, ascii_char)
+    return text
+
+
+def link_texts(unicode_share: float) -> list[str]:
+    """LINKS link texts, the given share of which contain non-ASCII."""
+    every = round(1 / unicode_share) if unicode_share else LINKS + 1
+    return [
+        f"{UNICODE_LINK if i % every == 0 else ASCII_LINK} {i}" for i in range(LINKS)
+    ]
+
+
+def measure(func, texts: list[str]) -> float:
+    """Average milliseconds to normalise all texts, over ROUNDS passes."""
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for text in texts:
+            func(text)
+    return (time.perf_counter() - start) * 1000 / ROUNDS
+
+
+def main() -> None:
+    for share in (0.0, 0.1, 1.0):
+        texts = link_texts(share)
+        for text in texts:
+            normalize_to_ascii(text)  # warm the translation table
+        print(
+            f"{LINKS} links, {share:4.0%} non-ASCII  "
+            f"legacy {measure(legacy, texts):6.3f} ms  "
+            f"table {measure(normalize_to_ascii, texts):6.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark the slide search index on a large synthetic deck.
+
+Builds a SearchIndex over SLIDES slides with LINKS links each, then times
+each keystroke of a few queries typed one character at a time, the way
+the TUI search box calls it, against scanning every slide per keystroke.
+
+Usage: python benchmarks/bench_search.py
+"""
+
+import random
+import time
+
+from google_slidebot.search import SearchIndex
+from google_slidebot.slides import Link, Slide
+
+SLIDES = 10_000
+LINKS = 5
+WORDS = [
+    "roadmap",
+    "architecture",
+    "pricing",
+    "quota",
+    "latency",
+    "rollout",
+    "migration",
+    "agenda",
+    "security",
+    "review",
+    "metrics",
+    "design",
+    "onboarding",
+    "incident",
+    "retrospective",
+]
+QUERIES = ("latency", "design doc", "example.com/42", "zzz")
+
+
+def make_deck() -> list[Slide]:
+    """Build a deck of slides with random titles and links."""
+    rng = random.Random(0)
+    return [
+        Slide(
+            number=number,
+            title=" ".join(rng.sample(WORDS, 3)).title(),
+            links=[
+                Link(
+                    f"{rng.choice(WORDS)} doc",
+                    f"https://example.com/{rng.randrange(1000)}",
+                )
+                for _ in range(LINKS)
+            ],
+        )
+        for number in range(1, SLIDES + 1)
+    ]
+
+
+def scan(deck: list[Slide], query: str) -> list[Slide]:
+    """Filter the deck without an index."""
+    terms = query.casefold().split()
+    return [
+        slide
+        for slide in deck
+        if all(
+            term in slide.title.casefold()
+            or any(
+                term in link.text.casefold() or term in link.url.casefold()
+                for link in slide.links
+            )
+            for term in terms
+        )
+    ]
+
+
+def keystrokes(search, query: str) -> tuple[int, float]:
+    """Type query a character at a time; matches and slowest key in ms."""
+    slowest = 0.0
+    for end in range(1, len(query) + 1):
+        start = time.perf_counter()
+        matches = search(query[:end])
+        slowest = max(slowest, (time.perf_counter() - start) * 1000)
+    return len(matches), slowest
+
+
+def main() -> None:
+    deck = make_deck()
+    start = time.perf_counter()
+    index = SearchIndex(deck)
+    print(f"index {SLIDES} slides: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    for query in QUERIES:
+        matches, indexed = keystrokes(index.search, query)
+        _, scanned = keystrokes(lambda typed: scan(deck, typed), query)
+        print(
+            f"{query!r:18} {matches:5} matches  slowest key: "
+            f"index {indexed:6.3f} ms  scan {scanned:7.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Benchmark the fixed cost of getting a Slides API resource.
+
+Compares building the service and its presentations() resource on every
+call (the old behaviour) with the process-wide cache in slides.py.
+
+Usage: python benchmarks/bench_service.py
+"""
+
+import time
+from unittest.mock import patch
+
+from google.oauth2.credentials import Credentials
+from googleapiclient.discovery import build
+
+from google_slidebot import slides
+
+ROUNDS = 20
+
+
+def uncached() -> None:
+    """Build the service and resource from scratch, as before caching."""
+    build("slides", "v1", credentials=Credentials(token="x")).presentations()
+
+
+def cached() -> None:
+    """Fetch the resource through the process-wide cache."""
+    slides.get_presentations_resource()
+
+
+def measure(func) -> float:
+    """Average milliseconds per call over ROUNDS calls."""
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        func()
+    return (time.perf_counter() - start) * 1000 / ROUNDS
+
+
+def main() -> None:
+    with patch.object(slides, "get_credentials", return_value=Credentials(token="x")):
+        start = time.perf_counter()
+        cached()
+        first = (time.perf_counter() - start) * 1000
+        print(f"uncached, per call:      {measure(uncached):7.2f} ms")
+        print(f"cached, first call:      {first:7.2f} ms")
+        print(f"cached, subsequent call: {measure(cached):7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
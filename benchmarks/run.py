@@ -0,0 +1,186 @@
+"""Run the benchmark suite and compare it against a stored baseline.
+
+Each case times one hot path on decks from synthetic.py: extracting
+slides from the API response, formatting chat messages, ASCII
+normalisation of Unicode-heavy text, building the search index, and
+mounting the TUI's slide list. A case's time
+is the median of repeated runs; on a shared machine it varies far less
+from run to run than the fastest time does.
+
+Baselines are only meaningful on the machine that recorded them; record
+one with --save before comparing. --compare exits with status 1 if any
+case is more than --threshold slower than its baseline (and at least
+MIN_SLOWDOWN_MS slower, so sub-millisecond jitter doesn't fail the run).
+
+Usage:
+    python benchmarks/run.py [--only NAME ...]
+    python benchmarks/run.py --save benchmarks/baseline.json
+    python benchmarks/run.py --compare benchmarks/baseline.json
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+
+from synthetic import make_presentation
+
+from google_slidebot.search import SearchIndex
+from google_slidebot.slides import extract_slides_from_presentation
+from google_slidebot.zoom_chat import format_links_message, normalize_to_ascii
+
+ROUNDS = 5
+MIN_SECONDS = 2.0
+DEFAULT_THRESHOLD = 0.25
+MIN_SLOWDOWN_MS = 1.0
+
+
+def _extract(slides: int, **options) -> Callable[[], object]:
+    presentation = make_presentation(slides, **options)
+    return lambda: extract_slides_from_presentation(presentation)
+
+
+def _format(slides: int, **options) -> Callable[[], object]:
+    deck = extract_slides_from_presentation(make_presentation(slides, **options))
+    return lambda: [format_links_message(slide) for slide in deck]
+
+
+def _normalize(slides: int, **options) -> Callable[[], object]:
+    deck = extract_slides_from_presentation(make_presentation(slides, **options))
+    texts = [slide.title for slide in deck]
+    texts += [link.text for slide in deck for link in slide.links]
+    return lambda: [normalize_to_ascii(text) for text in texts]
+
+
+def _search_index(slides: int, **options) -> Callable[[], object]:
+    deck = extract_slides_from_presentation(make_presentation(slides, **options))
+    return lambda: SearchIndex(deck)
+
+
+def _mount(slides: int, **options) -> Callable[[], object]:
+    from google_slidebot.tui import SlidebotApp
+
+    deck = extract_slides_from_presentation(make_presentation(slides, **options))
+
+    # Indexing runs in background threads and is timed by its own case;
+    # left running it would share the GIL with the mount being timed
+    class MountApp(SlidebotApp):
+        def _index_slides(self) -> None:
+            pass
+
+    async def mount():
+        async with MountApp(slides=deck, zoom_chat=None).run_test() as pilot:
+            await pilot.pause()
+
+    return lambda: asyncio.run(mount())
+
+
+# name -> (setup, arguments); setup builds the deck and returns the timed call
+CASES = {
+    "extract-1k": (_extract, {"slides": 1_000}),
+    "extract-10k": (_extract, {"slides": 10_000}),
+    "extract-nested": (_extract, {"slides": 100, "elements": 256, "depth": 8}),
+    "extract-link-heavy": (_extract, {"slides": 1_000, "links": 50}),
+    "format-10k": (_format, {"slides": 10_000}),
+    "normalize-ascii": (_normalize, {"slides": 2_000, "unicode": 0.0}),
+    "normalize-unicode": (_normalize, {"slides": 2_000, "unicode": 0.3}),
+    "search-index-1k": (_search_index, {"slides": 1_000}),
+    "tui-mount-10k": (_mount, {"slides": 10_000}),
+}
+
+
+def measure(name: str) -> float:
+    """Median time of a case, in milliseconds.
+
+    Runs it at least ROUNDS times, and for at least MIN_SECONDS, with the
+    garbage collector paused, as timeit does, so collections triggered by
+    earlier garbage aren't timed.
+    """
+    setup, options = CASES[name]
+    run = setup(**options)
+    times = []
+    deadline = time.perf_counter() + MIN_SECONDS
+    while len(times) < ROUNDS or time.perf_counter() < deadline:
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run()
+            times.append((time.perf_counter() - start) * 1000)
+        finally:
+            gc.enable()
+    return round(statistics.median(times), 2)
+
+
+def machine() -> str:
+    return (
+        f"{platform.machine()} {platform.system()} Python {platform.python_version()}"
+    )
+
+
+def compare(results: dict[str, float], baseline: dict, threshold: float) -> list[str]:
+    """Print results against the baseline; returns the cases that regressed."""
+    if baseline.get("machine") != machine():
+        print(
+            f"warning: baseline was recorded on {baseline.get('machine')}, "
+            f"not {machine()}; record a new one with --save"
+        )
+    regressed = []
+    for name, ms in results.items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:20} {ms:9.1f} ms   (no baseline)")
+            continue
+        change = ms / before - 1
+        slower = change > threshold and ms - before >= MIN_SLOWDOWN_MS
+        flag = "  SLOWER" if slower else ""
+        print(
+            f"{name:20} {ms:9.1f} ms   baseline {before:9.1f} ms  {change:+6.0%}{flag}"
+        )
+        if slower:
+            regressed.append(name)
+    return regressed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", action="append", choices=CASES, metavar="NAME")
+    parser.add_argument("--save", metavar="FILE", help="record results as a baseline")
+    parser.add_argument("--compare", metavar="FILE", help="fail on slowdowns")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed slowdown as a fraction (default: %(default)s)",
+    )
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.only or CASES:
+        results[name] = measure(name)
+        if not args.compare:
+            print(f"{name:20} {results[name]:9.1f} ms")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"machine": machine(), "results": results}, f, indent=2)
+            f.write("\n")
+        print(f"saved baseline to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressed = compare(results, baseline, args.threshold)
+        if regressed:
+            print(f"{len(regressed)} case(s) more than {args.threshold:.0%} slower")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
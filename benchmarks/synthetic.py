@@ -0,0 +1,174 @@
+"""Generate synthetic Slides API responses for benchmarks.
+
+make_presentation() builds a presentations.get() response shaped like the
+one fetch_presentation() requests: slides with a title shape, body shapes
+nested in element groups, an optional table, and speaker notes, with
+linked text runs spread across them. Text is drawn from a fixed
+vocabulary with a configurable share of non-ASCII characters, so decks
+are reproducible for a given seed.
+
+Usage: python benchmarks/synthetic.py [SLIDES] > deck.json
+"""
+
+import json
+import random
+import sys
+
+WORDS = [
+    "roadmap",
+    "architecture",
+    "pricing",
+    "quota",
+    "latency",
+    "rollout",
+    "migration",
+    "agenda",
+    "security",
+    "review",
+    "metrics",
+    "design",
+    "onboarding",
+    "incident",
+    "retrospective",
+    "appendix",
+    "results",
+    "summary",
+    "questions",
+]
+
+# Characters mixed into text at the requested Unicode density: smart
+# punctuation from pasted text, accented Latin, and characters with no
+# ASCII form at all
+UNICODE_CHARS = "’“”–—…•éèüöñçåøßłžœ日本語✓→€"
+
+# Links that recur across slides and decks, like a footer's repo and
+# feedback links, and their labels
+SHARED_LINKS = [(f"link {i}", f"https://example.com/shared/{i}") for i in range(20)]
+
+
+def _text(rng: random.Random, words: int, unicode: float) -> str:
+    """Some words of text with roughly unicode of its characters non-ASCII."""
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    if not unicode:
+        return text
+    return "".join(
+        rng.choice(UNICODE_CHARS) if char != " " and rng.random() < unicode else char
+        for char in text
+    )
+
+
+def _text_body(rng: random.Random, runs: list[tuple[str, str | None]]) -> dict:
+    """A shape's text: one text run per (content, url) pair."""
+    elements = []
+    for content, url in runs:
+        run = {"content": content}
+        if url:
+            run["style"] = {"link": {"url": url}}
+        elements.append({"textRun": run})
+    return {"textElements": elements}
+
+
+def _shape(rng, content: str, url: str | None = None) -> dict:
+    return {"shape": {"text": _text_body(rng, [(content, url)])}}
+
+
+def make_slide(
+    rng: random.Random,
+    number: int,
+    elements: int = 10,
+    depth: int = 2,
+    links: int = 5,
+    unicode: float = 0.02,
+    table: bool = True,
+    shared: float = 0.0,
+) -> dict:
+    """Build one slide.
+
+    Args:
+        rng: Random source
+        number: 1-based slide number, used in object IDs and URLs
+        elements: Body shapes on the slide, besides the title
+        depth: How deep body shapes are nested in element groups
+        links: Linked text runs on the slide, spread over its shapes,
+            table cells and notes
+        unicode: Share of text characters that are non-ASCII
+        table: Include a small table, which receives some of the links
+        shared: Share of links that are one of SHARED_LINKS rather than
+            unique to the slide
+
+    Returns:
+        The slide as the API returns it
+    """
+    url_slots = ["body"] * elements + (["table"] * 4 if table else []) + ["notes"]
+    linked = {}
+    for i in range(links):
+        slot = rng.randrange(len(url_slots))
+        if shared and rng.random() < shared:
+            link = rng.choice(SHARED_LINKS)
+        else:
+            link = (None, f"https://example.com/{number}/{i}?ref={rng.choice(WORDS)}")
+        linked.setdefault(slot, []).append(link)
+
+    def runs(slot: int, words: int) -> list[tuple[str, str | None]]:
+        return [(_text(rng, words, unicode), None)] + [
+            (label or _text(rng, 2, unicode), url)
+            for label, url in linked.get(slot, [])
+        ]
+
+    body = [
+        {"shape": {"text": _text_body(rng, runs(slot, 8))}} for slot in range(elements)
+    ]
+    # Wrap the body shapes in groups, halving them at each level
+    for _ in range(depth):
+        if len(body) < 2:
+            break
+        half = len(body) // 2
+        body = [{"elementGroup": {"children": body[:half]}}] + body[half:]
+
+    page_elements = [_shape(rng, _text(rng, 4, unicode).title())] + body
+    if table:
+        cells = [{"text": _text_body(rng, runs(elements + i, 3))} for i in range(4)]
+        page_elements.append(
+            {
+                "table": {
+                    "tableRows": [
+                        {"tableCells": cells[:2]},
+                        {"tableCells": cells[2:]},
+                    ]
+                }
+            }
+        )
+
+    notes = {"shape": {"text": _text_body(rng, runs(len(url_slots) - 1, 20))}}
+    return {
+        "objectId": f"s{number}",
+        "pageElements": page_elements,
+        "slideProperties": {"notesPage": {"pageElements": [notes]}},
+    }
+
+
+def make_presentation(slides: int = 100, seed: int = 0, **slide_options) -> dict:
+    """Build a presentations.get() response.
+
+    Args:
+        slides: Number of slides, up to tens of thousands
+        seed: Random seed; the same arguments always give the same deck
+        **slide_options: Passed to make_slide()
+
+    Returns:
+        The presentation as the API returns it
+    """
+    rng = random.Random(seed)
+    return {
+        "presentationId": f"synthetic-{slides}-{seed}",
+        "revisionId": f"rev-{seed}",
+        "slides": [
+            make_slide(rng, number, **slide_options) for number in range(1, slides + 1)
+        ],
+    }
+
+
+if __name__ == "__main__":
+    json.dump(
+        make_presentation(int(sys.argv[1]) if len(sys.argv) > 1 else 100), sys.stdout
+    )
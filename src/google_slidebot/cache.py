@@ -0,0 +1,112 @@
+"""On-disk cache of fetched presentations and link check results."""
+
+import contextlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from google_slidebot.config import CACHE_DIR
+
+
+def _cache_path(presentation_id: str) -> Path:
+    """Path of the cache file for a presentation."""
+    return CACHE_DIR / f"{presentation_id}.json"
+
+
+def _link_cache_path() -> Path:
+    """Path of the cache file for link check results."""
+    return CACHE_DIR / "links.json"
+
+
+def _write_json(path: Path, data) -> None:
+    """Write JSON to a temporary file first so a crash never leaves it torn.
+
+    Each write gets its own temporary file, so concurrent writers (threads,
+    or the daemon and a client) can't replace or remove each other's.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f"{path.stem}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+def load_cached_presentation(presentation_id: str, fields: str = "*") -> dict | None:
+    """Load a cached presentation response.
+
+    Args:
+        presentation_id: Google Slides presentation ID
+        fields: Field mask the response must have been fetched with
+
+    Returns:
+        Cached presentations().get() response, or None if not cached, fetched
+        with a different field mask, or the cache file is unreadable
+    """
+    try:
+        with open(_cache_path(presentation_id), encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(entry, dict) or entry.get("fields") != fields:
+        return None
+
+    presentation = entry.get("presentation")
+    if not isinstance(presentation, dict) or not presentation.get("revisionId"):
+        return None
+    return presentation
+
+
+def store_cached_presentation(
+    presentation_id: str, presentation: dict, fields: str = "*"
+) -> None:
+    """Store a presentation response in the cache.
+
+    Responses without a revisionId can't be validated later, so they are
+    not cached.
+
+    Args:
+        presentation_id: Google Slides presentation ID
+        presentation: Response from presentations().get()
+        fields: Field mask the response was fetched with
+    """
+    if not presentation.get("revisionId"):
+        return
+
+    _write_json(
+        _cache_path(presentation_id), {"fields": fields, "presentation": presentation}
+    )
+
+
+def load_link_statuses() -> dict[str, dict]:
+    """Load cached link check results.
+
+    Returns:
+        Results keyed by URL, or {} if none are cached or the cache file
+        is unreadable
+    """
+    try:
+        with open(_link_cache_path(), encoding="utf-8") as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(entries, dict):
+        return {}
+    return {url: entry for url, entry in entries.items() if isinstance(entry, dict)}
+
+
+def store_link_statuses(entries: dict[str, dict]) -> None:
+    """Replace the cached link check results.
+
+    Args:
+        entries: Results keyed by URL
+    """
+    _write_json(_link_cache_path(), entries)
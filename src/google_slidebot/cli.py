@@ -1,11 +1,24 @@
-"""Command-line interface for google-slidebot."""
+"""Command-line interface for google-slidebot.
+
+Only click and the lightweight parts of google_slidebot are imported at
+module level. Textual and Playwright are imported once the command
+actually needs them, and slides.py defers the Google client libraries, so
+--help, --version and argument errors return quickly.
+"""
+
+import functools
 
-import asyncio
 import click
 
-from google_slidebot.slides import extract_presentation_id, fetch_presentation
-from google_slidebot.zoom_chat import ZoomChat
-from google_slidebot.tui import SlidebotApp
+from google_slidebot import tracing
+from google_slidebot.config import WATCH_MIN_INTERVAL
+from google_slidebot.slides import (
+    PageLoader,
+    PresentationWatcher,
+    extract_presentation_id,
+    fetch_presentation,
+    flush_credentials,
+)
 
 
 def print_chrome_instructions():
@@ -26,52 +39,306 @@ Then:
 1. Navigate to your Zoom meeting (https://app.zoom.us/wc/join/...)
 2. Join the meeting
 3. Open the chat panel (optional - will be opened automatically)
-
-Waiting for Zoom connection...
 """)
 
 
 @click.command()
 @click.argument("presentation_url")
+@click.option(
+    "--offline",
+    is_flag=True,
+    help="Use the cached copy of the presentation without contacting Google.",
+)
+@click.option(
+    "--lazy",
+    is_flag=True,
+    help="Fetch only slide titles at startup and load links as slides are opened.",
+)
+@click.option(
+    "--coalesce",
+    is_flag=True,
+    help="Combine links queued while a send is in progress into one message.",
+)
+@click.option(
+    "--watch",
+    type=click.FloatRange(min=WATCH_MIN_INTERVAL),
+    metavar="SECONDS",
+    help="Check for edits to the deck every SECONDS and update the list.",
+)
+@click.option(
+    "--follow",
+    is_flag=True,
+    help="Select the slide being presented in the Google Slides tab in Chrome.",
+)
+@click.option(
+    "--auto-send",
+    is_flag=True,
+    help="With --follow, send each slide's links the first time it is presented.",
+)
+@click.option(
+    "--check-links",
+    is_flag=True,
+    help="Check every link in the background and mark broken ones.",
+)
+@click.option(
+    "--no-daemon",
+    is_flag=True,
+    help="Don't use a running google-slidebot-daemon.",
+)
+@click.option(
+    "--trace",
+    type=click.Path(dir_okay=False, writable=True),
+    metavar="FILE",
+    help="Write a timeline of startup and send phases to FILE (Chrome trace JSON).",
+)
+@click.option(
+    "--profile",
+    type=click.Path(file_okay=False, writable=True),
+    metavar="DIR",
+    help="Save cProfile stats and tracemalloc snapshots for the session to DIR.",
+)
 @click.version_option()
-def cli(presentation_url: str):
+def cli(
+    presentation_url: str,
+    offline: bool,
+    lazy: bool,
+    coalesce: bool,
+    watch: float | None,
+    follow: bool,
+    auto_send: bool,
+    check_links: bool,
+    no_daemon: bool,
+    trace: str | None,
+    profile: str | None,
+):
     """Share Google Slides links to Zoom chat.
 
     PRESENTATION_URL: Google Slides URL or presentation ID
     """
+    if trace:
+        tracing.enable()
+    if profile:
+        tracing.start_profiling(profile)
+    try:
+        with tracing.span("cli.session"):
+            _run(
+                presentation_url,
+                offline=offline,
+                lazy=lazy,
+                coalesce=coalesce,
+                watch=watch,
+                follow=follow,
+                auto_send=auto_send,
+                check_links=check_links,
+                use_daemon=not no_daemon,
+            )
+    finally:
+        flush_credentials()
+        if profile:
+            tracing.stop_profiling()
+        if trace:
+            tracing.write_timeline(trace)
+            tracing.disable()
+
+
+def _run(
+    presentation_url: str,
+    offline: bool,
+    lazy: bool,
+    coalesce: bool,
+    watch: float | None,
+    follow: bool,
+    auto_send: bool,
+    check_links: bool,
+    use_daemon: bool,
+):
+    """Body of cli(), inside its tracing span."""
     # Validate presentation URL
     try:
         presentation_id = extract_presentation_id(presentation_url)
     except ValueError as e:
         raise click.ClickException(str(e))
 
-    click.echo(f"Fetching presentation {presentation_id}...")
+    if lazy and offline:
+        raise click.ClickException("--lazy needs network access; drop --offline")
+    if watch and offline:
+        raise click.ClickException("--watch needs network access; drop --offline")
+    if watch and lazy:
+        raise click.ClickException("--watch reloads whole decks; drop --lazy")
+    if auto_send and not follow:
+        raise click.ClickException("--auto-send only works with --follow")
+
+    with tracing.span("cli.import_ui"):
+        from google_slidebot.tui import SlidebotApp
+        from google_slidebot.zoom_chat import ZoomChat
+
+    daemon = None
+    if use_daemon:
+        from google_slidebot.daemon import DaemonClient
+
+        with tracing.span("cli.find_daemon"):
+            daemon = DaemonClient()
+            if not daemon.available():
+                daemon = None
+
+    page_loader = None
+    if lazy:
+        page_loader = PageLoader(presentation_id)
+        load_slides = page_loader.fetch_index
+    elif daemon:
+        load_slides = functools.partial(
+            daemon.fetch_presentation, presentation_id, offline=offline
+        )
+    else:
+        load_slides = functools.partial(
+            fetch_presentation, presentation_id, offline=offline
+        )
+
+    watcher = PresentationWatcher(presentation_id, watch) if watch else None
+    link_checker = None
+    if check_links:
+        from google_slidebot.linkcheck import LinkChecker
+
+        link_checker = LinkChecker()
 
-    # Fetch slides
+    # The fetch, the Zoom connection and the TUI all start together on the
+    # TUI's event loop; see SlidebotApp.on_mount.
+    if daemon and not follow:
+        from google_slidebot.daemon import RemoteZoomChat
+
+        # Send through the daemon's connection, which --follow can't use
+        zoom_chat = RemoteZoomChat(daemon)
+        if coalesce:
+            click.echo(
+                "Warning: --coalesce is ignored while the daemon is running; "
+                "start the daemon with --coalesce, or pass --no-daemon",
+                err=True,
+            )
+    else:
+        zoom_chat = ZoomChat(coalesce=coalesce)
+    app = SlidebotApp(
+        slides=[],
+        zoom_chat=zoom_chat,
+        page_loader=page_loader,
+        load_slides=load_slides,
+        watcher=watcher,
+        follow_presentation_id=presentation_id if follow else None,
+        auto_send=auto_send,
+        link_checker=link_checker,
+    )
+    with tracing.span("cli.run_app"):
+        error = app.run()
+
+    if error:
+        raise click.ClickException(error)
+    if not zoom_chat.connected:
+        print_chrome_instructions()
+
+
+@click.command()
+@click.argument("presentation_url")
+@click.option(
+    "--offline",
+    is_flag=True,
+    help="Use the cached copy of the presentation without contacting Google.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Check every link again, ignoring recent results.",
+)
+@click.version_option()
+def check_links_cli(presentation_url: str, offline: bool, no_cache: bool):
+    """Check every link in a presentation before presenting it.
+
+    Exits with status 1 if any link is broken.
+
+    PRESENTATION_URL: Google Slides URL or presentation ID
+    """
     try:
-        slides = fetch_presentation(presentation_id)
+        presentation_id = extract_presentation_id(presentation_url)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+    from google_slidebot.linkcheck import LinkChecker
+
+    try:
+        slides = fetch_presentation(presentation_id, offline=offline)
     except FileNotFoundError as e:
         raise click.ClickException(str(e))
-    except Exception as e:
+    except Exception as e:  # noqa: BLE001 - shown to the user
         raise click.ClickException(f"Failed to fetch presentation: {e}")
 
-    click.echo(
-        f"Found {len(slides)} slides with {sum(len(s.links) for s in slides)} total links"
-    )
+    checker = LinkChecker(use_cache=not no_cache)
+    try:
+        results = checker.check(link.url for slide in slides for link in slide.links)
+    finally:
+        checker.close()
+    if checker.cache_error:
+        click.echo(
+            f"Warning: couldn't cache link results: {checker.cache_error}", err=True
+        )
+
+    broken = 0
+    for slide in slides:
+        for link in slide.links:
+            status = results.get(link.url)
+            if status and not status.ok:
+                broken += 1
+                click.echo(
+                    f"Slide {slide.number}: {link.text} <{link.url}> "
+                    f"({status.describe()})"
+                )
+
+    click.echo(f"Checked {len(results)} URLs: {broken} broken links")
+    if broken:
+        raise SystemExit(1)
 
-    # Connect to Zoom
-    print_chrome_instructions()
 
-    zoom_chat = ZoomChat()
+@click.command()
+@click.argument("presentation_urls", nargs=-1)
+@click.option(
+    "--coalesce",
+    is_flag=True,
+    help="Combine links queued while a send is in progress into one message.",
+)
+@click.option("--stop", is_flag=True, help="Stop the running daemon.")
+@click.version_option()
+def daemon_cli(presentation_urls: tuple[str, ...], coalesce: bool, stop: bool):
+    """Keep credentials, decks and the Zoom connection warm between runs.
+
+    While it runs, google-slidebot fetches decks and sends to Zoom through
+    it, so starting a talk or switching decks doesn't sign in, refetch or
+    reconnect to Chrome again.
+
+    PRESENTATION_URLS: Decks to fetch straight away
+    """
+    import asyncio
+
+    from google_slidebot.daemon import DaemonClient, DaemonError, SlidebotDaemon
+
+    if stop:
+        try:
+            DaemonClient().shutdown()
+        except DaemonError as e:
+            raise click.ClickException(str(e))
+        click.echo("Daemon stopped")
+        return
+
     try:
-        asyncio.run(zoom_chat.connect())
-        click.echo("Connected to Zoom!")
-    except RuntimeError as e:
+        presentation_ids = [extract_presentation_id(url) for url in presentation_urls]
+    except ValueError as e:
         raise click.ClickException(str(e))
 
-    # Run TUI
-    app = SlidebotApp(slides=slides, zoom_chat=zoom_chat)
-    app.run()
+    daemon = SlidebotDaemon(coalesce=coalesce, log=click.echo)
+    try:
+        asyncio.run(daemon.serve(presentation_ids))
+    except DaemonError as e:
+        raise click.ClickException(str(e))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        flush_credentials()
 
 
 if __name__ == "__main__":
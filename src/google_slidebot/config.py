@@ -1,10 +1,12 @@
 """Configuration constants for google-slidebot."""
 
+import os
 from pathlib import Path
 
 # Paths
 CONFIG_DIR = Path.home() / ".config" / "google-slidebot"
 CREDENTIALS_FILE = CONFIG_DIR / "credentials.json"
+CACHE_DIR = CONFIG_DIR / "cache"
 
 # Keyring
 KEYRING_SERVICE = "google-slidebot"
@@ -12,6 +14,30 @@ KEYRING_TOKEN_KEY = "oauth-token"
 
 # Google API
 GOOGLE_SCOPES = ["https://www.googleapis.com/auth/presentations.readonly"]
+API_TIMEOUT = 30.0  # seconds for each connect and response
+API_RETRIES = 3  # retries of rate-limited, 5xx and dropped requests, with backoff
+# Root URL of the Slides API, to point the client at a local fake server
+API_ENDPOINT = os.environ.get("GOOGLE_SLIDEBOT_API_ENDPOINT") or None
+
+# Live deck sync (--watch)
+WATCH_MIN_INTERVAL = 5.0  # seconds; keeps polling well inside API read quotas
+
+# Link health checks
+LINK_CHECK_TIMEOUT = 10.0  # seconds per request
+LINK_CHECK_WORKERS = 16  # links checked at once across all hosts
+LINK_CHECK_PER_HOST = 4  # connections (and requests in flight) per host
+LINK_CHECK_MAX_REDIRECTS = 5
+LINK_CHECK_TTL = 24 * 60 * 60.0  # seconds a cached result is trusted
+
+# Background daemon
+DAEMON_SOCKET = CONFIG_DIR / "daemon.sock"
 
 # Chrome CDP
 CDP_URL = "http://localhost:9222"
+ZOOM_PAGE_WAIT = 600.0  # seconds to wait for a Zoom tab to be opened
+
+# Zoom chat sending
+CHAT_SEND_RATE = 1.0  # sustained messages per second
+CHAT_SEND_BURST = 3  # messages that may be sent back-to-back
+CHAT_QUEUE_SIZE = 20  # queued messages before senders wait
+CHAT_MAX_MESSAGE_LENGTH = 4000  # upper bound for a coalesced message
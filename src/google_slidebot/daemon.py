@@ -0,0 +1,393 @@
+"""Background daemon that keeps credentials, decks and Zoom warm.
+
+A google-slidebot run normally pays for imports, authentication, the
+deck fetch and the CDP connection every time it starts. The daemon
+(google-slidebot-daemon) pays once and then serves any number of runs:
+
+- Credentials stay loaded, and CredentialManager refreshes them ahead of
+  expiry, so no run waits on the keyring or a token refresh.
+- Fetched decks are kept in memory. Asking for one again only costs a
+  revisionId check, or nothing offline.
+- One ZoomChat stays connected to the meeting tab, with its send queue
+  and rate limit shared by every client.
+
+Clients talk to it over a Unix socket (DAEMON_SOCKET) that only its user
+can open. Each request is one JSON object on a line:
+
+    {"method": "fetch_presentation", "params": {"presentation_id": "..."}}
+
+and is answered by one line, either {"result": ...} or
+{"error": {"type": "...", "message": "..."}}. A connection may carry
+several requests in turn.
+
+When the daemon is running, the CLI uses DaemonClient to fetch slides
+and RemoteZoomChat in place of its own ZoomChat.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import threading
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from google_slidebot.config import DAEMON_SOCKET
+from google_slidebot.slides import (
+    Link,
+    Slide,
+    _fetch_full_presentation,
+    extract_slides_from_presentation,
+    fetch_presentation_data,
+    fetch_revision_id,
+    get_service,
+)
+from google_slidebot.zoom_chat import ChatReadiness, ZoomChat
+
+# Seconds a client waits for the daemon to answer a ping
+PING_TIMEOUT = 1.0
+
+# Longest response line a client reads; a 10,000 slide deck is a few MB
+MAX_RESPONSE_BYTES = 256 * 1024 * 1024
+
+# Exceptions passed back to clients as themselves; anything else becomes
+# a DaemonError with the original message
+_CLIENT_ERRORS = {"FileNotFoundError": FileNotFoundError}
+
+
+class DaemonError(RuntimeError):
+    """The daemon failed a request or couldn't be reached."""
+
+
+def slide_to_dict(slide: Slide) -> dict:
+    """Convert a Slide to JSON-serialisable form."""
+    # Spelled out rather than asdict(), which deep-copies every value and
+    # takes several times as long on a large deck
+    return {
+        "number": slide.number,
+        "title": slide.title,
+        "links": [
+            {"text": link.text, "url": link.url, "source": link.source}
+            for link in slide.links
+        ],
+        "object_id": slide.object_id,
+        "loaded": slide.loaded,
+    }
+
+
+def slide_from_dict(data: dict) -> Slide:
+    """Rebuild a Slide from slide_to_dict() output."""
+    fields = dict(data)
+    fields["links"] = [Link(**link) for link in fields.get("links", [])]
+    return Slide(**fields)
+
+
+@dataclass
+class _Deck:
+    """A deck held in memory, and the revision it was fetched at."""
+
+    revision_id: str | None
+    # Kept as Slides, which take far less memory than their dict form
+    slides: list[Slide]
+
+
+class SlidebotDaemon:
+    """Serves decks and a shared Zoom connection over a Unix socket."""
+
+    def __init__(
+        self,
+        socket_path: Path | None = None,
+        coalesce: bool = False,
+        log: Callable[[str], None] | None = None,
+    ):
+        """Create a daemon; nothing happens until serve().
+
+        Args:
+            socket_path: Unix socket to listen on; DAEMON_SOCKET by default
+            coalesce: Combine queued Zoom messages, as ZoomChat(coalesce=)
+            log: Called with a line of text for each notable event
+        """
+        self.socket_path = Path(socket_path or DAEMON_SOCKET)
+        self.coalesce = coalesce
+        self.log = log or (lambda message: None)
+        self.zoom_chat: ZoomChat | None = None
+        self._decks: dict[str, _Deck] = {}
+        # The Google API client isn't thread-safe; fetches take turns
+        self._fetch_lock = threading.Lock()
+        self._zoom_lock: asyncio.Lock | None = None
+        self._stopped: asyncio.Event | None = None
+        self._handlers = {
+            "ping": self._ping,
+            "fetch_presentation": self._fetch_presentation,
+            "connect_zoom": self._connect_zoom,
+            "zoom_status": self._zoom_status,
+            "queue_message": self._queue_message,
+            "shutdown": self._shutdown,
+        }
+
+    async def serve(self, warm: list[str] = ()) -> None:
+        """Listen until a shutdown request arrives.
+
+        Args:
+            warm: Presentation IDs to fetch straight away
+
+        Raises:
+            DaemonError: If another daemon is already listening
+        """
+        if await asyncio.to_thread(DaemonClient(self.socket_path).available):
+            raise DaemonError(f"A daemon is already listening on {self.socket_path}")
+        # A socket file left by a daemon that died is in the way
+        self.socket_path.unlink(missing_ok=True)
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+
+        self.zoom_chat = ZoomChat(coalesce=self.coalesce)
+        self._zoom_lock = asyncio.Lock()
+        self._stopped = asyncio.Event()
+
+        old_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(
+                self._handle, path=str(self.socket_path)
+            )
+        finally:
+            os.umask(old_umask)
+
+        self.log(f"Listening on {self.socket_path}")
+        warming = asyncio.create_task(self._warm(warm))
+        try:
+            async with server:
+                await self._stopped.wait()
+        finally:
+            warming.cancel()
+            await self.zoom_chat.disconnect()
+            self.socket_path.unlink(missing_ok=True)
+            self.log("Stopped")
+
+    async def _warm(self, presentation_ids: list[str]) -> None:
+        """Load credentials and the given decks ahead of the first client."""
+        try:
+            await asyncio.to_thread(get_service)
+            self.log("Credentials loaded")
+        except Exception as e:  # noqa: BLE001 - retried per request
+            self.log(f"Could not load credentials yet: {e}")
+            return
+        for presentation_id in presentation_ids:
+            try:
+                await self._fetch_presentation(presentation_id=presentation_id)
+            except Exception as e:  # noqa: BLE001 - retried per request
+                self.log(f"Could not fetch {presentation_id}: {e}")
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer each request on a connection until the client hangs up."""
+        try:
+            while line := await reader.readline():
+                response = await self._dispatch(line)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+                if self._stopped.is_set():
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            # A client that disconnects or overruns the line limit
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, line: bytes) -> dict:
+        """Run one request line and build its response."""
+        try:
+            request = json.loads(line)
+            handler = self._handlers[request["method"]]
+            params = request.get("params", {})
+        except (ValueError, KeyError, TypeError):
+            return {"error": {"type": "ValueError", "message": "Bad request"}}
+        try:
+            return {"result": await handler(**params)}
+        except Exception as e:  # noqa: BLE001 - returned to the client
+            return {"error": {"type": type(e).__name__, "message": str(e)}}
+
+    async def _ping(self) -> dict:
+        return {"pid": os.getpid(), "decks": sorted(self._decks)}
+
+    async def _fetch_presentation(
+        self, presentation_id: str, offline: bool = False
+    ) -> list[dict]:
+        """Slides of a deck, from memory while its revision is current."""
+        return await asyncio.to_thread(self._load_deck, presentation_id, offline)
+
+    def _load_deck(self, presentation_id: str, offline: bool) -> list[dict]:
+        """Worker thread: get a deck, fetching it only if it changed."""
+        with self._fetch_lock:
+            deck = self._decks.get(presentation_id)
+            if deck is None:
+                presentation = fetch_presentation_data(presentation_id, offline)
+            elif offline or fetch_revision_id(presentation_id) == deck.revision_id:
+                presentation = None
+            else:
+                # Known to have changed: skip fetch_presentation_data()'s
+                # revision check against the disk cache
+                presentation = _fetch_full_presentation(presentation_id)
+            if presentation is not None:
+                deck = _Deck(
+                    presentation.get("revisionId"),
+                    extract_slides_from_presentation(presentation),
+                )
+                self._decks[presentation_id] = deck
+                self.log(f"Loaded {presentation_id}: {len(deck.slides)} slides")
+            return [slide_to_dict(slide) for slide in deck.slides]
+
+    async def _connect_zoom(self, wait: float = 0) -> dict:
+        """Connect to Zoom, or check the connection already made."""
+        async with self._zoom_lock:
+            if self.zoom_chat.connected:
+                try:
+                    readiness = await self.zoom_chat.check_readiness()
+                    return asdict(readiness)
+                except Exception:  # noqa: BLE001 - any failure means reconnect
+                    # The meeting tab went away; start over
+                    await self.zoom_chat.disconnect()
+            readiness = await self.zoom_chat.connect(wait=wait)
+            self.log(f"Zoom: {readiness.summary()}")
+            return asdict(readiness)
+
+    async def _zoom_status(self) -> dict:
+        return {
+            "connected": self.zoom_chat.connected,
+            "readiness": asdict(self.zoom_chat.readiness),
+        }
+
+    async def _queue_message(self, text: str) -> float:
+        return await self.zoom_chat.queue_message(text)
+
+    async def _shutdown(self) -> bool:
+        self._stopped.set()
+        return True
+
+
+class DaemonClient:
+    """Makes requests to a running SlidebotDaemon."""
+
+    def __init__(self, socket_path: Path | None = None):
+        self.socket_path = Path(socket_path or DAEMON_SOCKET)
+
+    @staticmethod
+    def _request(method: str, params: dict) -> bytes:
+        return json.dumps({"method": method, "params": params}).encode() + b"\n"
+
+    def _result(self, line: bytes):
+        """Unpack a response line, raising the error it reports."""
+        if not line:
+            raise DaemonError("The slidebot daemon closed the connection")
+        response = json.loads(line)
+        if "error" in response:
+            error = response["error"]
+            raise _CLIENT_ERRORS.get(error["type"], DaemonError)(error["message"])
+        return response["result"]
+
+    def call(self, method: str, timeout: float | None = None, **params):
+        """Make a request, blocking until it is answered.
+
+        Args:
+            method: Daemon method name
+            timeout: Seconds to wait for the connection and the answer
+            **params: The method's arguments
+
+        Returns:
+            The method's result
+
+        Raises:
+            DaemonError: If the daemon can't be reached or the method failed
+        """
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(timeout)
+                sock.connect(str(self.socket_path))
+                sock.sendall(self._request(method, params))
+                with sock.makefile("rb") as response:
+                    line = response.readline(MAX_RESPONSE_BYTES)
+        except OSError as e:
+            raise DaemonError(f"Cannot reach the slidebot daemon: {e}") from e
+        return self._result(line)
+
+    async def acall(self, method: str, **params):
+        """Make a request from the event loop; see call()."""
+        try:
+            reader, writer = await asyncio.open_unix_connection(
+                str(self.socket_path), limit=MAX_RESPONSE_BYTES
+            )
+        except OSError as e:
+            raise DaemonError(f"Cannot reach the slidebot daemon: {e}") from e
+        try:
+            writer.write(self._request(method, params))
+            await writer.drain()
+            line = await reader.readline()
+        except OSError as e:
+            raise DaemonError(f"Lost the slidebot daemon: {e}") from e
+        finally:
+            writer.close()
+        return self._result(line)
+
+    def available(self) -> bool:
+        """Whether a daemon is listening and answering."""
+        if not self.socket_path.exists():
+            return False
+        try:
+            self.call("ping", timeout=PING_TIMEOUT)
+        except (DaemonError, ValueError):
+            return False
+        return True
+
+    def fetch_presentation(
+        self, presentation_id: str, offline: bool = False
+    ) -> list[Slide]:
+        """Get a deck's slides, as slides.fetch_presentation() does."""
+        slides = self.call(
+            "fetch_presentation", presentation_id=presentation_id, offline=offline
+        )
+        return [slide_from_dict(slide) for slide in slides]
+
+    def shutdown(self) -> None:
+        """Ask the daemon to stop."""
+        self.call("shutdown", timeout=PING_TIMEOUT)
+
+
+class RemoteZoomChat:
+    """Stands in for ZoomChat, sending through the daemon's connection.
+
+    Provides the parts of ZoomChat the TUI uses. disconnect() only drops
+    this client's view of the connection; the daemon stays connected for
+    the next run. There is no local browser, so --follow can't use it.
+    """
+
+    browser = None
+
+    def __init__(self, client: DaemonClient):
+        self.client = client
+        self.readiness = ChatReadiness()
+        self._connected = False
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    async def connect(self, wait: float = 0) -> ChatReadiness:
+        """Have the daemon connect to Zoom, if it hasn't already.
+
+        Raises:
+            RuntimeError: If Chrome or the Zoom page can't be reached
+        """
+        report = await self.client.acall("connect_zoom", wait=wait)
+        self.readiness = ChatReadiness(**report)
+        self._connected = True
+        return self.readiness
+
+    async def queue_message(self, text: str) -> float:
+        """Send through the daemon's queue; milliseconds the send took."""
+        return await self.client.acall("queue_message", text=text)
+
+    async def disconnect(self) -> None:
+        self._connected = False
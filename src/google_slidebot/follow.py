@@ -0,0 +1,133 @@
+"""Follow the presenter: track the slide shown in the Google Slides tab.
+
+Google Slides keeps the current slide in the tab's URL (for example
+".../edit#slide=id.g123" or ".../present?slide=id.g123") and updates it
+as the presenter moves through the deck. SlideFollower listens for those
+navigations on the browser ZoomChat already has open over CDP, so a slide
+change is seen as soon as Chrome reports it, with no polling.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qs, urlsplit
+
+from google_slidebot.slides import Slide
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Page
+
+
+def parse_slide_ref(url: str, presentation_id: str) -> str | None:
+    """Get the slide a Google Slides URL points at.
+
+    Args:
+        url: URL of a browser tab
+        presentation_id: Only URLs of this presentation are considered
+
+    Returns:
+        The slide reference from the URL, like "id.g123", or None if the
+        URL isn't this presentation or names no slide
+    """
+    parts = urlsplit(url)
+    if parts.hostname != "docs.google.com":
+        return None
+    if f"/presentation/d/{presentation_id}/" not in f"{parts.path}/":
+        return None
+    for component in (parts.fragment, parts.query):
+        refs = parse_qs(component).get("slide")
+        if refs:
+            return refs[0]
+    return None
+
+
+def find_slide(slides: list[Slide], ref: str) -> Slide | None:
+    """Find the slide a reference from parse_slide_ref() names.
+
+    Args:
+        slides: Slides of the presentation
+        ref: "id.<objectId>", or a 1-based slide number
+
+    Returns:
+        The matching slide, or None
+    """
+    if ref.startswith("id."):
+        object_id = ref[3:]
+        return next((slide for slide in slides if slide.object_id == object_id), None)
+    if ref.isdigit() and 1 <= int(ref) <= len(slides):
+        return slides[int(ref) - 1]
+    return None
+
+
+class SlideFollower:
+    """Reports the presented slide whenever a deck tab changes slide.
+
+    Listens for navigations on every tab of the browser, including tabs
+    and presentation windows opened later, and calls on_slide with the
+    new slide reference each time it changes.
+    """
+
+    def __init__(
+        self,
+        browser: Browser,
+        presentation_id: str,
+        on_slide: Callable[[str], None],
+    ):
+        """Create a follower; nothing is watched until start().
+
+        Args:
+            browser: Browser connected over CDP, e.g. ZoomChat.browser
+            presentation_id: Presentation whose tabs to follow
+            on_slide: Called on the event loop with each new slide reference
+        """
+        self.browser = browser
+        self.presentation_id = presentation_id
+        self.on_slide = on_slide
+        self.current: str | None = None
+        self._listeners: list[tuple[object, str, Callable]] = []
+
+    def start(self) -> bool:
+        """Start listening for slide changes.
+
+        A deck tab that is already open reports its slide straight away.
+
+        Returns:
+            Whether a tab is showing a slide of the presentation now
+        """
+        found = False
+        for context in self.browser.contexts:
+            self._listen(context, "page", self._watch_page)
+            for page in context.pages:
+                found = self._watch_page(page) or found
+        return found
+
+    def stop(self) -> None:
+        """Stop listening."""
+        for emitter, event, handler in self._listeners:
+            emitter.remove_listener(event, handler)
+        self._listeners.clear()
+
+    def _listen(self, emitter, event: str, handler: Callable) -> None:
+        emitter.on(event, handler)
+        self._listeners.append((emitter, event, handler))
+
+    def _watch_page(self, page: Page) -> bool:
+        """Follow navigations in a tab; returns whether it shows a slide."""
+
+        def on_navigated(frame):
+            if frame == page.main_frame:
+                self._update(frame.url)
+
+        self._listen(page, "framenavigated", on_navigated)
+        return self._update(page.url)
+
+    def _update(self, url: str) -> bool:
+        """Report the slide in url if it changed; whether it names one."""
+        ref = parse_slide_ref(url, self.presentation_id)
+        if ref is None:
+            return False
+        if ref != self.current:
+            self.current = ref
+            self.on_slide(ref)
+        return True
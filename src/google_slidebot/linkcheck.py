@@ -0,0 +1,313 @@
+"""Check that the links in a deck still work.
+
+URLs are checked concurrently on a thread pool, scheduled per host: each
+host's URLs are split into at most per_host lanes, checked one after
+another over a keep-alive connection, so a deck with a hundred links to
+one site doesn't hammer it. Workers run lanes rather than single URLs, so
+none of them sits waiting for a busy host while other hosts' links are
+still unchecked. Results are cached on disk for LINK_CHECK_TTL.
+"""
+
+from __future__ import annotations
+
+import http.client
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from urllib.parse import quote, urljoin, urlsplit
+
+from google_slidebot import __version__
+from google_slidebot.cache import load_link_statuses, store_link_statuses
+from google_slidebot.config import (
+    LINK_CHECK_MAX_REDIRECTS,
+    LINK_CHECK_PER_HOST,
+    LINK_CHECK_TIMEOUT,
+    LINK_CHECK_TTL,
+    LINK_CHECK_WORKERS,
+)
+
+USER_AGENT = f"google-slidebot/{__version__} (link check)"
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+# A GET fallback only needs the status; bodies larger than this aren't
+# drained, and their connection is closed instead of reused
+MAX_DRAIN_BYTES = 64 * 1024
+
+# Characters left alone when quoting a URL's path and query for the wire
+_SAFE_URL_CHARS = "/%:@!$&'()*+,;=-._~?"
+
+# Held while the result cache is read, merged and rewritten, so checks
+# finishing at once add to each other's results instead of overwriting them
+_cache_lock = threading.Lock()
+
+# Errors from reusing a keep-alive connection the server already closed
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+@dataclass
+class LinkStatus:
+    """Result of checking one URL."""
+
+    url: str
+    ok: bool
+    status: int | None = None  # final HTTP status, after redirects
+    error: str = ""  # why the request failed, if it did
+    checked_at: float = 0.0
+
+    def describe(self) -> str:
+        """Short reason for display, e.g. "HTTP 404" or "timed out"."""
+        if self.error:
+            return self.error
+        return f"HTTP {self.status}"
+
+
+def is_checkable(url: str) -> bool:
+    """Whether url is an http(s) link that can be checked."""
+    parts = urlsplit(url)
+    return parts.scheme in ("http", "https") and bool(parts.hostname)
+
+
+class _HostPool:
+    """Keep-alive connections to one host, at most size of them in use."""
+
+    def __init__(self, scheme: str, netloc: str, size: int, timeout: float):
+        self.scheme = scheme
+        self.netloc = netloc
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(self.netloc, timeout=self.timeout)
+
+    @contextmanager
+    def connection(self) -> Iterator[tuple[http.client.HTTPConnection, bool]]:
+        """Borrow a connection, waiting while size are in use.
+
+        Lanes keep a host's own URLs within size; the wait only comes into
+        play when redirects from other hosts' links lead here too.
+
+        Yields:
+            The connection, and whether it was reused from an earlier request
+        """
+        with self._slots:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            reused = conn is not None
+            if conn is None:
+                conn = self._connect()
+            try:
+                yield conn, reused
+            except BaseException:
+                conn.close()
+                raise
+            with self._lock:
+                self._idle.append(conn)
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            for conn in self._idle:
+                conn.close()
+            self._idle.clear()
+
+
+class LinkChecker:
+    """Checks URLs concurrently over pooled connections, with a disk cache."""
+
+    def __init__(
+        self,
+        timeout: float = LINK_CHECK_TIMEOUT,
+        workers: int = LINK_CHECK_WORKERS,
+        per_host: int = LINK_CHECK_PER_HOST,
+        ttl: float = LINK_CHECK_TTL,
+        use_cache: bool = True,
+    ):
+        """Create a checker.
+
+        Args:
+            timeout: Seconds to wait on each connect and response
+            workers: URLs checked at once across all hosts
+            per_host: Connections, and so requests in flight, per host
+            ttl: Seconds a cached result is trusted
+            use_cache: Read and update the on-disk result cache
+        """
+        self.timeout = timeout
+        self.workers = workers
+        self.per_host = per_host
+        self.ttl = ttl
+        self.use_cache = use_cache
+        # Why the result cache couldn't be updated last time, if it couldn't
+        self.cache_error: OSError | None = None
+        self._pools: dict[tuple[str, str], _HostPool] = {}
+        self._pools_lock = threading.Lock()
+
+    def check(self, urls: Iterable[str]) -> dict[str, LinkStatus]:
+        """Check every http(s) URL, reusing fresh cached results.
+
+        The cache is only an optimisation: if it can't be written, the
+        results are still returned and the error is kept in cache_error.
+
+        Args:
+            urls: URLs to check; duplicates and other schemes are skipped
+
+        Returns:
+            A LinkStatus for each checkable URL, keyed by URL
+        """
+        urls = list(dict.fromkeys(url for url in urls if is_checkable(url)))
+        now = time.time()
+        cached = load_link_statuses() if self.use_cache else {}
+
+        results: dict[str, LinkStatus] = {}
+        for url in urls:
+            entry = cached.get(url)
+            if entry and now - entry.get("checked_at", 0) < self.ttl:
+                try:
+                    results[url] = LinkStatus(**entry)
+                except TypeError:
+                    pass
+
+        to_check = [url for url in urls if url not in results]
+        if to_check:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                lanes = [
+                    executor.submit(self._check_lane, lane)
+                    for lane in self._lanes(to_check)
+                ]
+                for lane in lanes:
+                    for status in lane.result():
+                        results[status.url] = status
+
+        if self.use_cache and to_check:
+            try:
+                self._update_cache([results[url] for url in to_check], now)
+            except OSError as e:
+                self.cache_error = e
+            else:
+                self.cache_error = None
+
+        return {url: results[url] for url in urls}
+
+    def _update_cache(self, statuses: list[LinkStatus], now: float) -> None:
+        """Add results to the disk cache, dropping expired ones.
+
+        The file is read again under the lock rather than reusing what
+        check() started with, so results another check stored meanwhile
+        are kept.
+        """
+        with _cache_lock:
+            entries = {
+                url: entry
+                for url, entry in load_link_statuses().items()
+                if now - entry.get("checked_at", 0) < self.ttl
+            }
+            entries.update((status.url, asdict(status)) for status in statuses)
+            store_link_statuses(entries)
+
+    def _lanes(self, urls: list[str]) -> list[list[str]]:
+        """Split URLs into per-host lanes, interleaved across hosts.
+
+        A host gets up to per_host lanes. Every host's first lane comes
+        before any host's second, so each host starts being checked early.
+        """
+        by_host: dict[tuple[str, str], list[str]] = {}
+        for url in urls:
+            parts = urlsplit(url)
+            by_host.setdefault((parts.scheme, parts.netloc), []).append(url)
+        host_lanes = [
+            [host_urls[i :: self.per_host] for i in range(self.per_host)]
+            for host_urls in by_host.values()
+        ]
+        return [lane for round_ in zip(*host_lanes) for lane in round_ if lane]
+
+    def _check_lane(self, urls: list[str]) -> list[LinkStatus]:
+        """Check URLs one after another (worker thread)."""
+        return [self.check_url(url) for url in urls]
+
+    def check_url(self, url: str) -> LinkStatus:
+        """Check one URL, following redirects (blocking).
+
+        A HEAD request is tried first; servers that reject HEAD get a GET.
+
+        Args:
+            url: http(s) URL to check
+
+        Returns:
+            Its LinkStatus; ok means the final response was 2xx
+        """
+        checked_at = time.time()
+        current = url
+        try:
+            for _ in range(LINK_CHECK_MAX_REDIRECTS + 1):
+                status, location = self._request("HEAD", current)
+                if status >= 400:
+                    status, location = self._request("GET", current)
+                if status in REDIRECT_STATUSES and location:
+                    current = urljoin(current, location)
+                    if not is_checkable(current):
+                        return LinkStatus(
+                            url, False, status, "bad redirect", checked_at
+                        )
+                    continue
+                return LinkStatus(url, 200 <= status < 300, status, "", checked_at)
+            return LinkStatus(url, False, status, "too many redirects", checked_at)
+        except TimeoutError:
+            return LinkStatus(url, False, None, "timed out", checked_at)
+        except (OSError, http.client.HTTPException, UnicodeError) as e:
+            return LinkStatus(url, False, None, str(e) or type(e).__name__, checked_at)
+
+    def _pool(self, scheme: str, netloc: str) -> _HostPool:
+        """Get the connection pool for a host, creating it on first use."""
+        with self._pools_lock:
+            pool = self._pools.get((scheme, netloc))
+            if pool is None:
+                pool = _HostPool(scheme, netloc, self.per_host, self.timeout)
+                self._pools[(scheme, netloc)] = pool
+            return pool
+
+    def _request(self, method: str, url: str) -> tuple[int, str | None]:
+        """Make one request on a pooled connection.
+
+        Returns:
+            Response status and Location header
+        """
+        parts = urlsplit(url)
+        target = quote(parts.path or "/", safe=_SAFE_URL_CHARS)
+        if parts.query:
+            target += "?" + quote(parts.query, safe=_SAFE_URL_CHARS)
+        headers = {"User-Agent": USER_AGENT, "Accept": "*/*"}
+
+        pool = self._pool(parts.scheme, parts.netloc)
+        with pool.connection() as (conn, reused):
+            try:
+                conn.request(method, target, headers=headers)
+                response = conn.getresponse()
+            except _STALE_CONNECTION_ERRORS:
+                if not reused:
+                    raise
+                # The server dropped the idle connection; try a fresh one
+                conn.close()
+                conn.request(method, target, headers=headers)
+                response = conn.getresponse()
+
+            response.read(MAX_DRAIN_BYTES)
+            if not response.isclosed():
+                conn.close()
+            return response.status, response.getheader("Location")
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        with self._pools_lock:
+            for pool in self._pools.values():
+                pool.close()
+            self._pools.clear()
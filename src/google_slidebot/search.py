@@ -0,0 +1,166 @@
+"""Search index over slide titles, link text and URLs."""
+
+from google_slidebot.slides import Slide
+
+_NO_SLIDES: frozenset[int] = frozenset()
+
+# Longest substrings indexed; longer query terms are looked up through
+# all of their trigrams
+TRIGRAM = 3
+
+
+def _grams(text: str) -> set[str]:
+    """All substrings of text up to TRIGRAM characters long."""
+    return {
+        text[i : i + length]
+        for length in range(1, TRIGRAM + 1)
+        for i in range(len(text) - length + 1)
+    }
+
+
+def _searchable_text(slide: Slide) -> str:
+    """A slide's title, link text and URLs, casefolded, one per line."""
+    parts = [slide.title]
+    for link in slide.links:
+        parts.append(link.text)
+        parts.append(link.url)
+    return "\n".join(parts).casefold()
+
+
+def scan(slides: list[Slide], query: str) -> list[Slide]:
+    """Find slides as SearchIndex.search() does, without an index.
+
+    Reads every slide's text on every call, so it is only for when the
+    index isn't built yet.
+
+    Args:
+        slides: Slides to search
+        query: Words to look for; case is ignored
+
+    Returns:
+        Matching slides in the order given, or all slides for an empty query
+    """
+    terms = query.casefold().split()
+    if not terms:
+        return list(slides)
+    matches = []
+    for slide in slides:
+        text = _searchable_text(slide)
+        if all(term in text for term in terms):
+            matches.append(slide)
+    return matches
+
+
+def _term_grams(term: str) -> set[str]:
+    """The indexed substrings a term must all appear under."""
+    if len(term) <= TRIGRAM:
+        return {term}
+    return {term[i : i + TRIGRAM] for i in range(len(term) - TRIGRAM + 1)}
+
+
+class SearchIndex:
+    """Finds slides by title, link text or URL as the user types.
+
+    Each slide's searchable text is indexed once by every substring of up
+    to three characters. A query only checks the slides posted under all
+    of its terms' trigrams, and a query that extends the previous one (the
+    usual case while typing) only rechecks the previous results.
+
+    Slides are identified by their position in the list the index was
+    built from, which is slide.number - 1.
+    """
+
+    def __init__(self, slides: list[Slide] = ()):
+        self.rebuild(slides)
+
+    def rebuild(self, slides: list[Slide]) -> None:
+        """Index a new list of slides from scratch."""
+        self._slides = list(slides)
+        self._text = [""] * len(self._slides)
+        self._urls: list[list[str]] = [[] for _ in self._slides]
+        self._postings: dict[str, set[int]] = {}
+        self._url_postings: dict[str, list[int]] = {}
+        for index, slide in enumerate(self._slides):
+            self._add(index, slide)
+        self._last_query = ""
+        self._last_matches: set[int] = set()
+
+    def update(self, slide: Slide) -> None:
+        """Re-index a slide whose title or links changed.
+
+        The slide may be the same object that was indexed before, changed
+        in place, so what to remove is taken from the index's own records.
+        """
+        index = slide.number - 1
+        if not 0 <= index < len(self._slides):
+            return
+        self._remove(index)
+        self._slides[index] = slide
+        self._add(index, slide)
+        self._last_query = ""
+
+    def _add(self, index: int, slide: Slide) -> None:
+        """Add a slide's text and URLs to the postings."""
+        for link in slide.links:
+            self._url_postings.setdefault(link.url, []).append(index)
+        self._urls[index] = [link.url for link in slide.links]
+        text = _searchable_text(slide)
+        self._text[index] = text
+        for gram in _grams(text):
+            self._postings.setdefault(gram, set()).add(index)
+
+    def _remove(self, index: int) -> None:
+        """Take a slide out of the postings."""
+        for gram in _grams(self._text[index]):
+            self._postings[gram].discard(index)
+        for url in self._urls[index]:
+            self._url_postings[url].remove(index)
+
+    def search(self, query: str) -> list[Slide]:
+        """Find the slides matching every word of the query.
+
+        Args:
+            query: Words to look for; case is ignored
+
+        Returns:
+            Matching slides in presentation order, or all slides for an
+            empty query
+        """
+        query = query.casefold()
+        terms = query.split()
+        if not terms:
+            self._last_query = ""
+            return list(self._slides)
+
+        postings = [
+            self._postings.get(gram, _NO_SLIDES)
+            for term in terms
+            for gram in _term_grams(term)
+        ]
+        if self._last_query and query.startswith(self._last_query):
+            postings.append(self._last_matches)
+        postings.sort(key=len)
+        matches = postings[0].intersection(*postings[1:])
+
+        # Postings are exact for terms up to a trigram long; longer terms
+        # could have all their trigrams without containing the term
+        text = self._text
+        for term in terms:
+            if len(term) > TRIGRAM:
+                matches = {index for index in matches if term in text[index]}
+
+        self._last_query = query
+        self._last_matches = matches
+        return [self._slides[index] for index in sorted(matches)]
+
+    def slides_using(self, url: str) -> list[Slide]:
+        """Find every slide that links to a URL.
+
+        Args:
+            url: Exact URL to look up
+
+        Returns:
+            Slides linking to the URL in presentation order, each once
+        """
+        indexes = sorted(set(self._url_postings.get(url, [])))
+        return [self._slides[index] for index in indexes]
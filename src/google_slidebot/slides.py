@@ -1,21 +1,58 @@
-"""Google Slides API integration."""
+"""Google Slides API integration.
+
+keyring and the Google client libraries are imported inside the functions
+that use them, so importing this module (for Slide, Link and
+extract_presentation_id) stays cheap on the CLI's startup path.
+"""
+
+from __future__ import annotations
 
 import json
 import re
+import sys
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional
-
-import keyring
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
 
+from google_slidebot.cache import load_cached_presentation, store_cached_presentation
 from google_slidebot.config import (
-    KEYRING_SERVICE,
-    KEYRING_TOKEN_KEY,
     CREDENTIALS_FILE,
     GOOGLE_SCOPES,
+    KEYRING_SERVICE,
+    KEYRING_TOKEN_KEY,
+)
+from google_slidebot.tracing import span
+from google_slidebot.transport import SessionPool, TransportOptions
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
+# Only the parts of the presentation resource that extract_slide() reads,
+# plus revisionId for cache validation. Layouts, masters, transforms and
+# styles make up most of a full response and are never downloaded.
+LINK_FIELDS = "link(url,relativeLink,pageObjectId,slideIndex)"
+TEXT_FIELDS = f"text(textElements(textRun(content,style({LINK_FIELDS}))))"
+# Group children are requested whole, since a field mask can't follow
+# groups nested to arbitrary depth.
+ELEMENT_FIELDS = (
+    f"title,shape({TEXT_FIELDS},shapeProperties({LINK_FIELDS})),"
+    f"image(imageProperties({LINK_FIELDS})),"
+    f"line(lineProperties({LINK_FIELDS})),"
+    f"table(tableRows(tableCells({TEXT_FIELDS}))),"
+    "elementGroup(children)"
+)
+PAGE_FIELDS = (
+    f"objectId,pageElements({ELEMENT_FIELDS}),"
+    f"slideProperties(notesPage(pageElements({ELEMENT_FIELDS})))"
+)
+PRESENTATION_FIELDS = f"revisionId,slides({PAGE_FIELDS})"
+
+# Just enough of every slide to list it: its ID and plain text for the title.
+SLIDE_INDEX_FIELDS = (
+    "slides(objectId,pageElements(shape(text(textElements(textRun(content))))))"
 )
 
 
@@ -44,12 +81,14 @@ def extract_presentation_id(url_or_id: str) -> str:
     return match.group(1)
 
 
-def get_stored_token() -> Optional[dict]:
+def get_stored_token() -> dict | None:
     """Retrieve OAuth token from keyring.
 
     Returns:
         Token dict if found, None otherwise
     """
+    import keyring
+
     stored = keyring.get_password(KEYRING_SERVICE, KEYRING_TOKEN_KEY)
     if stored is None:
         return None
@@ -62,18 +101,185 @@ def store_token(token_data: dict) -> None:
     Args:
         token_data: Token dict to store
     """
+    import keyring
+
     keyring.set_password(KEYRING_SERVICE, KEYRING_TOKEN_KEY, json.dumps(token_data))
 
 
 def delete_stored_token() -> None:
     """Delete OAuth token from keyring."""
+    import keyring
+
     keyring.delete_password(KEYRING_SERVICE, KEYRING_TOKEN_KEY)
 
 
+class CredentialManager:
+    """Process-wide owner of the Google OAuth credentials.
+
+    The keyring is read once per process. While the access token is valid
+    it is handed out immediately, and a timer refreshes it in the background
+    shortly before it expires, so API calls never wait on a refresh.
+    Refreshed tokens are written back to the keyring on a separate thread.
+    """
+
+    # Refresh this long before expiry. Must exceed google-auth's own
+    # refresh threshold (under 4 minutes), after which credentials report
+    # invalid and the HTTP layer would refresh synchronously per request.
+    REFRESH_MARGIN = timedelta(minutes=10)
+
+    def __init__(self):
+        self._creds: Credentials | None = None
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._writes: list[threading.Thread] = []
+        # Why the last background refresh failed, if it did
+        self.refresh_error: Exception | None = None
+
+    def get(self) -> Credentials:
+        """Get valid credentials, loading or refreshing them if needed.
+
+        Returns:
+            Valid Credentials object
+
+        Raises:
+            FileNotFoundError: If credentials.json not found and no valid token
+        """
+        from google.oauth2.credentials import Credentials
+
+        with self._lock:
+            if not self._loaded:
+                with span("credentials.keyring_read"):
+                    token_data = get_stored_token()
+                if token_data:
+                    self._creds = Credentials.from_authorized_user_info(
+                        token_data, GOOGLE_SCOPES
+                    )
+                self._loaded = True
+            creds = self._creds
+
+        if creds and creds.valid:
+            self._schedule_refresh(creds)
+            return creds
+
+        if creds and creds.expired and creds.refresh_token:
+            self._refresh(creds)
+            return creds
+
+        with span("credentials.oauth_flow"):
+            creds = self._run_oauth_flow()
+        with self._lock:
+            self._creds = creds
+        self._store_in_background(creds)
+        self._schedule_refresh(creds)
+        return creds
+
+    def _run_oauth_flow(self) -> Credentials:
+        """Authorize interactively using credentials.json."""
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
+        if not CREDENTIALS_FILE.exists():
+            raise FileNotFoundError(
+                f"credentials.json not found at {CREDENTIALS_FILE}\n"
+                f"Download from Google Cloud Console and place it there."
+            )
+
+        flow = InstalledAppFlow.from_client_secrets_file(
+            str(CREDENTIALS_FILE), GOOGLE_SCOPES
+        )
+        return flow.run_local_server(port=0)
+
+    def _refresh(self, creds: Credentials) -> None:
+        """Refresh the access token in place and persist it."""
+        from google.auth.transport.requests import Request
+
+        with self._refresh_lock:
+            # Another thread may have refreshed while we waited
+            if not creds.valid or self._expires_soon(creds):
+                with span("credentials.refresh"):
+                    creds.refresh(Request())
+                self._store_in_background(creds)
+        self._schedule_refresh(creds)
+
+    def _refresh_in_background(self, creds: Credentials) -> None:
+        """Timer callback: refresh ahead of expiry."""
+        with self._lock:
+            self._timer = None
+        with span("credentials.background_refresh") as refresh:
+            try:
+                self._refresh(creds)
+            except Exception as e:  # noqa: BLE001 - nobody to raise it to
+                # Leave it to the next get() to refresh synchronously,
+                # which raises whatever goes wrong to its caller
+                self.refresh_error = e
+                refresh.set(error=f"{type(e).__name__}: {e}")
+            else:
+                self.refresh_error = None
+
+    def _expires_soon(self, creds: Credentials) -> bool:
+        """Whether creds expire within REFRESH_MARGIN."""
+        expiry = creds.expiry
+        if not isinstance(expiry, datetime):
+            return False
+        return expiry - _utcnow() <= self.REFRESH_MARGIN
+
+    def _schedule_refresh(self, creds: Credentials) -> None:
+        """Arrange a background refresh REFRESH_MARGIN before expiry."""
+        expiry = creds.expiry
+        if not creds.refresh_token or not isinstance(expiry, datetime):
+            return
+
+        delay = (expiry - _utcnow() - self.REFRESH_MARGIN).total_seconds()
+        with self._lock:
+            if self._timer is not None and self._timer.is_alive():
+                return
+            self._timer = threading.Timer(
+                max(delay, 0), self._refresh_in_background, args=(creds,)
+            )
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _store_in_background(self, creds: Credentials) -> None:
+        """Write the token to the keyring without blocking the caller."""
+        writer = threading.Thread(
+            target=store_token,
+            args=(json.loads(creds.to_json()),),
+            name="slidebot-store-token",
+        )
+        with self._lock:
+            self._writes = [w for w in self._writes if w.is_alive()]
+            writer.start()
+            self._writes.append(writer)
+
+    def flush(self) -> None:
+        """Wait for pending keyring writes to finish."""
+        with self._lock:
+            writes = list(self._writes)
+        for writer in writes:
+            writer.join()
+
+    def close(self) -> None:
+        """Cancel any scheduled refresh."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime, matching Credentials.expiry."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+_credential_manager = CredentialManager()
+
+
 def get_credentials() -> Credentials:
     """Get valid Google OAuth credentials.
 
-    Tries keyring first, refreshes if expired, or runs OAuth flow.
+    Tries keyring first (once per process), refreshes if expired, or runs
+    OAuth flow. See CredentialManager.
 
     Returns:
         Valid Credentials object
@@ -81,107 +287,561 @@ def get_credentials() -> Credentials:
     Raises:
         FileNotFoundError: If credentials.json not found and no valid token
     """
-    creds = None
-    token_data = get_stored_token()
+    return _credential_manager.get()
 
-    if token_data:
-        creds = Credentials.from_authorized_user_info(token_data, GOOGLE_SCOPES)
 
-    if creds and creds.valid:
-        return creds
+def flush_credentials() -> None:
+    """Wait for refreshed tokens to be written to the keyring.
 
-    if creds and creds.expired and creds.refresh_token:
-        creds.refresh(Request())
-        store_token(json.loads(creds.to_json()))
-        return creds
+    Call before exiting, so a token refreshed just before the end of a
+    session isn't lost with the process.
+    """
+    with span("credentials.flush"):
+        _credential_manager.flush()
 
-    # Need to run OAuth flow
-    if not CREDENTIALS_FILE.exists():
-        raise FileNotFoundError(
-            f"credentials.json not found at {CREDENTIALS_FILE}\n"
-            f"Download from Google Cloud Console and place it there."
-        )
 
-    flow = InstalledAppFlow.from_client_secrets_file(
-        str(CREDENTIALS_FILE), GOOGLE_SCOPES
-    )
-    creds = flow.run_local_server(port=0)
-    store_token(json.loads(creds.to_json()))
-    return creds
+@dataclass(slots=True)
+class Link:
+    """A hyperlink extracted from a slide.
 
+    source says where on the slide the link was found: "text" for a link
+    in a shape's text, "table" for one in a table cell, "shape", "image"
+    or "line" for a link set on the whole element, and "notes" for
+    anything in the speaker notes.
 
-@dataclass
-class Link:
-    """A hyperlink extracted from a slide."""
+    Links and slides are slotted, and a link's strings are interned: decks
+    repeat the same URLs and labels from slide to slide, and the daemon
+    holds many decks at once, so every link with a given URL shares one
+    copy of it.
+    """
 
     text: str
     url: str
+    source: str = "text"
 
+    def __post_init__(self):
+        self.text = sys.intern(self.text)
+        self.url = sys.intern(self.url)
+        self.source = sys.intern(self.source)
 
-@dataclass
+    @property
+    def internal(self) -> bool:
+        """Whether the link points at a slide in the same presentation."""
+        return self.url.startswith("#")
+
+
+@dataclass(slots=True)
 class Slide:
-    """A slide with its extracted content."""
+    """A slide with its extracted content.
+
+    Slides from a lazy slide index start with loaded=False and no links
+    until PageLoader fetches their page.
+    """
 
     number: int
     title: str
     links: list[Link] = field(default_factory=list)
+    object_id: str = ""
+    loaded: bool = True
 
 
-def extract_slides_from_presentation(presentation_data: dict) -> list[Slide]:
-    """Extract slide data from Slides API response.
+def _link_url(link: dict) -> str | None:
+    """Get the target of a Slides API Link as a URL.
+
+    Links to other slides in the deck become "#slide=..." fragments, the
+    form Google Slides uses in its own URLs.
+    """
+    if "url" in link:
+        return link["url"]
+    if "pageObjectId" in link:
+        return f"#slide=id.{link['pageObjectId']}"
+    if "slideIndex" in link:
+        return f"#slide={link['slideIndex'] + 1}"
+    if "relativeLink" in link:
+        return f"#slide={link['relativeLink'].lower()}"
+    return None
+
+
+def extract_slide(number: int, slide_data: dict) -> Slide:
+    """Extract a single slide's title and links.
+
+    Every page element is visited exactly once, in document order, with an
+    explicit stack rather than recursion, so deeply nested groups can't
+    exhaust the interpreter's recursion limit. The title is the first
+    non-empty text in a shape on the slide itself.
 
     Args:
-        presentation_data: Response from presentations().get()
+        number: 1-based slide number
+        slide_data: One entry of the presentation's "slides" list
 
     Returns:
-        List of Slide objects with titles and links
+        Slide object with title and links
     """
-    slides = []
-
-    for idx, slide_data in enumerate(presentation_data.get("slides", []), start=1):
-        title = ""
-        links = []
+    title = ""
+    links = []
 
-        for element in slide_data.get("pageElements", []):
-            shape = element.get("shape")
-            if shape is None:
-                continue
-
-            text_elements = shape.get("text", {}).get("textElements", [])
+    notes = (
+        slide_data.get("slideProperties", {})
+        .get("notesPage", {})
+        .get("pageElements", [])
+    )
+    # (element, in_notes) pairs, pushed in reverse so they pop in order;
+    # the slide's own elements come off before its speaker notes
+    stack = [(element, True) for element in reversed(notes)]
+    stack.extend(
+        (element, False) for element in reversed(slide_data.get("pageElements", []))
+    )
 
-            for text_element in text_elements:
+    while stack:
+        element, in_notes = stack.pop()
+
+        group = element.get("elementGroup")
+        if group is not None:
+            stack.extend(
+                (child, in_notes) for child in reversed(group.get("children", []))
+            )
+            continue
+
+        if "shape" in element:
+            kind = "shape"
+            props = element["shape"].get("shapeProperties", {})
+            texts = [(element["shape"].get("text", {}), "text")]
+        elif "table" in element:
+            kind = "table"
+            props = {}
+            texts = [
+                (cell.get("text", {}), "table")
+                for row in element["table"].get("tableRows", [])
+                for cell in row.get("tableCells", [])
+            ]
+        elif "image" in element:
+            kind = "image"
+            props = element["image"].get("imageProperties", {})
+            texts = []
+        elif "line" in element:
+            kind = "line"
+            props = element["line"].get("lineProperties", {})
+            texts = []
+        else:
+            continue
+
+        # A link on the whole element, labelled with its alt-text title
+        url = _link_url(props.get("link", {}))
+        if url:
+            text = element.get("title", "").strip() or url
+            links.append(Link(text=text, url=url, source="notes" if in_notes else kind))
+
+        for text, source in texts:
+            for text_element in text.get("textElements", []):
                 text_run = text_element.get("textRun")
                 if not text_run:
                     continue
 
                 content = text_run.get("content", "").strip()
-                style = text_run.get("style", {})
-                link_info = style.get("link", {})
-                url = link_info.get("url")
 
-                # First non-empty text becomes title
-                if not title and content:
+                # First non-empty shape text on the slide becomes title
+                if not title and content and source == "text" and not in_notes:
                     title = content
 
-                # Collect links
+                url = _link_url(text_run.get("style", {}).get("link", {}))
                 if url:
-                    links.append(Link(text=content or url, url=url))
+                    links.append(
+                        Link(
+                            text=content or url,
+                            url=url,
+                            source="notes" if in_notes else source,
+                        )
+                    )
+
+    return Slide(
+        number=number,
+        title=title or f"Slide {number}",
+        links=links,
+        object_id=slide_data.get("objectId", ""),
+    )
 
-        slides.append(Slide(number=idx, title=title or f"Slide {idx}", links=links))
 
-    return slides
+def iter_slides_from_presentation(presentation_data: dict) -> Iterator[Slide]:
+    """Lazily extract slides from Slides API response.
+
+    Args:
+        presentation_data: Response from presentations().get()
+
+    Yields:
+        Slide objects in presentation order
+    """
+    for idx, slide_data in enumerate(presentation_data.get("slides", []), start=1):
+        yield extract_slide(idx, slide_data)
+
+
+def extract_slides_from_presentation(presentation_data: dict) -> list[Slide]:
+    """Extract slide data from Slides API response.
+
+    Args:
+        presentation_data: Response from presentations().get()
+
+    Returns:
+        List of Slide objects with titles and links
+    """
+    return list(iter_slides_from_presentation(presentation_data))
+
 
+# Built once per process: constructing the service and its presentations()
+# resource parses the discovery document and generates every API method.
+_service = None
+_presentations = None
+_transport = TransportOptions()
+_sessions: SessionPool | None = None
 
-def fetch_presentation(presentation_id: str) -> list[Slide]:
+
+def _session_pool() -> SessionPool:
+    """Get the pool of HTTP sessions that API requests are sent on."""
+    global _sessions
+    if _sessions is None:
+        _sessions = SessionPool(_transport, _credentials_for_session)
+    return _sessions
+
+
+def _credentials_for_session() -> Credentials:
+    with span("credentials.get"):
+        return get_credentials()
+
+
+def get_service():
+    """Get the Slides API service, building it on first use.
+
+    The discovery document bundled with google-api-python-client is used,
+    so building never makes a network request. One instance serves the
+    whole process; requests made through execute() go out on pooled
+    sessions, which refresh credentials themselves.
+
+    Returns:
+        Slides API v1 service resource
+    """
+    global _service
+    if _service is None:
+        from googleapiclient.discovery import build
+
+        client_options = {}
+        if _transport.endpoint:
+            client_options["api_endpoint"] = _transport.endpoint
+        with _session_pool().session() as http, span("slides.build_service"):
+            _service = build(
+                "slides",
+                "v1",
+                http=http,
+                static_discovery=True,
+                client_options=client_options or None,
+            )
+    return _service
+
+
+def get_presentations_resource():
+    """Get the service's presentations() resource, reused across calls.
+
+    Returns:
+        Slides API presentations resource
+    """
+    global _presentations
+    if _presentations is None:
+        _presentations = get_service().presentations()
+    return _presentations
+
+
+def execute(request):
+    """Send an API request on a pooled session, retrying transient failures.
+
+    Args:
+        request: An HttpRequest from a resource method, e.g.
+            get_presentations_resource().get(...)
+
+    Returns:
+        The decoded response
+    """
+    with _session_pool().session() as http:
+        return request.execute(http=http, num_retries=_transport.retries)
+
+
+def configure_transport(options: TransportOptions) -> None:
+    """Send API requests as options say from now on.
+
+    Args:
+        options: Endpoint, timeout, retries and authorization to use
+    """
+    global _transport
+    clear_service_cache()
+    _transport = options
+
+
+def clear_service_cache() -> None:
+    """Forget the cached service and sessions, e.g. after switching accounts."""
+    global _service, _presentations, _sessions
+    _service = None
+    _presentations = None
+    if _sessions is not None:
+        _sessions.close()
+        _sessions = None
+
+
+def fetch_presentation(presentation_id: str, offline: bool = False) -> list[Slide]:
     """Fetch a presentation and extract its slides.
 
+    A cached copy is reused when a cheap revisionId check shows the
+    presentation hasn't changed since it was cached.
+
     Args:
         presentation_id: Google Slides presentation ID
+        offline: Use the cached copy without contacting the API
 
     Returns:
         List of Slide objects
+
+    Raises:
+        FileNotFoundError: If offline and the presentation isn't cached
+    """
+    presentation = fetch_presentation_data(presentation_id, offline)
+    with span("slides.extract") as extract:
+        slides = extract_slides_from_presentation(presentation)
+        extract.set(slides=len(slides))
+    return slides
+
+
+def fetch_presentation_data(presentation_id: str, offline: bool = False) -> dict:
+    """Fetch a presentation's API response, as fetch_presentation() does.
+
+    Args:
+        presentation_id: Google Slides presentation ID
+        offline: Use the cached copy without contacting the API
+
+    Returns:
+        The presentations.get() response, including its revisionId
+
+    Raises:
+        FileNotFoundError: If offline and the presentation isn't cached
+    """
+    with span("slides.fetch_presentation", offline=offline) as fetch:
+        with span("slides.load_cache"):
+            cached = load_cached_presentation(presentation_id, PRESENTATION_FIELDS)
+
+        if offline:
+            if cached is None:
+                raise FileNotFoundError(
+                    f"No cached copy of presentation {presentation_id}. "
+                    "Run once while online to cache it."
+                )
+            presentation = cached
+        elif cached is not None and (
+            fetch_revision_id(presentation_id) == cached["revisionId"]
+        ):
+            presentation = cached
+        else:
+            presentation = _fetch_full_presentation(presentation_id)
+        fetch.set(from_cache=presentation is cached)
+        return presentation
+
+
+def fetch_revision_id(presentation_id: str) -> str | None:
+    """Get a presentation's current revisionId, without any of its content.
+
+    Args:
+        presentation_id: Google Slides presentation ID
+
+    Returns:
+        The revision ID, which changes whenever the presentation is edited
+    """
+    resource = get_presentations_resource()
+    with span("slides.fetch_revision"):
+        current = execute(
+            resource.get(presentationId=presentation_id, fields="revisionId")
+        )
+    return current.get("revisionId")
+
+
+def _fetch_full_presentation(presentation_id: str) -> dict:
+    """Fetch everything extract_slide() reads, and cache it if possible."""
+    resource = get_presentations_resource()
+    with span("slides.fetch_full"):
+        presentation = execute(
+            resource.get(presentationId=presentation_id, fields=PRESENTATION_FIELDS)
+        )
+    with span("slides.store_cache") as store:
+        try:
+            store_cached_presentation(
+                presentation_id, presentation, PRESENTATION_FIELDS
+            )
+        except OSError as e:
+            # The cache only saves refetching; an unwritable config dir
+            # (read-only home, full disk) must not lose a fetched deck
+            store.set(error=f"{type(e).__name__}: {e}")
+    return presentation
+
+
+def diff_slides(old: list[Slide], new: list[Slide]) -> list[int]:
+    """Find the positions where a new version of a deck differs.
+
+    Args:
+        old: Slides as currently shown
+        new: Slides just fetched
+
+    Returns:
+        Indexes into new of slides that were added or changed
+    """
+    return [
+        index
+        for index, slide in enumerate(new)
+        if index >= len(old) or old[index] != slide
+    ]
+
+
+class PresentationWatcher:
+    """Notices edits to a presentation by polling its revisionId.
+
+    A poll is one small request for the revisionId; the presentation is
+    only fetched again when that changes. The starting revision is the one
+    fetch_presentation() cached, so the first poll after startup doesn't
+    refetch a deck that was just loaded.
     """
-    creds = get_credentials()
-    service = build("slides", "v1", credentials=creds)
-    presentation = service.presentations().get(presentationId=presentation_id).execute()
-    return extract_slides_from_presentation(presentation)
+
+    def __init__(self, presentation_id: str, interval: float):
+        """Create a watcher.
+
+        Args:
+            presentation_id: Google Slides presentation ID
+            interval: Seconds between polls, for the caller's scheduling
+        """
+        self.presentation_id = presentation_id
+        self.interval = interval
+        self.revision_id: str | None = None
+
+    def check(self) -> list[Slide] | None:
+        """Poll once, refetching the presentation if it changed (blocking).
+
+        Returns:
+            The new slides, or None if nothing changed
+        """
+        if self.revision_id is None:
+            cached = load_cached_presentation(self.presentation_id, PRESENTATION_FIELDS)
+            if cached is not None:
+                self.revision_id = cached["revisionId"]
+
+        if fetch_revision_id(self.presentation_id) == self.revision_id:
+            return None
+
+        presentation = _fetch_full_presentation(self.presentation_id)
+        self.revision_id = presentation.get("revisionId")
+        return extract_slides_from_presentation(presentation)
+
+
+class PageLoader:
+    """Loads slide content one page at a time, on demand.
+
+    fetch_index() returns every slide with just its title, so startup cost
+    doesn't grow with the deck's links. Full pages are fetched by load()
+    when a slide is opened, and prefetch() warms neighbouring slides in the
+    background. All API calls after the index run on a single worker thread,
+    so pages load one at a time, in the order they were asked for.
+    """
+
+    def __init__(
+        self,
+        presentation_id: str,
+        radius: int = 2,
+        on_loaded: Callable[[Slide], None] | None = None,
+    ):
+        """Create a loader.
+
+        Args:
+            presentation_id: Google Slides presentation ID
+            radius: Number of slides either side of the current one to prefetch
+            on_loaded: Called from the worker thread after a slide loads
+        """
+        self.presentation_id = presentation_id
+        self.radius = radius
+        self.on_loaded = on_loaded
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="slidebot-pages"
+        )
+        self._pending: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def fetch_index(self) -> list[Slide]:
+        """Fetch slide IDs and titles only.
+
+        Returns:
+            List of Slide objects with loaded=False
+        """
+        resource = get_presentations_resource()
+        with span("slides.fetch_index"):
+            index = execute(
+                resource.get(
+                    presentationId=self.presentation_id, fields=SLIDE_INDEX_FIELDS
+                )
+            )
+
+        slides = []
+        for slide in iter_slides_from_presentation(index):
+            slide.loaded = False
+            slides.append(slide)
+        return slides
+
+    def _fetch_page(self, slide: Slide) -> Slide:
+        """Fetch a slide's page and fill in its content (worker thread)."""
+        if slide.loaded:
+            return slide
+
+        page = execute(
+            get_presentations_resource()
+            .pages()
+            .get(
+                presentationId=self.presentation_id,
+                pageObjectId=slide.object_id,
+                fields=PAGE_FIELDS,
+            )
+        )
+        loaded = extract_slide(slide.number, page)
+        slide.title = loaded.title
+        slide.links = loaded.links
+        slide.loaded = True
+
+        if self.on_loaded:
+            self.on_loaded(slide)
+        return slide
+
+    def _submit(self, slide: Slide) -> Future:
+        """Queue a page fetch, reusing one already queued for the slide."""
+        with self._lock:
+            future = self._pending.get(slide.object_id)
+            if future is None or (future.done() and future.exception()):
+                future = self._executor.submit(self._fetch_page, slide)
+                self._pending[slide.object_id] = future
+            return future
+
+    def load(self, slide: Slide) -> Slide:
+        """Load a slide's content, blocking until it is available.
+
+        Args:
+            slide: Slide from fetch_index()
+
+        Returns:
+            The same slide, now loaded
+        """
+        if slide.loaded:
+            return slide
+        return self._submit(slide).result()
+
+    def prefetch(self, slides: list[Slide], index: int) -> None:
+        """Load the slides around index in the background.
+
+        Args:
+            slides: Full slide list from fetch_index()
+            index: 0-based index of the current slide
+        """
+        # Nearest neighbours first, alternating forwards and backwards
+        for distance in range(1, self.radius + 1):
+            for neighbour in (index + distance, index - distance):
+                if 0 <= neighbour < len(slides) and not slides[neighbour].loaded:
+                    self._submit(slides[neighbour])
+
+    def close(self) -> None:
+        """Stop the worker thread, abandoning queued prefetches."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
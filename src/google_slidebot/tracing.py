@@ -0,0 +1,286 @@
+"""Timing spans and profiling for diagnosing slow startups and sends.
+
+Code wraps each phase worth timing in span():
+
+    with span("slides.fetch_full", presentation=presentation_id):
+        ...
+
+Spans cost almost nothing until enable() is called (the --trace flag).
+From then on each finished span is recorded with its thread, and
+write_timeline() saves them in the Chrome trace event format, which
+chrome://tracing and https://ui.perfetto.dev draw as a timeline with a
+row per thread. mark() records a single moment, such as the slides
+appearing, in the same timeline.
+
+start_profiling() (the --profile flag) adds cProfile and tracemalloc for
+the session. Each mark() then also saves a tracemalloc snapshot, and
+stop_profiling() writes the final snapshot, the cProfile stats and a
+text summary of both.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import final
+
+# Frames of traceback kept per allocation when profiling
+TRACEMALLOC_FRAMES = 10
+
+
+class Tracer:
+    """Collects finished spans and marks as Chrome trace events."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.events: list[dict] = []
+        self._threads: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def _timestamp(self, when: float) -> float:
+        """Microseconds since the tracer started."""
+        return round((when - self.start) * 1_000_000, 1)
+
+    def _add(self, event: dict) -> None:
+        thread = threading.current_thread()
+        event["pid"] = os.getpid()
+        event["tid"] = thread.ident
+        with self._lock:
+            self._threads.setdefault(thread.ident, thread.name)
+            self.events.append(event)
+
+    def record(self, name: str, start: float, end: float, attrs: dict) -> None:
+        """Record a finished span; start and end are perf_counter() times."""
+        self._add(
+            {
+                "name": name,
+                "ph": "X",
+                "ts": self._timestamp(start),
+                "dur": self._timestamp(end) - self._timestamp(start),
+                "args": attrs,
+            }
+        )
+
+    def mark(self, name: str, attrs: dict) -> None:
+        """Record a moment."""
+        self._add(
+            {
+                "name": name,
+                "ph": "i",
+                "s": "p",
+                "ts": self._timestamp(time.perf_counter()),
+                "args": attrs,
+            }
+        )
+
+    def timeline(self) -> dict:
+        """The recorded events, with thread names, as a trace document."""
+        with self._lock:
+            events = sorted(self.events, key=lambda event: event["ts"])
+            threads = [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": os.getpid(),
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+                for tid, name in self._threads.items()
+            ]
+        return {"traceEvents": threads + events, "displayTimeUnit": "ms"}
+
+
+@final
+class _Span:
+    """A span being timed; set() adds attributes known only later."""
+
+    __slots__ = ("attrs", "name", "start", "tracer")
+
+    def __init__(self, tracer: Tracer, name: str, attrs: dict):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+
+    def set(self, **attrs) -> None:
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> _Span:
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        end = time.perf_counter()
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self.tracer.record(self.name, self.start, end, self.attrs)
+        return False
+
+
+@final
+class _NullSpan:
+    """Stands in for a span while tracing is off."""
+
+    __slots__ = ()
+
+    def set(self, **attrs) -> None:
+        pass
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+_tracer: Tracer | None = None
+_profiler: _Profiler | None = None
+
+
+def span(name: str, **attrs):
+    """Time a block of code as a span named name.
+
+    Args:
+        name: Span name, "<module>.<phase>" by convention
+        **attrs: JSON-serialisable details to record with the span
+
+    Returns:
+        Context manager yielding an object whose set(**attrs) adds details
+        from inside the block; an exception leaving the block is recorded
+        as the span's "error"
+    """
+    if _tracer is None:
+        return _NULL_SPAN
+    return _Span(_tracer, name, attrs)
+
+
+def mark(name: str, **attrs) -> None:
+    """Record a moment in the timeline, and a memory snapshot if profiling.
+
+    Args:
+        name: Name of the moment, e.g. "tui.slides_shown"
+        **attrs: JSON-serialisable details to record with it
+    """
+    if _tracer is not None:
+        _tracer.mark(name, attrs)
+    if _profiler is not None:
+        _profiler.snapshot(name)
+
+
+def enable() -> Tracer:
+    """Start recording spans, if not already.
+
+    Returns:
+        The process-wide tracer
+    """
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
+
+
+def disable() -> None:
+    """Stop recording spans and discard those recorded."""
+    global _tracer
+    _tracer = None
+
+
+def write_timeline(path: str | Path) -> None:
+    """Save the recorded spans as a Chrome trace JSON file.
+
+    Args:
+        path: File to write
+
+    Raises:
+        RuntimeError: If tracing isn't enabled
+    """
+    if _tracer is None:
+        raise RuntimeError("Tracing is not enabled")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(_tracer.timeline(), f)
+
+
+class _Profiler:
+    """cProfile and tracemalloc for one session, saved to a directory."""
+
+    def __init__(self, directory: Path):
+        import cProfile
+
+        self.directory = directory
+        self.profile = cProfile.Profile()
+        self.snapshots: list[str] = []
+
+    def start(self) -> None:
+        import tracemalloc
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+        self.profile.enable()
+
+    def snapshot(self, label: str):
+        """Save a tracemalloc snapshot as <label>.tracemalloc."""
+        import tracemalloc
+
+        snapshot = tracemalloc.take_snapshot()
+        # Keep the profiler's own bookkeeping out of the numbers
+        snapshot = snapshot.filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        name = f"{len(self.snapshots):02d}-{label}.tracemalloc"
+        snapshot.dump(str(self.directory / name))
+        self.snapshots.append(name)
+        return snapshot
+
+    def stop(self) -> None:
+        import io
+        import pstats
+        import tracemalloc
+
+        self.profile.disable()
+        at_exit = self.snapshot("exit")
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.profile.dump_stats(str(self.directory / "session.prof"))
+        report = io.StringIO()
+        report.write(
+            f"Memory traced at exit: {current / 1024:.0f} KiB, "
+            f"peak {peak / 1024:.0f} KiB\n\nTop allocations at exit:\n"
+        )
+        for stat in at_exit.statistics("lineno")[:20]:
+            report.write(f"  {stat}\n")
+        report.write("\n")
+        stats = pstats.Stats(self.profile, stream=report)
+        stats.sort_stats("cumulative").print_stats(30)
+        (self.directory / "summary.txt").write_text(report.getvalue())
+
+
+def start_profiling(directory: str | Path) -> None:
+    """Profile the rest of the session with cProfile and tracemalloc.
+
+    cProfile only sees the calling thread, normally the one running the
+    TUI's event loop; time spent in worker threads shows in the span
+    timeline instead. tracemalloc sees allocations from every thread.
+
+    Args:
+        directory: Where stop_profiling() and mark() write their files
+    """
+    global _profiler
+    if _profiler is not None:
+        return
+    _profiler = _Profiler(Path(directory))
+    _profiler.start()
+
+
+def stop_profiling() -> None:
+    """Stop profiling and write session.prof, snapshots and summary.txt.
+
+    Does nothing if profiling wasn't started.
+    """
+    global _profiler
+    profiler, _profiler = _profiler, None
+    if profiler is not None:
+        profiler.stop()
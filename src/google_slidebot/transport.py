@@ -0,0 +1,101 @@
+"""HTTP transport for Slides API calls.
+
+Every API request goes out on a keep-alive session from one SessionPool,
+so revision checks, refetches and page loads reuse an open TLS
+connection instead of setting one up each time. httplib2 sessions aren't
+thread-safe, so each is used by one thread at a time: a thread borrows
+an idle session, or opens a new one, and hands it back afterwards. That
+way the short-lived worker threads of the TUI and the daemon still reuse
+connections between them.
+
+Responses are gzip-compressed: Google only compresses for clients that
+send "gzip" in their User-Agent as well as Accept-Encoding, which
+googleapiclient does for every request.
+
+TransportOptions sets the timeout, retry count and API endpoint. Pointing
+the endpoint at a local fake server, without credentials, runs the real
+client code in tests and benchmarks with no network access.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from google_slidebot import __version__
+from google_slidebot.config import API_ENDPOINT, API_RETRIES, API_TIMEOUT
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
+USER_AGENT = f"google-slidebot/{__version__}"
+
+
+@dataclass
+class TransportOptions:
+    """How Slides API requests are sent."""
+
+    endpoint: str | None = API_ENDPOINT  # API root URL; None for Google's
+    timeout: float = API_TIMEOUT  # seconds for each connect and response
+    retries: int = API_RETRIES  # retries of 429, 5xx and dropped connections
+    authorize: bool = True  # send credentials; off for a local fake server
+
+
+class SessionPool:
+    """Keep-alive HTTP sessions, lent to one thread at a time."""
+
+    def __init__(
+        self,
+        options: TransportOptions,
+        credentials: Callable[[], Credentials],
+    ):
+        """Create an empty pool; sessions are opened as they're needed.
+
+        Args:
+            options: Timeout and authorization for new sessions
+            credentials: Returns the credentials to authorize sessions with
+        """
+        self.options = options
+        self.credentials = credentials
+        self._idle: list = []
+        self._lock = threading.Lock()
+
+    def _open(self):
+        """Open a new session."""
+        import httplib2
+        from googleapiclient.http import set_user_agent
+
+        http = httplib2.Http(timeout=self.options.timeout)
+        if self.options.authorize:
+            from google_auth_httplib2 import AuthorizedHttp
+
+            http = AuthorizedHttp(self.credentials(), http=http)
+        return set_user_agent(http, USER_AGENT)
+
+    @contextmanager
+    def session(self) -> Iterator:
+        """Borrow a session for the duration of the block.
+
+        Yields:
+            An httplib2.Http-compatible session, authorized unless the
+            options say otherwise
+        """
+        with self._lock:
+            http = self._idle.pop() if self._idle else None
+        if http is None:
+            http = self._open()
+        try:
+            yield http
+        finally:
+            with self._lock:
+                self._idle.append(http)
+
+    def close(self) -> None:
+        """Close the idle sessions' connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for http in idle:
+            http.close()
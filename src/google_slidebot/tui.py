@@ -1,88 +1,454 @@
 """Textual TUI for Google Slidebot."""
 
+import functools
+import math
+from collections.abc import Callable
+from typing import ClassVar
+
+from rich.segment import Segment
+from textual import events
 from textual.app import App, ComposeResult
+from textual.binding import Binding, BindingType
+from textual.geometry import Region, Size
+from textual.message import Message
 from textual.screen import Screen
-from textual.widgets import Header, Footer, ListView, ListItem, Label, Static
-from textual.binding import Binding
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from textual.widgets import Footer, Header, Input, Static
+
+from google_slidebot.config import ZOOM_PAGE_WAIT
+from google_slidebot.follow import SlideFollower, find_slide
+from google_slidebot.search import SearchIndex, scan
+from google_slidebot.slides import Slide, diff_slides
+from google_slidebot.tracing import mark
+from google_slidebot.zoom_chat import MessageCache, chat_links
+
+# Line breaks and tabs inside slide text would break a one-line row
+_ROW_WHITESPACE = dict.fromkeys(map(ord, "\n\r\t\v\f"), " ")
+
+# How the link view labels where a link was found; others show the source
+_LINK_SOURCES = {"text": "", "notes": " (speaker notes, not sent to chat)"}
+
+
+class SlideList(ScrollView, can_focus=True):
+    """Scrolling list of slides, one row each, drawn with the Line API.
+
+    There is no widget per slide and rows are only formatted once they
+    are scrolled into view, so mounting, moving the cursor and redrawing
+    a row cost the same for a ten-slide deck as for a ten-thousand-slide
+    one.
+    """
+
+    BINDINGS: ClassVar[list[BindingType]] = [
+        Binding("enter", "select", "Select", show=False),
+        Binding("up", "cursor_up", "Up", show=False),
+        Binding("down", "cursor_down", "Down", show=False),
+        Binding("pageup", "cursor_page_up", "Page up", show=False),
+        Binding("pagedown", "cursor_page_down", "Page down", show=False),
+        Binding("home", "cursor_first", "First", show=False),
+        Binding("end", "cursor_last", "Last", show=False),
+    ]
+
+    COMPONENT_CLASSES: ClassVar[set[str]] = {"slide-list--cursor"}
+
+    DEFAULT_CSS = """
+    SlideList {
+        overflow-x: hidden;
+    }
+    SlideList > .slide-list--cursor {
+        background: $block-cursor-background;
+        color: $block-cursor-foreground;
+        text-style: $block-cursor-text-style;
+    }
+    """
+
+    class Highlighted(Message):
+        """Posted when the cursor moves to a slide."""
+
+        def __init__(self, index: int) -> None:
+            super().__init__()
+            self.index = index
+
+    class Selected(Message):
+        """Posted when a slide is chosen with Enter or a click."""
+
+        def __init__(self, index: int) -> None:
+            super().__init__()
+            self.index = index
+
+    def __init__(
+        self, slides: list[Slide], format_row: Callable[[Slide], str], **kwargs
+    ):
+        """Create the list.
+
+        Args:
+            slides: Slides to show; the list is read, never copied, so call
+                reset() after changing its contents
+            format_row: Builds the display string for one slide
+        """
+        super().__init__(**kwargs)
+        self.slides = slides
+        self.format_row = format_row
+        self.index = 0
+
+    def on_mount(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Pick up a changed slides list and redraw."""
+        self.virtual_size = Size(0, len(self.slides))
+        self.index = min(self.index, max(len(self.slides) - 1, 0))
+        self.refresh()
+        if self.slides:
+            self.post_message(self.Highlighted(self.index))
+
+    def render_line(self, y: int) -> Strip:
+        """Format the slide shown on line y of the widget."""
+        index = self.scroll_offset.y + y
+        width = self.scrollable_content_region.width
+        if index >= len(self.slides):
+            return Strip.blank(width, self.rich_style)
+
+        if index == self.index:
+            style = self.get_component_rich_style("slide-list--cursor")
+        else:
+            style = self.rich_style
+        row = self.format_row(self.slides[index]).translate(_ROW_WHITESPACE)
+        return Strip([Segment(row, style)]).crop_extend(0, width, style)
+
+    def move_cursor(self, index: int) -> None:
+        """Highlight a slide, scrolling it into view."""
+        if not self.slides:
+            return
+        index = max(0, min(index, len(self.slides) - 1))
+        if index != self.index:
+            self.refresh_line(self.index)
+            self.index = index
+            self.refresh_line(index)
+            self.post_message(self.Highlighted(index))
+        self.scroll_to_region(Region(0, index, 1, 1), animate=False)
+
+    def action_cursor_up(self) -> None:
+        self.move_cursor(self.index - 1)
+
+    def action_cursor_down(self) -> None:
+        self.move_cursor(self.index + 1)
 
-from google_slidebot.slides import Slide
+    def action_cursor_page_up(self) -> None:
+        self.move_cursor(self.index - self.scrollable_content_region.height)
+
+    def action_cursor_page_down(self) -> None:
+        self.move_cursor(self.index + self.scrollable_content_region.height)
+
+    def action_cursor_first(self) -> None:
+        self.move_cursor(0)
+
+    def action_cursor_last(self) -> None:
+        self.move_cursor(len(self.slides) - 1)
+
+    def action_select(self) -> None:
+        if self.slides:
+            self.post_message(self.Selected(self.index))
+
+    def on_click(self, event: events.Click) -> None:
+        """Select the clicked slide."""
+        index = self.scroll_offset.y + event.y
+        if index < len(self.slides):
+            self.move_cursor(index)
+            self.action_select()
 
 
 class SlideListScreen(Screen):
     """Screen showing list of slides."""
 
-    BINDINGS = [
+    AUTO_FOCUS = "#slide-list"
+
+    BINDINGS: ClassVar[list[BindingType]] = [
         Binding("q", "quit", "Quit"),
         Binding("escape", "quit", "Quit"),
+        Binding("c", "connect_zoom", "Reconnect Zoom"),
+        Binding("slash", "search", "Search"),
     ]
 
-    def __init__(self, slides: list[Slide], **kwargs):
+    def __init__(
+        self,
+        slides: list[Slide],
+        broken_links: dict[str, str] | None = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self.slides = slides
+        # Broken URLs and why, filled in by the app's link check
+        self.broken_links = broken_links if broken_links is not None else {}
+        # The slides shown, in order: all of them, or those matching a search
+        self.shown_slides = list(slides)
+        self.filter_text = ""
+
+    def _format_item(self, slide: Slide) -> str:
+        """Build the display string for one slide."""
+        if not slide.loaded:
+            return f"{slide.number:2d}. (? links) {slide.title}"
+        link_count = len(slide.links)
+        link_text = f"{link_count} link{'s' if link_count != 1 else ''}"
+        broken = sum(1 for link in slide.links if link.url in self.broken_links)
+        if broken:
+            link_text += f", {broken} broken"
+        return f"{slide.number:2d}. ({link_text}) {slide.title}"
 
-    def _build_list_items(self) -> list[str]:
-        """Build display strings for each slide."""
-        items = []
-        for slide in self.slides:
-            link_count = len(slide.links)
-            link_text = f"({link_count} link{'s' if link_count != 1 else ''})"
-            items.append(f"{slide.number:2d}. {link_text} {slide.title}")
-        return items
+    def refresh_slide(self, slide: Slide) -> None:
+        """Redraw a slide's row after its content changed."""
+        slide_list = self.query_one("#slide-list", SlideList)
+        if self.filter_text:
+            # Rows no longer line up with slide numbers
+            slide_list.refresh()
+        else:
+            slide_list.refresh_line(slide.number - 1)
 
     def compose(self) -> ComposeResult:
         yield Header()
-        yield ListView(
-            *[ListItem(Label(item)) for item in self._build_list_items()],
-            id="slide-list",
-        )
+        search = Input(placeholder="Search titles, link text and URLs", id="search")
+        search.display = False
+        yield search
+        yield SlideList(self.shown_slides, self._format_item, id="slide-list")
         yield Footer()
 
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
-        """Handle item selection from ListView."""
-        index = event.list_view.index
-        if index is not None and 0 <= index < len(self.slides):
-            self.app.push_screen(LinkPreviewScreen(self.slides[index]))
+    def set_slides(self, slides: list[Slide]) -> None:
+        """Replace the listed slides, e.g. once they have been fetched."""
+        self.slides[:] = slides
+        self._filter(self.filter_text)
+
+    def update_slides(self, slides: list[Slide]) -> list[int]:
+        """Swap in an edited version of the deck, keeping the cursor.
+
+        Only slides that differ are replaced, so unchanged Slide objects
+        (and anything cached against them) survive, and only their rows
+        are redrawn.
+
+        Returns:
+            Indexes of the slides that were added or changed
+        """
+        changed = diff_slides(self.slides, slides)
+        resized = len(slides) != len(self.slides)
+        if not changed and not resized:
+            return changed
+
+        for index in changed:
+            if index < len(self.slides):
+                self.slides[index] = slides[index]
+            else:
+                self.slides.append(slides[index])
+        del self.slides[len(slides) :]
+
+        slide_list = self.query_one("#slide-list", SlideList)
+        if self.filter_text:
+            # The search index doesn't know about the edits yet, so keep
+            # the same matches but show their edited slides; the app calls
+            # refilter() once the index has caught up
+            self.shown_slides[:] = [
+                self.slides[shown.number - 1]
+                for shown in self.shown_slides
+                if shown.number <= len(self.slides)
+            ]
+            slide_list.reset()
+        elif resized:
+            self.shown_slides[:] = self.slides
+            slide_list.reset()
+        else:
+            for index in changed:
+                self.shown_slides[index] = self.slides[index]
+                slide_list.refresh_line(index)
+        return changed
+
+    def _filter(self, query: str) -> None:
+        """Show only the slides matching a search, from the top."""
+        self.filter_text = query.strip()
+        if self.filter_text:
+            self.shown_slides[:] = self.app.find_slides(self.filter_text)
+        else:
+            self.shown_slides[:] = self.slides
+        slide_list = self.query_one("#slide-list", SlideList)
+        slide_list.index = 0
+        slide_list.scroll_home(animate=False)
+        slide_list.reset()
+
+    def refilter(self) -> None:
+        """Run the current search again after the search index changed."""
+        if self.filter_text:
+            self.shown_slides[:] = self.app.find_slides(self.filter_text)
+            self.query_one("#slide-list", SlideList).reset()
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Filter the list as the search is typed."""
+        self._filter(event.value)
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Move to the filtered list to pick a slide."""
+        self.query_one("#slide-list", SlideList).focus()
+
+    def on_slide_list_selected(self, event: SlideList.Selected) -> None:
+        """Open the chosen slide's links."""
+        # The list may have been filtered since the message was posted
+        if event.index < len(self.shown_slides):
+            self.app.push_screen(
+                LinkPreviewScreen(self.shown_slides[event.index], self.broken_links)
+            )
+
+    def on_slide_list_highlighted(self, event: SlideList.Highlighted) -> None:
+        """Warm the pages around the highlighted slide."""
+        if event.index < len(self.shown_slides):
+            self.app.prefetch_pages(self.shown_slides[event.index].number - 1)
+
+    def action_search(self) -> None:
+        """Open the search box."""
+        search = self.query_one("#search", Input)
+        search.display = True
+        search.focus()
+
+    def show_slide(self, slide: Slide) -> None:
+        """Move the cursor to a slide, closing a search that hides it."""
+        index = next(
+            (i for i, shown in enumerate(self.shown_slides) if shown is slide), None
+        )
+        if index is None:
+            self._close_search()
+            index = slide.number - 1
+        self.query_one("#slide-list", SlideList).move_cursor(index)
+
+    def _close_search(self) -> bool:
+        """Hide the search box and show every slide; whether it was open."""
+        search = self.query_one("#search", Input)
+        if not search.display:
+            return False
+        search.display = False
+        with search.prevent(Input.Changed):
+            search.value = ""
+        self._filter("")
+        self.query_one("#slide-list", SlideList).focus()
+        return True
 
     def action_quit(self) -> None:
-        """Quit the application."""
-        self.app.exit()
+        """Close the search if one is open, otherwise quit."""
+        if not self._close_search():
+            self.app.exit()
+
+    def action_connect_zoom(self) -> None:
+        """Retry connecting to Zoom."""
+        self.app.connect_zoom()
 
 
 class LinkPreviewScreen(Screen):
-    """Screen showing links for a single slide."""
+    """Screen showing links for a single slide, a page at a time."""
 
-    BINDINGS = [
+    LINKS_PER_PAGE = 20
+
+    BINDINGS: ClassVar[list[BindingType]] = [
         Binding("enter", "send", "Send to Chat"),
         Binding("escape", "back", "Back"),
+        Binding("n,pagedown", "next_page", "Next page"),
+        Binding("p,pageup", "previous_page", "Previous page"),
+        Binding("u", "toggle_usage", "Other slides using links"),
     ]
 
-    def __init__(self, slide: Slide, **kwargs):
+    def __init__(
+        self, slide: Slide, broken_links: dict[str, str] | None = None, **kwargs
+    ):
         super().__init__(**kwargs)
         self.slide = slide
+        self.broken_links = broken_links if broken_links is not None else {}
+        self.page = 0
+        self.show_usage = False
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages the slide's links fill."""
+        return max(1, math.ceil(len(self.slide.links) / self.LINKS_PER_PAGE))
 
     def _build_content(self) -> str:
-        """Build display content for the slide."""
+        """Build display content for the current page of links."""
         lines = [f"Slide {self.slide.number}: {self.slide.title}", ""]
 
-        if not self.slide.links:
+        if not self.slide.loaded:
+            lines.append("Loading links...")
+        elif not self.slide.links:
             lines.append("This slide has no links.")
         else:
-            for i, link in enumerate(self.slide.links, 1):
-                lines.append(f"{i}. {link.text}")
+            start = self.page * self.LINKS_PER_PAGE
+            page_links = self.slide.links[start : start + self.LINKS_PER_PAGE]
+            for i, link in enumerate(page_links, start + 1):
+                where = _LINK_SOURCES.get(link.source, f" ({link.source})")
+                problem = self.broken_links.get(link.url)
+                broken = f" [broken: {problem}]" if problem else ""
+                lines.append(f"{i}. {link.text}{where}{broken}")
                 lines.append(f"   {link.url}")
+                if self.show_usage:
+                    lines.append(f"   {self._describe_usage(link.url)}")
                 lines.append("")
+            if self.page_count > 1:
+                lines.append(
+                    f"Page {self.page + 1} of {self.page_count}"
+                    f" ({len(self.slide.links)} links, n/p to turn)"
+                )
 
         return "\n".join(lines)
 
+    def _describe_usage(self, url: str) -> str:
+        """Say which other slides link to a URL."""
+        numbers = [
+            str(slide.number)
+            for slide in self.app.search.slides_using(url)
+            if slide.number != self.slide.number
+        ]
+        if not numbers:
+            return "(not linked from other slides)"
+        label = "slide" if len(numbers) == 1 else "slides"
+        return f"(also on {label} {', '.join(numbers)})"
+
     def compose(self) -> ComposeResult:
         yield Header()
         yield Static(self._build_content(), id="link-content")
         yield Footer()
 
+    def on_mount(self) -> None:
+        """Load the slide's page if only its title is known."""
+        if not self.slide.loaded:
+            self.run_worker(self._load_slide, thread=True, exclusive=True)
+
+    def _load_slide(self) -> None:
+        """Background worker to fetch the slide's content."""
+        try:
+            self.app.load_page(self.slide)
+        except Exception as e:  # noqa: BLE001 - shown to the user
+            self.app.call_from_thread(
+                self.notify, f"Failed to load slide: {e}", severity="error"
+            )
+            return
+        self.app.call_from_thread(self._show_content)
+
+    def _show_content(self) -> None:
+        """Redraw the link list."""
+        self.query_one("#link-content", Static).update(self._build_content())
+
+    def action_next_page(self) -> None:
+        """Show the next page of links."""
+        if self.page + 1 < self.page_count:
+            self.page += 1
+            self._show_content()
+
+    def action_previous_page(self) -> None:
+        """Show the previous page of links."""
+        if self.page > 0:
+            self.page -= 1
+            self._show_content()
+
+    def action_toggle_usage(self) -> None:
+        """Show or hide which other slides use each link's URL."""
+        self.show_usage = not self.show_usage
+        self._show_content()
+
     def action_send(self) -> None:
-        """Send links to Zoom chat."""
-        # Will be connected to ZoomChat in the app
-        self.app.send_links(self.slide)
+        """Queue links for Zoom chat and go back to the slide list."""
+        if self.app.send_links(self.slide):
+            self.app.pop_screen()
 
     def action_back(self) -> None:
         """Go back to slide list."""
@@ -102,37 +468,397 @@ class SlidebotApp(App):
     }
     """
 
-    def __init__(self, slides: list[Slide], zoom_chat, **kwargs):
+    def __init__(
+        self,
+        slides: list[Slide],
+        zoom_chat,
+        page_loader=None,
+        load_slides: Callable[[], list[Slide]] | None = None,
+        watcher=None,
+        follow_presentation_id: str | None = None,
+        auto_send: bool = False,
+        link_checker=None,
+        **kwargs,
+    ):
+        """Create the app.
+
+        Args:
+            slides: Slides to list, or [] when load_slides fetches them
+            zoom_chat: ZoomChat to send through; connected on mount if needed
+            page_loader: PageLoader when slides were indexed lazily
+            load_slides: Blocking callable fetching the slides, run in a
+                worker thread once the app is up
+            watcher: PresentationWatcher to poll for edits to the deck
+            follow_presentation_id: Presentation whose Chrome tab to follow,
+                moving the selection to the slide being presented
+            auto_send: When following, send each slide's links the first
+                time it is presented
+            link_checker: LinkChecker to check links with once slides load
+        """
         super().__init__(**kwargs)
         self.slides = slides
         self.zoom_chat = zoom_chat
+        self.page_loader = page_loader
+        self.load_slides = load_slides
+        self.watcher = watcher
+        self._watch_worker = None
+        self.follow_presentation_id = follow_presentation_id
+        self.auto_send = auto_send
+        self.follower: SlideFollower | None = None
+        self._auto_sent: set[int] = set()
+        self.link_checker = link_checker
+        self._link_cache_warned = False
+        self.broken_links: dict[str, str] = {}
+        self.slide_list = SlideListScreen(self.slides, self.broken_links)
+        self.messages = MessageCache()
+        self.search = SearchIndex()
+        # Whether self.search holds the current slides; until it does,
+        # searches scan the slides directly
+        self.search_ready = False
+        # Slides that changed while the index was being built, which it may
+        # have read before the change
+        self._changed_while_indexing: list[Slide] = []
+        self._slides_status = ""
+        self._zoom_status = ""
 
     def on_mount(self) -> None:
-        """Push the initial screen."""
-        self.push_screen(SlideListScreen(self.slides))
+        """Push the initial screen and start fetching and connecting.
 
-    def send_links(self, slide: Slide) -> None:
-        """Send slide links to Zoom chat."""
-        from google_slidebot.zoom_chat import format_links_message
+        The slide fetch runs in a worker thread while the Zoom connection
+        runs on this event loop, so startup takes as long as the slower
+        of the two rather than their sum. Playwright's objects stay bound
+        to this loop for later sends.
+        """
+        if self.page_loader:
+            self.page_loader.on_loaded = self._on_page_loaded
+        self.push_screen(self.slide_list)
 
-        if not slide.links:
-            self.notify("No links to send", severity="warning")
+        if self.load_slides:
+            self._set_status(slides="Loading slides...")
+            self.run_worker(self._fetch_slides, thread=True, group="startup")
+        else:
+            self._index_slides()
+        if self.zoom_chat and not self.zoom_chat.connected:
+            self.connect_zoom()
+        if self.watcher:
+            self.set_interval(self.watcher.interval, self._poll_deck)
+
+    def on_ready(self) -> None:
+        """Note when the first frame has been drawn."""
+        mark("tui.ready")
+
+    async def on_unmount(self) -> None:
+        """Stop background page loading and release the browser."""
+        if self.follower:
+            self.follower.stop()
+        if self.page_loader:
+            self.page_loader.close()
+        if self.link_checker:
+            self.link_checker.close()
+        if self.zoom_chat:
+            await self.zoom_chat.disconnect()
+
+    def _set_status(self, slides: str | None = None, zoom: str | None = None) -> None:
+        """Show slide and Zoom progress in the header."""
+        if slides is not None:
+            self._slides_status = slides
+        if zoom is not None:
+            self._zoom_status = zoom
+        self.sub_title = " | ".join(
+            status for status in (self._slides_status, self._zoom_status) if status
+        )
+
+    def _fetch_slides(self) -> None:
+        """Worker thread: fetch slides and hand them to the UI."""
+        try:
+            slides = self.load_slides()
+        except FileNotFoundError as e:
+            self.call_from_thread(self.exit, str(e))
             return
+        except Exception as e:  # noqa: BLE001 - shown to the user
+            self.call_from_thread(self.exit, f"Failed to fetch presentation: {e}")
+            return
+        self.call_from_thread(self._show_slides, slides)
 
-        if not self.zoom_chat:
-            self.notify("Zoom not connected", severity="error")
+    def _show_slides(self, slides: list[Slide]) -> None:
+        """Display fetched slides."""
+        mark("tui.slides_shown", slides=len(slides))
+        self.slide_list.set_slides(slides)
+        self._index_slides()
+        self._show_slide_count()
+        if self.follower and self.follower.current:
+            self._on_presenter_slide(self.follower.current)
+
+    def _show_slide_count(self) -> None:
+        """Show how many slides (and links, once known) are listed."""
+        slides = self.slides
+        if self.page_loader:
+            status = f"{len(slides)} slides"
+        else:
+            status = f"{len(slides)} slides, {sum(len(s.links) for s in slides)} links"
+        self._set_status(slides=status)
+
+    def _index_slides(self) -> None:
+        """Render chat messages and build the search index in the background."""
+        slides = list(self.slides)
+        self.search_ready = False
+        self._changed_while_indexing = []
+        self.run_worker(
+            functools.partial(self.messages.warm, slides),
+            thread=True,
+            group="messages",
+        )
+        self.run_worker(
+            functools.partial(self._build_search_index, slides),
+            thread=True,
+            group="search",
+        )
+        self._check_links(slides)
+
+    def _check_links(self, slides: list[Slide]) -> None:
+        """Check the slides' links in the background, if asked to."""
+        if not self.link_checker:
+            return
+        urls = [link.url for slide in slides for link in slide.links]
+        if urls:
+            self.run_worker(
+                functools.partial(self._run_link_check, urls),
+                thread=True,
+                group="links",
+            )
+
+    def _run_link_check(self, urls: list[str]) -> None:
+        """Worker thread: check URLs and hand the results to the UI."""
+        try:
+            results = self.link_checker.check(urls)
+        except Exception as e:  # noqa: BLE001 - would kill the app
+            self.call_from_thread(
+                self.notify, f"Couldn't check links: {e}", severity="warning"
+            )
             return
+        self.call_from_thread(self._show_link_statuses, results)
+        if self.link_checker.cache_error and not self._link_cache_warned:
+            # Once is enough; lazy decks check links on every page load
+            self._link_cache_warned = True
+            self.call_from_thread(
+                self.notify,
+                f"Couldn't cache link results: {self.link_checker.cache_error}",
+                severity="warning",
+            )
+
+    def _show_link_statuses(self, results: dict) -> None:
+        """Mark broken links in the slide list and any open link view."""
+        newly_broken = 0
+        for url, status in results.items():
+            if status.ok:
+                self.broken_links.pop(url, None)
+            else:
+                newly_broken += url not in self.broken_links
+                self.broken_links[url] = status.describe()
+
+        self.slide_list.query_one("#slide-list", SlideList).refresh()
+        if isinstance(self.screen, LinkPreviewScreen):
+            self.screen._show_content()
+        if newly_broken:
+            label = "link" if newly_broken == 1 else "links"
+            self.notify(f"{newly_broken} broken {label} found", severity="warning")
+
+    def _build_search_index(self, slides: list[Slide]) -> None:
+        """Worker thread: index the slides, then swap the index in."""
+        index = SearchIndex(slides)
+        self.call_from_thread(self._use_search_index, index)
+
+    def _use_search_index(self, index: SearchIndex) -> None:
+        """Search with a newly built index from now on."""
+        for slide in self._changed_while_indexing:
+            index.update(slide)
+        self._changed_while_indexing = []
+        self.search = index
+        self.search_ready = True
+        self.slide_list.refilter()
+
+    def _reindex(self, slide: Slide) -> None:
+        """Update a changed slide in the search index, and in one being built."""
+        self.search.update(slide)
+        if not self.search_ready:
+            self._changed_while_indexing.append(slide)
+
+    def find_slides(self, query: str) -> list[Slide]:
+        """Find the slides matching a search, with the index once it's built."""
+        if self.search_ready:
+            return self.search.search(query)
+        return scan(self.slides, query)
+
+    def _poll_deck(self) -> None:
+        """Check for edits to the deck, unless a check is still running."""
+        if self._watch_worker is None or self._watch_worker.is_finished:
+            self._watch_worker = self.run_worker(
+                self._check_deck, thread=True, group="watch"
+            )
+
+    def _check_deck(self) -> None:
+        """Worker thread: poll the revision and refetch if it changed."""
+        try:
+            slides = self.watcher.check()
+        except Exception as e:  # noqa: BLE001 - shown to the user
+            self.call_from_thread(
+                self.notify, f"Couldn't check for deck edits: {e}", severity="warning"
+            )
+            return
+        if slides is not None:
+            self.call_from_thread(self._apply_deck_edits, slides)
+
+    def _apply_deck_edits(self, slides: list[Slide]) -> None:
+        """Patch the slide list with an edited deck."""
+        resized = len(slides) != len(self.slides)
+        changed = self.slide_list.update_slides(slides)
+        if not changed and not resized:
+            return
+
+        if resized:
+            self._index_slides()
+        else:
+            changed_slides = [self.slides[index] for index in changed]
+            for slide in changed_slides:
+                self.messages.invalidate(slide)
+                self._reindex(slide)
+            self.slide_list.refilter()
+            self._check_links(changed_slides)
+            self.run_worker(
+                functools.partial(self.messages.warm, changed_slides),
+                thread=True,
+                group="messages",
+            )
+
+        label = "slide" if len(changed) == 1 else "slides"
+        self.notify(f"Deck edited: {len(changed)} {label} updated")
+        self._show_slide_count()
+
+    def connect_zoom(self) -> None:
+        """Connect to Zoom in the background."""
+        if self.zoom_chat and not self.zoom_chat.connected:
+            self.run_worker(self._connect_zoom(), group="zoom", exclusive=True)
+
+    async def _connect_zoom(self) -> None:
+        """Worker: connect to the Zoom page over CDP."""
+        self._set_status(zoom="Zoom: connecting...")
+        try:
+            readiness = await self.zoom_chat.connect(wait=ZOOM_PAGE_WAIT)
+        except Exception as e:  # noqa: BLE001 - would kill the app
+            # Left to the worker, any error would take the whole app down
+            self._set_status(zoom="Zoom: not connected (c to retry)")
+            self.notify(str(e), severity="error", timeout=10)
+            return
+
+        mark("tui.zoom_connected", ready=readiness.ready)
+        self._set_status(zoom=f"Zoom: {readiness.summary()}")
+        if not readiness.ready:
+            message = f"Zoom {readiness.summary()}"
+            if readiness.error:
+                message += f": {readiness.error}"
+            self.notify(message, severity="warning", timeout=10)
+        self._follow_presenter()
+
+    def _follow_presenter(self) -> None:
+        """Track the presented slide through the Zoom connection's browser."""
+        if not self.follow_presentation_id:
+            return
+        if self.follower:
+            self.follower.stop()
+        self.follower = SlideFollower(
+            self.zoom_chat.browser,
+            self.follow_presentation_id,
+            self._on_presenter_slide,
+        )
+        if not self.follower.start():
+            self.notify(
+                "Following: open the presentation in Chrome to start", timeout=10
+            )
+
+    def _on_presenter_slide(self, ref: str) -> None:
+        """Select the slide being presented, sending its links if asked."""
+        slide = find_slide(self.slides, ref)
+        if slide is None:
+            # Slides not fetched yet; _show_slides catches up
+            return
+        self.slide_list.show_slide(slide)
+        if self.auto_send and slide.number not in self._auto_sent:
+            self._auto_sent.add(slide.number)
+            self._auto_send(slide)
+
+    def _auto_send(self, slide: Slide) -> None:
+        """Send a presented slide's links, loading them first if needed."""
+        if not slide.loaded:
+            self.run_worker(
+                functools.partial(self._load_and_send, slide),
+                thread=True,
+                group="follow",
+            )
+        elif chat_links(slide):
+            self.send_links(slide)
+
+    def _load_and_send(self, slide: Slide) -> None:
+        """Worker thread: load a lazily indexed slide, then send it."""
+        try:
+            self.load_page(slide)
+        except Exception as e:  # noqa: BLE001 - shown to the user
+            self.call_from_thread(
+                self.notify, f"Failed to load slide: {e}", severity="error"
+            )
+            return
+        self.call_from_thread(self._auto_send, slide)
+
+    def load_page(self, slide: Slide) -> Slide:
+        """Load a lazily indexed slide's content (blocking)."""
+        if slide.loaded or not self.page_loader:
+            return slide
+        return self.page_loader.load(slide)
+
+    def prefetch_pages(self, index: int) -> None:
+        """Prefetch pages around a slide when loading lazily."""
+        if self.page_loader:
+            self.page_loader.prefetch(self.slides, index)
+
+    def _on_page_loaded(self, slide: Slide) -> None:
+        """Update the slide's row once its page arrives (loader thread)."""
+        self.messages.get(slide)
+        self.call_from_thread(self._refresh_slide, slide)
+
+    def _refresh_slide(self, slide: Slide) -> None:
+        """Re-index and redraw a slide whose page has loaded."""
+        self._reindex(slide)
+        self.slide_list.refresh_slide(slide)
+        self._check_links([slide])
+
+    def send_links(self, slide: Slide) -> bool:
+        """Queue slide links for Zoom chat.
+
+        Returns:
+            Whether a message was queued
+        """
+        if not slide.loaded:
+            self.notify("Slide is still loading", severity="warning")
+            return False
+
+        if not chat_links(slide):
+            # Links to other slides and in speaker notes aren't sent
+            self.notify("No links to send", severity="warning")
+            return False
+
+        if not self.zoom_chat or not self.zoom_chat.connected:
+            self.notify("Zoom not connected", severity="error")
+            return False
 
-        message = format_links_message(slide)
+        message = self.messages.get(slide)
 
-        # Run async send in background
-        self.run_worker(self._send_to_zoom(message))
+        # ZoomChat sends queued messages one at a time, in order
+        self.run_worker(self._send_to_zoom(slide, message), group="send")
+        return True
 
-    async def _send_to_zoom(self, message: str) -> None:
+    async def _send_to_zoom(self, slide: Slide, message: str) -> None:
         """Background worker to send message."""
         try:
-            await self.zoom_chat.send_message(message)
-            self.notify("Sent!", severity="information")
-            self.pop_screen()  # Back to slide list
-        except Exception as e:
+            send_ms = await self.zoom_chat.queue_message(message)
+            self.notify(f"Sent slide {slide.number} ({send_ms:.0f} ms)")
+        except Exception as e:  # noqa: BLE001 - shown to the user
             self.notify(f"Send failed: {e}", severity="error")
@@ -1,55 +1,475 @@
 """Zoom chat integration via Chrome CDP."""
 
-from playwright.async_api import async_playwright, Page
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import unicodedata
+import urllib.request
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from google_slidebot.config import (
+    CDP_URL,
+    CHAT_MAX_MESSAGE_LENGTH,
+    CHAT_QUEUE_SIZE,
+    CHAT_SEND_BURST,
+    CHAT_SEND_RATE,
+)
+from google_slidebot.slides import Link, Slide
+from google_slidebot.tracing import span
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+# Defines window.__slidebotSend(text) in the Zoom page. It is installed once
+# at connect() and as an init script, so Chrome compiles it once per page
+# load rather than on every send. The iframe document and chat elements are
+# cached between sends and looked up again only once they leave the DOM.
+SENDER_SCRIPT = """
+(() => {
+    if (window.__slidebotSend) return;
+
+    let iframeDoc = null;
+    let chatInput = null;
+    let sendBtn = null;
+
+    const live = (el) => el && el.isConnected;
+
+    function chatDocument() {
+        const iframe = document.querySelector('iframe#webclient');
+        if (!iframe) throw new Error('Zoom iframe not found');
+
+        const doc = iframe.contentDocument || iframe.contentWindow.document;
+        if (!doc) throw new Error('Cannot access iframe document');
+
+        if (doc !== iframeDoc) {
+            iframeDoc = doc;
+            chatInput = null;
+            sendBtn = null;
+        }
+        return doc;
+    }
+
+    // Resolve with check()'s first truthy result, re-running it whenever the
+    // document changes, instead of sleeping for a fixed time.
+    function waitFor(doc, check, timeoutMs, message) {
+        const found = check();
+        if (found) return Promise.resolve(found);
+
+        return new Promise((resolve, reject) => {
+            const observer = new MutationObserver(() => {
+                const result = check();
+                if (result) {
+                    clearTimeout(timer);
+                    observer.disconnect();
+                    resolve(result);
+                }
+            });
+            const timer = setTimeout(() => {
+                observer.disconnect();
+                reject(new Error(message));
+            }, timeoutMs);
+            observer.observe(doc, {
+                childList: true,
+                subtree: true,
+                attributes: true,
+                attributeFilter: ['disabled', 'aria-disabled'],
+            });
+        });
+    }
+
+    const INPUT_TIMEOUT_MS = 3000;
+    const SEND_ENABLED_TIMEOUT_MS = 2000;
+
+    function findInput(doc) {
+        if (!live(chatInput)) chatInput = doc.querySelector('.tiptap.ProseMirror');
+        return chatInput;
+    }
+
+    function findSendButton(doc) {
+        if (!live(sendBtn)) sendBtn = doc.querySelector('button[aria-label="send"]');
+        return sendBtn;
+    }
+
+    function findEnabledSendButton(doc) {
+        const button = findSendButton(doc);
+        if (!button || button.disabled) return null;
+        if (button.getAttribute('aria-disabled') === 'true') return null;
+        return button;
+    }
+
+    // Open chat panel if needed and wait for the input to mount
+    async function openChat(doc) {
+        if (findInput(doc)) return;
+        const openBtn = doc.querySelector('button[aria-label="open the chat panel"]');
+        if (!openBtn) throw new Error('Chat input not found');
+        openBtn.click();
+        await waitFor(doc, () => findInput(doc), INPUT_TIMEOUT_MS, 'Chat input not found');
+    }
+
+    function readiness() {
+        const report = { iframe: false, input: false, sendButton: false, error: '' };
+        try {
+            const doc = chatDocument();
+            report.iframe = true;
+            report.input = !!findInput(doc);
+            report.sendButton = !!findSendButton(doc);
+        } catch (e) {
+            report.error = e.message;
+        }
+        return report;
+    }
+
+    // Re-open the chat panel if it closes, so the next send finds it ready.
+    // Checks are debounced: the meeting DOM changes constantly.
+    let watchedDoc = null;
+    let recheck = null;
+    function watch(doc) {
+        if (doc === watchedDoc) return;
+        watchedDoc = doc;
+        new MutationObserver(() => {
+            if (recheck || doc !== iframeDoc || live(chatInput)) return;
+            recheck = setTimeout(() => {
+                recheck = null;
+                window.__slidebotPrepare().catch(() => {});
+            }, 250);
+        }).observe(doc, { childList: true, subtree: true });
+    }
+
+    window.__slidebotPrepare = async () => {
+        try {
+            const doc = chatDocument();
+            await openChat(doc);
+            watch(doc);
+        } catch (e) {
+            // Reported through readiness() below
+        }
+        return readiness();
+    };
+
+    window.__slidebotSend = async (text) => {
+        const doc = chatDocument();
+        const view = doc.defaultView;
+
+        await openChat(doc);
+
+        // Focus and insert text
+        chatInput.focus();
+        doc.execCommand('insertText', false, text);
+
+        // Dispatch input event to enable send button
+        chatInput.dispatchEvent(new Event('input', { bubbles: true }));
+
+        // Wait for the send button to enable
+        const button = await waitFor(
+            doc, () => findEnabledSendButton(doc), SEND_ENABLED_TIMEOUT_MS,
+            'Send button not found or never enabled');
+
+        // Click send with full mouse event sequence
+        for (const type of ['mousedown', 'mouseup', 'click']) {
+            button.dispatchEvent(new MouseEvent(type, { bubbles: true, cancelable: true, view }));
+        }
+
+        return { success: true };
+    };
+})();
+"""
+
+# Opens the chat panel and reports which parts of the chat UI were found
+PREPARE_CALL = """
+() => window.__slidebotPrepare
+    ? window.__slidebotPrepare()
+    : { installed: false }
+"""
+
+# Per-send call: only the message text crosses the CDP connection
+SEND_CALL = """
+(text) => window.__slidebotSend
+    ? window.__slidebotSend(text)
+    : { installed: false }
+"""
+
 
-from google_slidebot.config import CDP_URL
-from google_slidebot.slides import Slide
+NO_ZOOM_PAGE_MESSAGE = (
+    "No Zoom meeting page found. Navigate to your Zoom meeting in Chrome first."
+)
+
+
+def is_zoom_url(url: str) -> bool:
+    """Whether url is on a zoom.us host."""
+    host = urlsplit(url).hostname or ""
+    return host == "zoom.us" or host.endswith(".zoom.us")
+
+
+async def list_page_targets(cdp_url: str = CDP_URL) -> list[dict]:
+    """List Chrome's open pages without attaching to any of them.
+
+    Args:
+        cdp_url: Chrome remote debugging endpoint
+
+    Returns:
+        Target descriptions from /json/list with type "page"
+
+    Raises:
+        OSError: If Chrome isn't reachable
+    """
+
+    def fetch():
+        with urllib.request.urlopen(f"{cdp_url}/json/list", timeout=2) as response:
+            return json.load(response)
+
+    targets = await asyncio.to_thread(fetch)
+    return [target for target in targets if target.get("type") == "page"]
+
+
+@dataclass
+class ChatReadiness:
+    """Which parts of Zoom's chat UI could be found in the meeting page."""
+
+    iframe: bool = False
+    input: bool = False
+    send_button: bool = False
+    error: str = ""
+
+    @property
+    def ready(self) -> bool:
+        """Whether everything needed to send is present."""
+        return self.iframe and self.input and self.send_button
+
+    def summary(self) -> str:
+        """One-line description for the user."""
+        if self.ready:
+            return "chat ready"
+        missing = [
+            name
+            for name, found in (
+                ("meeting iframe", self.iframe),
+                ("chat input", self.input),
+                ("send button", self.send_button),
+            )
+            if not found
+        ]
+        return f"chat not ready, missing {', '.join(missing)}"
+
+
+class TokenBucket:
+    """Token-bucket rate limiter for asyncio tasks."""
+
+    def __init__(self, rate: float, capacity: int):
+        """Create a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held, i.e. the allowed burst
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last update."""
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        self._refill()
+        while self.tokens < 1:
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+            self._refill()
+        self.tokens -= 1
 
 
 class ZoomChat:
-    """Manages Zoom chat interaction via Chrome DevTools Protocol."""
+    """Manages Zoom chat interaction via Chrome DevTools Protocol.
 
-    def __init__(self):
+    Messages go through queue_message(), which feeds a single sender task:
+    sends happen one at a time in order, are rate limited to stay under
+    Zoom's chat throttling, and callers wait when the queue is full.
+    """
+
+    def __init__(
+        self,
+        coalesce: bool = False,
+        rate: float = CHAT_SEND_RATE,
+        burst: int = CHAT_SEND_BURST,
+        queue_size: int = CHAT_QUEUE_SIZE,
+    ):
+        """Create an unconnected ZoomChat.
+
+        Args:
+            coalesce: Combine messages queued behind a send into one message
+            rate: Sustained messages per second
+            burst: Messages that may be sent back-to-back
+            queue_size: Queued messages before queue_message() waits
+        """
         self.playwright = None
         self.browser = None
         self.page: Page | None = None
+        self.last_send_ms: float | None = None
+        self.readiness = ChatReadiness()
+        self.coalesce = coalesce
+        self._bucket = TokenBucket(rate, burst)
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future]] = asyncio.Queue(
+            maxsize=queue_size
+        )
+        self._sender: asyncio.Task | None = None
+
+    async def connect(self, wait: float = 0) -> ChatReadiness:
+        """Connect to Chrome, find Zoom meeting page and prepare the chat.
+
+        Chrome's target list is read over its DevTools HTTP endpoint first,
+        which attaches to nothing, so a missing browser or meeting tab fails
+        fast. With wait, a meeting tab opened later is picked up from
+        Playwright's page and navigation events as soon as it appears.
+
+        The chat panel is opened and its elements located now, so the first
+        send doesn't pay for it, and the page keeps the panel open after.
 
-    async def connect(self) -> None:
-        """Connect to Chrome and find Zoom meeting page.
+        Args:
+            wait: Seconds to wait for a Zoom tab to appear, if none is open
+
+        Returns:
+            Readiness report for the chat UI, also kept in self.readiness
 
         Raises:
             RuntimeError: If Chrome not reachable or Zoom page not found
         """
-        self.playwright = await async_playwright().start()
+        with span("zoom.connect", wait=wait):
+            return await self._connect(wait)
+
+    async def _connect(self, wait: float) -> ChatReadiness:
+        """connect(), inside its span."""
+        try:
+            with span("zoom.list_targets"):
+                targets = await list_page_targets()
+        except (OSError, ValueError) as e:
+            raise RuntimeError(
+                f"Cannot connect to Chrome at {CDP_URL}. "
+                "Start Chrome with --remote-debugging-port=9222"
+            ) from e
+
+        if not wait and not any(is_zoom_url(t.get("url", "")) for t in targets):
+            raise RuntimeError(NO_ZOOM_PAGE_MESSAGE)
+
+        with span("zoom.playwright_start"):
+            from playwright.async_api import async_playwright
+
+            self.playwright = await async_playwright().start()
 
         try:
-            self.browser = await self.playwright.chromium.connect_over_cdp(CDP_URL)
+            with span("zoom.connect_cdp"):
+                self.browser = await self.playwright.chromium.connect_over_cdp(CDP_URL)
         except Exception as e:
+            await self.disconnect()
             raise RuntimeError(
                 f"Cannot connect to Chrome at {CDP_URL}. "
                 "Start Chrome with --remote-debugging-port=9222"
             ) from e
 
-        # Find Zoom page
+        page = self._find_zoom_page()
+        if page is None and wait:
+            with span("zoom.wait_for_page"):
+                page = await self._wait_for_zoom_page(wait)
+        if page is None:
+            await self.disconnect()
+            raise RuntimeError(NO_ZOOM_PAGE_MESSAGE)
+
+        self.page = page
+        try:
+            with span("zoom.install_sender"):
+                await self._install_sender()
+            with span("zoom.check_readiness"):
+                return await self.check_readiness()
+        except Exception as e:
+            # Playwright's own errors, e.g. the tab navigating away while
+            # it is still going through Zoom's join flow
+            await self.disconnect()
+            raise RuntimeError(f"Cannot prepare Zoom chat: {e}") from e
+
+    def _find_zoom_page(self) -> Page | None:
+        """Find an open Zoom page among the pages Playwright knows about."""
         for context in self.browser.contexts:
             for page in context.pages:
-                if "zoom.us" in page.url:
-                    self.page = page
-                    return
+                if is_zoom_url(page.url):
+                    return page
+        return None
 
-        raise RuntimeError(
-            "No Zoom meeting page found. Navigate to your Zoom meeting in Chrome first."
-        )
+    async def _wait_for_zoom_page(self, timeout: float) -> Page | None:
+        """Wait for a tab to open or navigate to Zoom.
+
+        Returns:
+            The Zoom page, or None if none appeared within timeout
+        """
+        found: asyncio.Future = asyncio.get_running_loop().create_future()
+        listeners = []
+
+        def listen(emitter, event, handler):
+            emitter.on(event, handler)
+            listeners.append((emitter, event, handler))
+
+        def watch_page(page):
+            def on_navigated(frame):
+                if (
+                    frame == page.main_frame
+                    and is_zoom_url(frame.url)
+                    and not found.done()
+                ):
+                    found.set_result(page)
+
+            listen(page, "framenavigated", on_navigated)
+            if is_zoom_url(page.url) and not found.done():
+                found.set_result(page)
+
+        for context in self.browser.contexts:
+            listen(context, "page", watch_page)
+            for page in context.pages:
+                watch_page(page)
+
+        try:
+            return await asyncio.wait_for(found, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            for emitter, event, handler in listeners:
+                emitter.remove_listener(event, handler)
+
+    @property
+    def connected(self) -> bool:
+        """Whether a Zoom meeting page has been found."""
+        return self.page is not None
 
     async def disconnect(self) -> None:
-        """Disconnect from Chrome."""
+        """Disconnect from Chrome.
+
+        Messages being sent or still queued fail with RuntimeError.
+        """
+        if self._sender:
+            sender, self._sender = self._sender, None
+            sender.cancel()
+            # Let it fail the messages it was holding before going on
+            await asyncio.wait([sender])
+        while not self._queue.empty():
+            self._fail([self._queue.get_nowait()], RuntimeError("Disconnected"))
+            self._queue.task_done()
         if self.playwright:
             await self.playwright.stop()
+        self.playwright = None
+        self.browser = None
+        self.page = None
 
     async def send_message(self, text: str) -> None:
         """Send a message to Zoom chat.
 
-        Opens chat panel if needed, inserts text, and clicks send.
+        Opens chat panel if needed, inserts text, and clicks send. The time
+        taken is recorded in last_send_ms.
 
         Args:
             text: Message text to send
@@ -60,53 +480,224 @@ class ZoomChat:
         if not self.page:
             raise RuntimeError("Not connected. Call connect() first.")
 
-        # JavaScript to send message via iframe
-        js_code = """
-        async (text) => {
-            const iframe = document.querySelector('iframe#webclient');
-            if (!iframe) throw new Error('Zoom iframe not found');
-
-            const iframeDoc = iframe.contentDocument || iframe.contentWindow.document;
-            if (!iframeDoc) throw new Error('Cannot access iframe document');
-
-            // Open chat panel if needed
-            let chatInput = iframeDoc.querySelector('.tiptap.ProseMirror');
-            if (!chatInput) {
-                const openBtn = iframeDoc.querySelector('button[aria-label="open the chat panel"]');
-                if (openBtn) {
-                    openBtn.click();
-                    await new Promise(r => setTimeout(r, 500));
-                    chatInput = iframeDoc.querySelector('.tiptap.ProseMirror');
-                }
-            }
+        start = time.perf_counter()
+        with span("zoom.send_message", chars=len(text)) as send:
+            result = await self.page.evaluate(SEND_CALL, text)
+            if not result.get("installed", True):
+                # The page navigated before the init script could run
+                send.set(reinstalled=True)
+                await self.page.evaluate(SENDER_SCRIPT)
+                result = await self.page.evaluate(SEND_CALL, text)
+            send.set(success=bool(result.get("success")))
+        self.last_send_ms = (time.perf_counter() - start) * 1000
 
-            if (!chatInput) throw new Error('Chat input not found');
+        if not result.get("success"):
+            raise RuntimeError(f"Failed to send message: {result}")
 
-            // Focus and insert text
-            chatInput.focus();
-            iframeDoc.execCommand('insertText', false, text);
+    async def check_readiness(self) -> ChatReadiness:
+        """Open the chat panel if needed and check its elements are present.
 
-            // Dispatch input event to enable send button
-            chatInput.dispatchEvent(new Event('input', { bubbles: true }));
+        Returns:
+            Readiness report, also kept in self.readiness
 
-            // Wait a moment for button to enable
-            await new Promise(r => setTimeout(r, 100));
+        Raises:
+            RuntimeError: If not connected
+        """
+        if not self.page:
+            raise RuntimeError("Not connected. Call connect() first.")
 
-            // Click send with full mouse event sequence
-            const sendBtn = iframeDoc.querySelector('button[aria-label="send"]');
-            if (!sendBtn) throw new Error('Send button not found');
+        report = await self.page.evaluate(PREPARE_CALL)
+        if not report.get("installed", True):
+            await self.page.evaluate(SENDER_SCRIPT)
+            report = await self.page.evaluate(PREPARE_CALL)
 
-            sendBtn.dispatchEvent(new MouseEvent('mousedown', { bubbles: true, cancelable: true, view: iframe.contentWindow }));
-            sendBtn.dispatchEvent(new MouseEvent('mouseup', { bubbles: true, cancelable: true, view: iframe.contentWindow }));
-            sendBtn.dispatchEvent(new MouseEvent('click', { bubbles: true, cancelable: true, view: iframe.contentWindow }));
+        self.readiness = ChatReadiness(
+            iframe=bool(report.get("iframe")),
+            input=bool(report.get("input")),
+            send_button=bool(report.get("sendButton")),
+            error=report.get("error", ""),
+        )
+        return self.readiness
 
-            return { success: true };
-        }
-        """
+    async def queue_message(self, text: str) -> float:
+        """Queue a message for sending and wait until it has been sent.
 
-        result = await self.page.evaluate(js_code, text)
-        if not result.get("success"):
-            raise RuntimeError(f"Failed to send message: {result}")
+        Args:
+            text: Message text to send
+
+        Returns:
+            Milliseconds the send itself took
+
+        Raises:
+            RuntimeError: If not connected or send fails
+        """
+        self._start_sender()
+        done = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, done))
+        # A disconnect while this caller waited for room stopped the sender
+        self._start_sender()
+        return await done
+
+    def _start_sender(self) -> None:
+        """Start the sender task if it isn't running."""
+        if self._sender is None or self._sender.done():
+            self._sender = asyncio.create_task(self._process_queue())
+
+    @staticmethod
+    def _fail(items: list[tuple[str, asyncio.Future]], error: Exception) -> None:
+        """Raise error to the callers waiting on queued messages."""
+        for _, done in items:
+            if not done.done():
+                done.set_exception(error)
+
+    async def _process_queue(self) -> None:
+        """Sender task: send queued messages in order, rate limited."""
+        carried = None
+        batch = []
+        try:
+            while True:
+                batch = [carried or await self._queue.get()]
+                carried = None
+                if self.coalesce:
+                    length = len(batch[0][0])
+                    while not self._queue.empty():
+                        item = self._queue.get_nowait()
+                        length += len(item[0]) + 2
+                        if length > CHAT_MAX_MESSAGE_LENGTH:
+                            # Too long to join; it starts the next batch
+                            carried = item
+                            break
+                        batch.append(item)
+
+                await self._bucket.acquire()
+                try:
+                    await self.send_message("\n\n".join(text for text, _ in batch))
+                except Exception as e:  # noqa: BLE001 - handed to the callers
+                    self._fail(batch, e)
+                else:
+                    for _, done in batch:
+                        if not done.done():
+                            done.set_result(self.last_send_ms)
+                for _ in batch:
+                    self._queue.task_done()
+                batch = []
+        except asyncio.CancelledError:
+            # Cancelled by disconnect(): nothing taken off the queue is sent
+            held = batch + ([carried] if carried else [])
+            self._fail(held, RuntimeError("Disconnected"))
+            for _ in held:
+                self._queue.task_done()
+            raise
+
+    async def _install_sender(self) -> None:
+        """Define the send routine in the page, now and after navigations."""
+        await self.page.add_init_script(SENDER_SCRIPT)
+        await self.page.evaluate(SENDER_SCRIPT)
+
+
+# ASCII replacements for characters that Unicode decomposition (NFKD)
+# doesn't reduce to ASCII, or reduces badly
+ASCII_REPLACEMENTS = {
+    # Quotes and primes
+    "\u2018": "'",  # left single quote
+    "\u2019": "'",  # right single quote
+    "\u201a": "'",  # single low-9 quote
+    "\u201b": "'",  # single high-reversed-9 quote
+    "\u2032": "'",  # prime
+    "\u201c": '"',  # left double quote
+    "\u201d": '"',  # right double quote
+    "\u201e": '"',  # double low-9 quote
+    "\u201f": '"',  # double high-reversed-9 quote
+    "\u2033": '"',  # double prime
+    "\u00ab": '"',  # left guillemet
+    "\u00bb": '"',  # right guillemet
+    "\u2039": "'",  # single left guillemet
+    "\u203a": "'",  # single right guillemet
+    # Dashes and hyphens
+    "\u2010": "-",  # hyphen
+    "\u2011": "-",  # non-breaking hyphen
+    "\u2012": "-",  # figure dash
+    "\u2013": "-",  # en dash
+    "\u2014": "-",  # em dash
+    "\u2015": "-",  # horizontal bar
+    "\u2212": "-",  # minus sign
+    # Spaces (NFKD maps most to " ") and invisible characters
+    "\u00a0": " ",  # non-breaking space
+    "\u00ad": "",  # soft hyphen
+    "\u200b": "",  # zero width space
+    "\u200c": "",  # zero width non-joiner
+    "\u200d": "",  # zero width joiner
+    "\u2060": "",  # word joiner
+    "\ufeff": "",  # byte order mark
+    # Punctuation
+    "\u2026": "...",  # ellipsis
+    "\u2022": "*",  # bullet
+    "\u2023": "*",  # triangular bullet
+    "\u25e6": "*",  # white bullet
+    "\u2043": "*",  # hyphen bullet
+    "\u2219": "*",  # bullet operator
+    "\u00b7": ".",  # middle dot
+    "\u2044": "/",  # fraction slash
+    "\u00d7": "x",  # multiplication sign
+    "\u00f7": "/",  # division sign
+    "\u2190": "<-",  # leftwards arrow
+    "\u2192": "->",  # rightwards arrow
+    "\u2194": "<->",  # left right arrow
+    "\u21d2": "=>",  # rightwards double arrow
+    # Symbols
+    "\u00a9": "(c)",
+    "\u00ae": "(R)",
+    "\u2122": "(TM)",
+    "\u20ac": "EUR",
+    "\u00a3": "GBP",
+    # Letters without a decomposition
+    "\u00df": "ss",
+    "\u00e6": "ae",
+    "\u00c6": "AE",
+    "\u0153": "oe",
+    "\u0152": "OE",
+    "\u00f8": "o",
+    "\u00d8": "O",
+    "\u0111": "d",
+    "\u0110": "D",
+    "\u00f0": "d",
+    "\u00d0": "D",
+    "\u0142": "l",
+    "\u0141": "L",
+    "\u00fe": "th",
+    "\u00de": "Th",
+    "\u0131": "i",
+}
+
+
+def _transliterate(char: str) -> str:
+    """Work out the ASCII form of a single non-ASCII character.
+
+    Uses ASCII_REPLACEMENTS where there is an entry, otherwise decomposes
+    the character with NFKD (so accented letters lose their accents and
+    compatibility forms like ligatures and full-width letters are
+    unfolded). Anything left with no ASCII form is dropped.
+    """
+    if char in ASCII_REPLACEMENTS:
+        return ASCII_REPLACEMENTS[char]
+    return "".join(
+        part if part.isascii() else ASCII_REPLACEMENTS.get(part, "")
+        for part in unicodedata.normalize("NFKD", char)
+    )
+
+
+# str.translate() table, precompiled for ASCII, Latin-1 and Latin
+# Extended-A plus everything in ASCII_REPLACEMENTS. Other characters are
+# added the first time they're seen. ASCII maps to itself explicitly because
+# translate() pays for a raised LookupError on every character it can't find,
+# and it's a plain dict because subclasses are looked up the slow way.
+_ASCII_TABLE = {codepoint: chr(codepoint) for codepoint in range(0x80)}
+_ASCII_TABLE.update(
+    (codepoint, _transliterate(chr(codepoint))) for codepoint in range(0x80, 0x180)
+)
+_ASCII_TABLE.update(
+    (ord(char), replacement) for char, replacement in ASCII_REPLACEMENTS.items()
+)
 
 
 def normalize_to_ascii(text: str) -> str:
@@ -116,50 +707,114 @@ def normalize_to_ascii(text: str) -> str:
         text: String that may contain unicode characters
 
     Returns:
-        ASCII-safe string with common replacements
+        ASCII-only string, transliterated in a single pass
     """
-    replacements = {
-        # Curly quotes
-        "\u2018": "'",  # '
-        "\u2019": "'",  # '
-        "\u201c": '"',  # "
-        "\u201d": '"',  # "
-        # Dashes
-        "\u2013": "-",  # en dash
-        "\u2014": "-",  # em dash
-        # Ellipsis
-        "\u2026": "...",
-        # Bullet
-        "\u2022": "*",
-        # Non-breaking space
-        "\u00a0": " ",
-    }
-    for unicode_char, ascii_char in replacements.items():
-        text = text.replace(unicode_char, ascii_char)
-    return text
+    if text.isascii():
+        return text
+    result = text.translate(_ASCII_TABLE)
+    if not result.isascii():
+        # Characters missing from the table pass through unchanged, so
+        # whatever is still non-ASCII is new: learn it and go again
+        for char in set(result):
+            if not char.isascii():
+                _ASCII_TABLE[ord(char)] = _transliterate(char)
+        result = result.translate(_ASCII_TABLE)
+    return result
+
+
+def chat_links(slide: Slide) -> list[Link]:
+    """The links of a slide that go into its chat message.
+
+    Links to other slides in the deck are left out, since they only work
+    from inside the presentation, and so are links in the speaker notes,
+    which are for the presenter's eyes only.
+
+    Args:
+        slide: Slide whose links to pick
+
+    Returns:
+        The slide's links to send, in order
+    """
+    return [
+        link for link in slide.links if not link.internal and link.source != "notes"
+    ]
 
 
 def format_links_message(slide: Slide) -> str:
     """Format slide links for Zoom chat.
 
+    Only the links chat_links() picks are included.
+
     Args:
         slide: Slide with links to format
 
     Returns:
         Formatted message string (ASCII-safe)
     """
-    if not slide.links:
-        title = normalize_to_ascii(slide.title)
+    links = chat_links(slide)
+    # Text in scripts with no ASCII form (Cyrillic, Greek, CJK, ...)
+    # normalises to nothing; leave it out rather than send a blank
+    title = normalize_to_ascii(slide.title).strip()
+    if not links:
+        if not title:
+            return f"Slide {slide.number} has no links."
         return f"Slide {slide.number} ({title}) has no links."
 
-    title = normalize_to_ascii(slide.title)
-    lines = [f"Links from Slide {slide.number}: {title}"]
-    for link in slide.links:
-        link_text = normalize_to_ascii(link.text)
+    lines = [f"Links from Slide {slide.number}" + (f": {title}" if title else "")]
+    for link in links:
+        link_text = normalize_to_ascii(link.text).strip()
         # Don't repeat URL if the link text is the same as the URL
-        if link_text == link.url:
+        if not link_text or link_text == link.url:
             lines.append(f"- {link.url}")
         else:
             lines.append(f"- {link_text}: {link.url}")
 
     return "\n".join(lines)
+
+
+class MessageCache:
+    """Chat messages for slides, rendered ahead of the send path.
+
+    Entries are keyed by slide number and stay valid while the slide's
+    title and links list are the same objects they were rendered from, so
+    a lookup is a dict access plus two identity checks. Code that changes
+    a slide assigns new title or links values (as PageLoader does), which
+    invalidates its entry automatically; invalidate() drops one explicitly.
+    """
+
+    def __init__(self):
+        self._messages: dict[int, tuple[str, list, str]] = {}
+
+    def get(self, slide: Slide) -> str:
+        """Get the chat message for a slide, rendering it on a miss.
+
+        Args:
+            slide: Slide to get the message for
+
+        Returns:
+            Formatted message string (ASCII-safe)
+        """
+        entry = self._messages.get(slide.number)
+        if entry is not None and entry[0] is slide.title and entry[1] is slide.links:
+            return entry[2]
+
+        message = format_links_message(slide)
+        self._messages[slide.number] = (slide.title, slide.links, message)
+        return message
+
+    def warm(self, slides: list[Slide]) -> None:
+        """Render messages for slides that don't have a current one.
+
+        Args:
+            slides: Slides to render
+        """
+        for slide in slides:
+            self.get(slide)
+
+    def invalidate(self, slide: Slide) -> None:
+        """Forget a slide's message.
+
+        Args:
+            slide: Slide whose message is stale
+        """
+        self._messages.pop(slide.number, None)
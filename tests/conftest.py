@@ -3,6 +3,8 @@
 import pytest
 from click.testing import CliRunner
 
+from google_slidebot.slides import CredentialManager, clear_service_cache
+
 
 @pytest.fixture
 def runner():
@@ -14,3 +16,36 @@ def runner():
 def temp_dir(tmp_path):
     """Create a temporary directory for tests."""
     return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep the presentation cache out of the real config directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr("google_slidebot.cache.CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def no_daemon(tmp_path, monkeypatch):
+    """Never find a daemon the developer happens to be running."""
+    monkeypatch.setattr(
+        "google_slidebot.daemon.DAEMON_SOCKET", tmp_path / "no-daemon.sock"
+    )
+
+
+@pytest.fixture(autouse=True)
+def fresh_service():
+    """Stop the process-wide Slides service leaking between tests."""
+    clear_service_cache()
+    yield
+    clear_service_cache()
+
+
+@pytest.fixture(autouse=True)
+def fresh_credentials(monkeypatch):
+    """Give each test its own credential manager, with no keyring state."""
+    manager = CredentialManager()
+    monkeypatch.setattr("google_slidebot.slides._credential_manager", manager)
+    yield manager
+    manager.close()
@@ -0,0 +1,81 @@
+"""Tests for presentation cache module."""
+
+import threading
+
+from google_slidebot.cache import (
+    load_cached_presentation,
+    load_link_statuses,
+    store_cached_presentation,
+    store_link_statuses,
+)
+
+
+class TestPresentationCache:
+    """Tests for the on-disk presentation cache."""
+
+    def test_load_returns_none_when_missing(self):
+        """Should return None for an uncached presentation."""
+        assert load_cached_presentation("not-cached") is None
+
+    def test_round_trips_presentation(self):
+        """Should load what was stored."""
+        presentation = {"revisionId": "rev1", "slides": [{"pageElements": []}]}
+        store_cached_presentation("deck", presentation)
+        assert load_cached_presentation("deck") == presentation
+
+    def test_misses_when_field_mask_differs(self):
+        """Should not serve a response fetched with another field mask."""
+        presentation = {"revisionId": "rev1", "slides": []}
+        store_cached_presentation("deck", presentation, "revisionId,slides")
+        assert load_cached_presentation("deck", "revisionId,slides") == presentation
+        assert load_cached_presentation("deck") is None
+
+    def test_does_not_cache_without_revision_id(self, isolated_cache):
+        """Should skip responses that can't be validated later."""
+        store_cached_presentation("deck", {"slides": []})
+        assert load_cached_presentation("deck") is None
+        assert not (isolated_cache / "deck.json").exists()
+
+    def test_ignores_corrupt_cache_file(self, isolated_cache):
+        """Should treat an unreadable cache file as a miss."""
+        isolated_cache.mkdir()
+        (isolated_cache / "deck.json").write_text("{not json")
+        assert load_cached_presentation("deck") is None
+
+
+class TestLinkStatusCache:
+    """Tests for the on-disk link check results."""
+
+    def test_round_trips_statuses(self):
+        """Should load what was stored, or nothing before that."""
+        assert load_link_statuses() == {}
+        entries = {"https://a.example": {"url": "https://a.example", "ok": True}}
+        store_link_statuses(entries)
+        assert load_link_statuses() == entries
+
+    def test_ignores_corrupt_file(self, isolated_cache):
+        """Should treat an unreadable results file as empty."""
+        isolated_cache.mkdir()
+        (isolated_cache / "links.json").write_text("[1, 2")
+        assert load_link_statuses() == {}
+
+    def test_concurrent_writes_do_not_collide(self, isolated_cache):
+        """Should let threads write at once without racing on a temp file."""
+        errors = []
+
+        def write(n):
+            for i in range(100):
+                try:
+                    store_link_statuses({f"https://{n}.example": {"n": i}})
+                except OSError as e:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(load_link_statuses()) == 1
+        assert [path.name for path in isolated_cache.iterdir()] == ["links.json"]
@@ -1,9 +1,29 @@
 """Tests for CLI module."""
 
+import json
+import subprocess
+import sys
+
 from click.testing import CliRunner
 from unittest.mock import patch, MagicMock, AsyncMock
 
-from google_slidebot.cli import cli
+from google_slidebot.cli import check_links_cli, cli
+from google_slidebot.slides import Link, Slide
+
+# Subsystems only needed once the CLI actually fetches slides or starts the TUI
+HEAVY_MODULES = [
+    "asyncio",
+    "google.auth",
+    "google_auth_oauthlib",
+    "googleapiclient",
+    "keyring",
+    "playwright",
+    "textual",
+]
+
+# Cumulative import time allowed for google_slidebot.cli. Lazy imports bring
+# it to ~50ms locally; eager imports of the subsystems above cost ~600ms.
+IMPORT_BUDGET_MS = 250
 
 
 class TestCli:
@@ -26,8 +46,8 @@ class TestCli:
 
     @patch("google_slidebot.cli.fetch_presentation")
     @patch("google_slidebot.cli.extract_presentation_id")
-    @patch("google_slidebot.cli.ZoomChat")
-    @patch("google_slidebot.cli.SlidebotApp")
+    @patch("google_slidebot.zoom_chat.ZoomChat")
+    @patch("google_slidebot.tui.SlidebotApp")
     def test_cli_starts_app_with_valid_url(
         self, mock_app_class, mock_zoom, mock_extract, mock_fetch
     ):
@@ -40,7 +60,7 @@ class TestCli:
         mock_zoom.return_value = mock_zoom_instance
 
         mock_app = MagicMock()
-        mock_app.run = MagicMock()
+        mock_app.run = MagicMock(return_value=None)
         mock_app_class.return_value = mock_app
 
         runner = CliRunner()
@@ -51,5 +71,329 @@ class TestCli:
             ],
         )
 
-        # Should have attempted to fetch and run
-        mock_fetch.assert_called_once_with("valid-id-12345678901234567890")
+        # Should have run the app, handing it the fetch to run concurrently
+        mock_app.run.assert_called_once()
+        mock_app_class.call_args.kwargs["load_slides"]()
+        mock_fetch.assert_called_once_with(
+            "valid-id-12345678901234567890", offline=False
+        )
+
+    @patch("google_slidebot.zoom_chat.ZoomChat")
+    @patch("google_slidebot.tui.SlidebotApp")
+    def test_cli_reports_app_error(self, mock_app_class, mock_zoom):
+        """Should exit with the error the app stopped with."""
+        mock_app_class.return_value.run.return_value = "Failed to fetch: boom"
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["valid-id-12345678901234567890"])
+
+        assert result.exit_code != 0
+        assert "boom" in result.output
+
+    @patch("google_slidebot.zoom_chat.ZoomChat")
+    @patch("google_slidebot.tui.SlidebotApp")
+    def test_cli_prints_chrome_instructions_without_zoom(
+        self, mock_app_class, mock_zoom
+    ):
+        """Should explain how to start Chrome if Zoom never connected."""
+        mock_app_class.return_value.run.return_value = None
+        mock_zoom.return_value.connected = False
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["valid-id-12345678901234567890"])
+
+        assert result.exit_code == 0
+        assert "--remote-debugging-port=9222" in result.output
+
+    @patch("google_slidebot.cli.PageLoader")
+    @patch("google_slidebot.cli.fetch_presentation")
+    @patch("google_slidebot.zoom_chat.ZoomChat")
+    @patch("google_slidebot.tui.SlidebotApp")
+    def test_cli_lazy_fetches_index_only(
+        self, mock_app_class, mock_zoom, mock_fetch, mock_loader_class
+    ):
+        """Should fetch the slide index and hand the loader to the app."""
+        mock_loader = mock_loader_class.return_value
+        mock_zoom.return_value.connect = AsyncMock()
+        mock_app_class.return_value.run.return_value = None
+
+        runner = CliRunner()
+        runner.invoke(cli, ["--lazy", "valid-id-12345678901234567890"])
+
+        mock_fetch.assert_not_called()
+        kwargs = mock_app_class.call_args.kwargs
+        assert kwargs["page_loader"] is mock_loader
+        assert kwargs["load_slides"] is mock_loader.fetch_index
+
+    def test_cli_rejects_lazy_with_offline(self):
+        """Should refuse --lazy together with --offline."""
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["--lazy", "--offline", "valid-id-12345678901234567890"]
+        )
+        assert result.exit_code != 0
+        assert "--offline" in result.output
+
+    @patch("google_slidebot.cli.PresentationWatcher")
+    @patch("google_slidebot.zoom_chat.ZoomChat")
+    @patch("google_slidebot.tui.SlidebotApp")
+    def test_cli_watch_hands_watcher_to_app(
+        self, mock_app_class, mock_zoom, mock_watcher_class
+    ):
+        """Should poll the deck at the requested interval."""
+        mock_app_class.return_value.run.return_value = None
+
+        runner = CliRunner()
+        runner.invoke(cli, ["--watch", "30", "valid-id-12345678901234567890"])
+
+        mock_watcher_class.assert_called_once_with(
+            "valid-id-12345678901234567890", 30.0
+        )
+        kwargs = mock_app_class.call_args.kwargs
+        assert kwargs["watcher"] is mock_watcher_class.return_value
+
+    def test_cli_rejects_too_frequent_watch(self):
+        """Should refuse intervals that would hammer the API."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["--watch", "0.5", "valid-id-12345678901234567890"])
+        assert result.exit_code != 0
+        assert "--watch" in result.output
+
+    def test_cli_rejects_watch_with_lazy(self):
+        """Should refuse --watch together with --lazy."""
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["--watch", "30", "--lazy", "valid-id-12345678901234567890"]
+        )
+        assert result.exit_code != 0
+        assert "--lazy" in result.output
+
+    @patch("google_slidebot.zoom_chat.ZoomChat")
+    @patch("google_slidebot.tui.SlidebotApp")
+    def test_cli_follow_passes_presentation_to_app(self, mock_app_class, mock_zoom):
+        """Should follow the deck being presented and auto-send if asked."""
+        mock_app_class.return_value.run.return_value = None
+
+        runner = CliRunner()
+        runner.invoke(cli, ["--follow", "--auto-send", "valid-id-12345678901234567890"])
+
+        kwargs = mock_app_class.call_args.kwargs
+        assert kwargs["follow_presentation_id"] == "valid-id-12345678901234567890"
+        assert kwargs["auto_send"] is True
+
+    def test_cli_rejects_auto_send_without_follow(self):
+        """Should refuse --auto-send on its own."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["--auto-send", "valid-id-12345678901234567890"])
+        assert result.exit_code != 0
+        assert "--follow" in result.output
+
+    @patch("google_slidebot.zoom_chat.ZoomChat")
+    @patch("google_slidebot.tui.SlidebotApp")
+    def test_cli_trace_writes_timeline(self, mock_app_class, mock_zoom, tmp_path):
+        """Should write the session's spans to the --trace file."""
+        mock_app_class.return_value.run.return_value = None
+        trace = tmp_path / "trace.json"
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["--trace", str(trace), "valid-id-12345678901234567890"]
+        )
+
+        assert result.exit_code == 0
+        names = {
+            event["name"] for event in json.loads(trace.read_text())["traceEvents"]
+        }
+        assert {"cli.session", "cli.import_ui", "cli.run_app"} <= names
+
+    @patch("google_slidebot.zoom_chat.ZoomChat")
+    @patch("google_slidebot.tui.SlidebotApp")
+    def test_cli_profile_writes_stats(self, mock_app_class, mock_zoom, tmp_path):
+        """Should save profiling results even when the app fails."""
+        mock_app_class.return_value.run.return_value = "Failed to fetch"
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["--profile", str(tmp_path), "valid-id-12345678901234567890"]
+        )
+
+        assert result.exit_code != 0
+        assert (tmp_path / "session.prof").exists()
+        assert (tmp_path / "summary.txt").exists()
+
+    @patch("google_slidebot.daemon.DaemonClient")
+    @patch("google_slidebot.zoom_chat.ZoomChat")
+    @patch("google_slidebot.tui.SlidebotApp")
+    def test_cli_uses_running_daemon(
+        self, mock_app_class, mock_zoom, mock_client_class
+    ):
+        """Should fetch and send through a daemon when one is running."""
+        from google_slidebot.daemon import RemoteZoomChat
+
+        mock_app_class.return_value.run.return_value = None
+        client = mock_client_class.return_value
+        client.available.return_value = True
+
+        runner = CliRunner()
+        runner.invoke(cli, ["valid-id-12345678901234567890"])
+
+        kwargs = mock_app_class.call_args.kwargs
+        assert isinstance(kwargs["zoom_chat"], RemoteZoomChat)
+        kwargs["load_slides"]()
+        client.fetch_presentation.assert_called_once_with(
+            "valid-id-12345678901234567890", offline=False
+        )
+        mock_zoom.assert_not_called()
+
+    @patch("google_slidebot.daemon.DaemonClient")
+    @patch("google_slidebot.zoom_chat.ZoomChat")
+    @patch("google_slidebot.tui.SlidebotApp")
+    def test_cli_warns_coalesce_is_up_to_daemon(
+        self, mock_app_class, mock_zoom, mock_client_class
+    ):
+        """Should say --coalesce has no effect when sending through a daemon."""
+        mock_app_class.return_value.run.return_value = None
+        mock_client_class.return_value.available.return_value = True
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["--coalesce", "valid-id-12345678901234567890"])
+
+        assert "--coalesce is ignored" in result.output
+
+    @patch("google_slidebot.daemon.DaemonClient")
+    @patch("google_slidebot.zoom_chat.ZoomChat")
+    @patch("google_slidebot.tui.SlidebotApp")
+    def test_cli_no_daemon_works_alone(
+        self, mock_app_class, mock_zoom, mock_client_class
+    ):
+        """Should not look for a daemon with --no-daemon."""
+        mock_app_class.return_value.run.return_value = None
+
+        runner = CliRunner()
+        runner.invoke(cli, ["--no-daemon", "valid-id-12345678901234567890"])
+
+        mock_client_class.assert_not_called()
+        assert mock_app_class.call_args.kwargs["zoom_chat"] is mock_zoom.return_value
+
+
+class TestCheckLinksCli:
+    """Tests for the google-slidebot-check-links command."""
+
+    @patch("google_slidebot.linkcheck.LinkChecker")
+    @patch("google_slidebot.cli.fetch_presentation")
+    def test_lists_broken_links_and_fails(self, mock_fetch, mock_checker_class):
+        """Should print each broken link with its slide and exit non-zero."""
+        from google_slidebot.linkcheck import LinkStatus
+
+        mock_fetch.return_value = [
+            Slide(1, "Intro", [Link("Home", "https://ok.example")]),
+            Slide(3, "Refs", [Link("Old", "https://gone.example")]),
+        ]
+        mock_checker_class.return_value.check.return_value = {
+            "https://ok.example": LinkStatus("https://ok.example", True, 200),
+            "https://gone.example": LinkStatus("https://gone.example", False, 404),
+        }
+        mock_checker_class.return_value.cache_error = None
+
+        runner = CliRunner()
+        result = runner.invoke(
+            check_links_cli, ["--offline", "valid-id-12345678901234567890"]
+        )
+
+        assert result.exit_code == 1
+        assert "Slide 3: Old <https://gone.example> (HTTP 404)" in result.output
+        assert "ok.example" not in result.output
+        mock_fetch.assert_called_once_with(
+            "valid-id-12345678901234567890", offline=True
+        )
+        mock_checker_class.return_value.close.assert_called_once()
+
+    @patch("google_slidebot.linkcheck.LinkChecker")
+    @patch("google_slidebot.cli.fetch_presentation")
+    def test_succeeds_when_all_links_work(self, mock_fetch, mock_checker_class):
+        """Should exit cleanly when nothing is broken."""
+        mock_fetch.return_value = [Slide(1, "Intro", [])]
+        mock_checker_class.return_value.check.return_value = {}
+        mock_checker_class.return_value.cache_error = None
+
+        runner = CliRunner()
+        result = runner.invoke(check_links_cli, ["valid-id-12345678901234567890"])
+
+        assert result.exit_code == 0
+        assert "0 broken" in result.output
+        assert "Warning" not in result.output
+
+    @patch("google_slidebot.linkcheck.LinkChecker")
+    @patch("google_slidebot.cli.fetch_presentation")
+    def test_warns_when_results_cannot_be_cached(self, mock_fetch, mock_checker_class):
+        """Should still report links, with a warning that caching failed."""
+        mock_fetch.return_value = [Slide(1, "Intro", [])]
+        checker = mock_checker_class.return_value
+        checker.check.return_value = {}
+        checker.cache_error = OSError("Read-only file system")
+
+        runner = CliRunner()
+        result = runner.invoke(check_links_cli, ["valid-id-12345678901234567890"])
+
+        assert result.exit_code == 0
+        assert "couldn't cache link results: Read-only file system" in result.stderr
+        assert "0 broken" in result.output
+
+    @patch("google_slidebot.cli.fetch_presentation")
+    def test_reports_fetch_errors(self, mock_fetch):
+        """Should explain a failed fetch rather than print a traceback."""
+        mock_fetch.side_effect = OSError("network unreachable")
+
+        runner = CliRunner()
+        result = runner.invoke(check_links_cli, ["valid-id-12345678901234567890"])
+
+        assert result.exit_code == 1
+        assert "Failed to fetch presentation: network unreachable" in result.output
+
+
+class TestStartup:
+    """Tests keeping CLI startup cheap."""
+
+    def test_import_does_not_load_heavy_modules(self):
+        """Importing the CLI should not import TUI, browser or Google libs."""
+        code = (
+            "import sys, google_slidebot.cli; "
+            f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_import_time_within_budget(self):
+        """Importing the CLI should stay within the import-time budget."""
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import google_slidebot.cli"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        # Lines look like "import time:  self [us] | cumulative | module"
+        line = next(
+            line
+            for line in result.stderr.splitlines()
+            if line.rstrip().endswith("| google_slidebot.cli")
+        )
+        cumulative_ms = int(line.split("|")[1]) / 1000
+        assert cumulative_ms < IMPORT_BUDGET_MS
+
+    def test_version_skips_heavy_imports(self):
+        """--version should answer without loading heavy modules."""
+        code = (
+            "import sys\n"
+            "from google_slidebot.cli import cli\n"
+            "try:\n"
+            "    cli(['--version'])\n"
+            "except SystemExit:\n"
+            f"    print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert "version" in result.stdout
+        assert result.stdout.strip().endswith("[]")
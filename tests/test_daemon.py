@@ -0,0 +1,208 @@
+"""Tests for daemon module."""
+
+import asyncio
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from google_slidebot.daemon import (
+    DaemonClient,
+    DaemonError,
+    RemoteZoomChat,
+    SlidebotDaemon,
+    slide_from_dict,
+    slide_to_dict,
+)
+from google_slidebot.slides import Link, Slide
+from google_slidebot.zoom_chat import ChatReadiness
+
+PRESENTATION = {
+    "revisionId": "r1",
+    "slides": [
+        {
+            "objectId": "p1",
+            "pageElements": [
+                {
+                    "shape": {
+                        "text": {
+                            "textElements": [
+                                {
+                                    "textRun": {
+                                        "content": "Docs",
+                                        "style": {"link": {"url": "https://docs"}},
+                                    }
+                                }
+                            ]
+                        }
+                    }
+                }
+            ],
+        }
+    ],
+}
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to ~100 characters, which pytest's
+    # tmp_path can exceed
+    directory = tempfile.mkdtemp(prefix="slidebot-")
+    yield Path(directory) / "daemon.sock"
+    shutil.rmtree(directory)
+
+
+@pytest.fixture
+def api():
+    """Stand in for the Slides API calls the daemon makes."""
+    with (
+        patch("google_slidebot.daemon.get_service"),
+        patch(
+            "google_slidebot.daemon.fetch_presentation_data",
+            return_value=PRESENTATION,
+        ) as fetch,
+        patch(
+            "google_slidebot.daemon._fetch_full_presentation",
+            return_value=PRESENTATION,
+        ) as refetch,
+        patch(
+            "google_slidebot.daemon.fetch_revision_id", return_value="r1"
+        ) as revision,
+    ):
+        yield MagicMock(fetch=fetch, refetch=refetch, revision=revision)
+
+
+@pytest.fixture
+async def daemon(socket_path, api):
+    """A daemon serving on the test's event loop, with a fake ZoomChat."""
+    zoom_chat = MagicMock(connected=False, readiness=ChatReadiness())
+    zoom_chat.connect = AsyncMock(
+        return_value=ChatReadiness(iframe=True, input=True, send_button=True)
+    )
+    zoom_chat.queue_message = AsyncMock(return_value=12.5)
+    zoom_chat.disconnect = AsyncMock()
+
+    daemon = SlidebotDaemon(socket_path)
+    with patch("google_slidebot.daemon.ZoomChat", return_value=zoom_chat):
+        task = asyncio.create_task(daemon.serve())
+        while not socket_path.exists():
+            await asyncio.sleep(0.01)
+    yield daemon
+    if not task.done():
+        await DaemonClient(socket_path).acall("shutdown")
+    await task
+
+
+class TestSlideSerialisation:
+    """Tests for slide_to_dict and slide_from_dict."""
+
+    def test_round_trips_slides(self):
+        """Should rebuild an equal slide, links and all."""
+        slide = Slide(3, "Refs", [Link("Notes", "https://n", "notes")], "g1", False)
+        assert slide_from_dict(slide_to_dict(slide)) == slide
+
+
+class TestSlidebotDaemon:
+    """Tests for the daemon, through its client."""
+
+    async def test_serves_decks_from_memory_while_unchanged(
+        self, daemon, socket_path, api
+    ):
+        """Should fetch a deck once and then only check its revision."""
+        client = DaemonClient(socket_path)
+
+        first = await asyncio.to_thread(client.fetch_presentation, "deck")
+        again = await asyncio.to_thread(client.fetch_presentation, "deck")
+
+        assert first == again
+        assert first[0].links == [Link("Docs", "https://docs")]
+        api.fetch.assert_called_once_with("deck", False)
+        assert api.revision.call_count == 1
+
+    async def test_refetches_edited_decks(self, daemon, socket_path, api):
+        """Should fetch again once the deck's revision moves on."""
+        client = DaemonClient(socket_path)
+        await asyncio.to_thread(client.fetch_presentation, "deck")
+
+        api.revision.return_value = "r2"
+        await asyncio.to_thread(client.fetch_presentation, "deck")
+
+        # One revision check, then straight to the full fetch
+        api.fetch.assert_called_once()
+        api.refetch.assert_called_once_with("deck")
+        assert api.revision.call_count == 1
+
+    async def test_offline_trusts_memory(self, daemon, socket_path, api):
+        """Should not check revisions offline once a deck is loaded."""
+        client = DaemonClient(socket_path)
+        await asyncio.to_thread(client.fetch_presentation, "deck")
+
+        await asyncio.to_thread(client.fetch_presentation, "deck", offline=True)
+
+        api.revision.assert_not_called()
+        api.fetch.assert_called_once()
+
+    async def test_passes_missing_cache_errors_through(self, daemon, socket_path, api):
+        """Should raise FileNotFoundError in the client, as a local fetch would."""
+        api.fetch.side_effect = FileNotFoundError("No cached copy of deck")
+        client = DaemonClient(socket_path)
+
+        with pytest.raises(FileNotFoundError, match="No cached copy"):
+            await asyncio.to_thread(client.fetch_presentation, "deck", offline=True)
+
+    async def test_shares_one_zoom_connection(self, daemon, socket_path):
+        """Should connect once for every client and send through it."""
+        first = RemoteZoomChat(DaemonClient(socket_path))
+        readiness = await first.connect()
+        await first.disconnect()
+
+        daemon.zoom_chat.connected = True
+        daemon.zoom_chat.check_readiness = AsyncMock(return_value=readiness)
+        second = RemoteZoomChat(DaemonClient(socket_path))
+        await second.connect()
+        sent_ms = await second.queue_message("hello")
+
+        assert readiness.ready and second.connected
+        assert sent_ms == 12.5
+        daemon.zoom_chat.connect.assert_awaited_once()
+        daemon.zoom_chat.disconnect.assert_not_awaited()
+        daemon.zoom_chat.queue_message.assert_awaited_once_with("hello")
+
+    async def test_reports_zoom_failures_as_runtime_errors(self, daemon, socket_path):
+        """Should fail connect() the way ZoomChat does."""
+        daemon.zoom_chat.connect.side_effect = RuntimeError("No Zoom meeting")
+
+        with pytest.raises(RuntimeError, match="No Zoom meeting"):
+            await RemoteZoomChat(DaemonClient(socket_path)).connect()
+
+    async def test_refuses_to_start_twice(self, daemon, socket_path):
+        """Should not take over a socket another daemon is serving."""
+        with pytest.raises(DaemonError, match="already"):
+            await SlidebotDaemon(socket_path).serve()
+
+    async def test_shutdown_removes_socket(self, daemon, socket_path):
+        """Should stop and clean up when asked."""
+        client = DaemonClient(socket_path)
+        assert await asyncio.to_thread(client.available)
+
+        await client.acall("shutdown")
+        while socket_path.exists():
+            await asyncio.sleep(0.01)
+
+        assert not await asyncio.to_thread(client.available)
+
+
+class TestDaemonClient:
+    """Tests for DaemonClient without a daemon."""
+
+    def test_unavailable_without_daemon(self, socket_path):
+        """Should report no daemon for a missing or stale socket."""
+        client = DaemonClient(socket_path)
+        assert not client.available()
+
+        socket_path.touch()
+        assert not client.available()
+        with pytest.raises(DaemonError, match="Cannot reach"):
+            client.fetch_presentation("deck")
@@ -0,0 +1,143 @@
+"""Tests for follow module."""
+
+from unittest.mock import MagicMock
+
+from google_slidebot.follow import SlideFollower, find_slide, parse_slide_ref
+from google_slidebot.slides import Slide
+
+DECK_ID = "1AbCdEfGhIjKlMnOpQrStUvWxYz0123456789"
+DECK_URL = f"https://docs.google.com/presentation/d/{DECK_ID}"
+
+
+class FakeEmitter:
+    """Minimal stand-in for Playwright's event emitters."""
+
+    def __init__(self):
+        self.handlers: dict[str, list] = {}
+
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event, handler):
+        self.handlers[event].remove(handler)
+
+    def emit(self, event, arg):
+        for handler in list(self.handlers.get(event, [])):
+            handler(arg)
+
+
+class FakePage(FakeEmitter):
+    def __init__(self, url):
+        super().__init__()
+        self.main_frame = MagicMock(url=url)
+
+    @property
+    def url(self):
+        return self.main_frame.url
+
+    def navigate(self, url):
+        self.main_frame.url = url
+        self.emit("framenavigated", self.main_frame)
+
+
+class FakeContext(FakeEmitter):
+    def __init__(self, *pages):
+        super().__init__()
+        self.pages = list(pages)
+
+    def open(self, page):
+        self.pages.append(page)
+        self.emit("page", page)
+
+
+class TestParseSlideRef:
+    """Tests for parse_slide_ref."""
+
+    def test_reads_slide_from_fragment(self):
+        """Should read the slide the editor shows."""
+        assert parse_slide_ref(f"{DECK_URL}/edit#slide=id.g12ab", DECK_ID) == "id.g12ab"
+
+    def test_reads_slide_from_query(self):
+        """Should read the slide a presentation window shows."""
+        url = f"{DECK_URL}/present?slide=id.p3&rm=minimal"
+        assert parse_slide_ref(url, DECK_ID) == "id.p3"
+
+    def test_ignores_other_presentations_and_sites(self):
+        """Should only follow the given presentation."""
+        other = "https://docs.google.com/presentation/d/other/edit#slide=id.p1"
+        assert parse_slide_ref(other, DECK_ID) is None
+        fake = f"https://example.com/presentation/d/{DECK_ID}/edit#slide=id.p1"
+        assert parse_slide_ref(fake, DECK_ID) is None
+
+    def test_returns_none_without_slide(self):
+        """Should ignore deck URLs that don't name a slide."""
+        assert parse_slide_ref(f"{DECK_URL}/edit", DECK_ID) is None
+
+
+class TestFindSlide:
+    """Tests for find_slide."""
+
+    def test_finds_by_object_id_or_number(self):
+        """Should resolve both kinds of reference."""
+        slides = [Slide(1, "A", object_id="p1"), Slide(2, "B", object_id="g9")]
+
+        assert find_slide(slides, "id.g9") is slides[1]
+        assert find_slide(slides, "1") is slides[0]
+        assert find_slide(slides, "id.missing") is None
+        assert find_slide(slides, "3") is None
+
+
+class TestSlideFollower:
+    """Tests for SlideFollower."""
+
+    def test_reports_current_slide_on_start(self):
+        """Should report the slide an open deck tab already shows."""
+        zoom = FakePage("https://app.zoom.us/wc/123")
+        deck = FakePage(f"{DECK_URL}/edit#slide=id.p2")
+        browser = MagicMock(contexts=[FakeContext(zoom, deck)])
+        on_slide = MagicMock()
+
+        assert SlideFollower(browser, DECK_ID, on_slide).start()
+        on_slide.assert_called_once_with("id.p2")
+
+    def test_reports_each_slide_change(self):
+        """Should report navigations to new slides, once each."""
+        deck = FakePage(f"{DECK_URL}/edit")
+        browser = MagicMock(contexts=[FakeContext(deck)])
+        on_slide = MagicMock()
+        follower = SlideFollower(browser, DECK_ID, on_slide)
+
+        assert not follower.start()
+        deck.navigate(f"{DECK_URL}/edit#slide=id.p1")
+        deck.navigate(f"{DECK_URL}/edit#slide=id.p1")
+        deck.navigate(f"{DECK_URL}/edit#slide=id.p2")
+
+        assert [c.args for c in on_slide.call_args_list] == [("id.p1",), ("id.p2",)]
+        assert follower.current == "id.p2"
+
+    def test_follows_tabs_opened_later(self):
+        """Should pick up a presentation window opened after start."""
+        context = FakeContext()
+        on_slide = MagicMock()
+        SlideFollower(MagicMock(contexts=[context]), DECK_ID, on_slide).start()
+
+        window = FakePage(f"{DECK_URL}/present?slide=id.p1")
+        context.open(window)
+        window.navigate(f"{DECK_URL}/present?slide=id.p4")
+
+        assert [c.args for c in on_slide.call_args_list] == [("id.p1",), ("id.p4",)]
+
+    def test_stop_removes_listeners(self):
+        """Should no longer report anything once stopped."""
+        deck = FakePage(f"{DECK_URL}/edit")
+        context = FakeContext(deck)
+        on_slide = MagicMock()
+        follower = SlideFollower(MagicMock(contexts=[context]), DECK_ID, on_slide)
+        follower.start()
+
+        follower.stop()
+        deck.navigate(f"{DECK_URL}/edit#slide=id.p1")
+
+        on_slide.assert_not_called()
+        assert deck.handlers["framenavigated"] == []
+        assert context.handlers["page"] == []
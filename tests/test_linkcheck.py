@@ -0,0 +1,256 @@
+"""Tests for linkcheck module."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from google_slidebot.cache import load_link_statuses
+from google_slidebot.linkcheck import LinkChecker, LinkStatus, is_checkable
+
+
+class LinkServer(ThreadingHTTPServer):
+    """Local HTTP server that records how it was used."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), LinkHandler)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests: list[tuple[str, str]] = []
+        self.request_times: list[float] = []
+        self.connections = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+class LinkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _respond(self, status, headers=(), body=b""):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _handle(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.command, self.path))
+            server.request_times.append(time.monotonic())
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            if self.path.startswith("/ok"):
+                self._respond(200, body=b"fine")
+            elif self.path == "/redirect":
+                self._respond(302, [("Location", "/ok")])
+            elif self.path == "/loop":
+                self._respond(302, [("Location", "/loop")])
+            elif self.path == "/nohead":
+                self._respond(405 if self.command == "HEAD" else 200)
+            elif self.path == "/slow":
+                time.sleep(0.5)
+                self._respond(200)
+            elif self.path.startswith("/busy"):
+                time.sleep(0.05)
+                self._respond(200)
+            else:
+                self._respond(404, body=b"not here")
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    do_HEAD = _handle
+    do_GET = _handle
+
+
+def _serve():
+    server = LinkServer()
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def server():
+    yield from _serve()
+
+
+@pytest.fixture
+def other_server():
+    """A second host, on another port."""
+    yield from _serve()
+
+
+@pytest.fixture
+def checker():
+    checker = LinkChecker(timeout=0.2)
+    yield checker
+    checker.close()
+
+
+class TestIsCheckable:
+    """Tests for is_checkable."""
+
+    def test_only_http_links(self):
+        """Should skip internal, mail and malformed links."""
+        assert is_checkable("https://example.com/a")
+        assert is_checkable("http://example.com")
+        assert not is_checkable("#slide=id.p3")
+        assert not is_checkable("mailto:someone@example.com")
+        assert not is_checkable("https://")
+
+
+class TestLinkChecker:
+    """Tests for LinkChecker."""
+
+    def test_reports_working_and_broken_links(self, server, checker):
+        """Should mark 2xx links ok and everything else broken."""
+        results = checker.check([f"{server.url}/ok", f"{server.url}/missing"])
+
+        assert results[f"{server.url}/ok"].ok
+        broken = results[f"{server.url}/missing"]
+        assert not broken.ok
+        assert broken.describe() == "HTTP 404"
+
+    def test_follows_redirects(self, server, checker):
+        """Should judge a link by where it redirects to, within a limit."""
+        ok = checker.check_url(f"{server.url}/redirect")
+        loop = checker.check_url(f"{server.url}/loop")
+
+        assert ok.ok and ok.status == 200
+        assert not loop.ok
+        assert loop.describe() == "too many redirects"
+
+    def test_falls_back_to_get_when_head_is_refused(self, server, checker):
+        """Should retry with GET for servers that reject HEAD."""
+        assert checker.check_url(f"{server.url}/nohead").ok
+        assert server.requests == [("HEAD", "/nohead"), ("GET", "/nohead")]
+
+    def test_reports_timeouts_and_refused_connections(self, server, checker):
+        """Should turn network failures into broken links, not exceptions."""
+        slow = checker.check_url(f"{server.url}/slow")
+        refused = checker.check_url("http://127.0.0.1:1/")
+
+        assert not slow.ok and slow.describe() == "timed out"
+        assert not refused.ok and refused.error
+
+    def test_reuses_connections(self, server, checker):
+        """Should send sequential requests to a host over one connection."""
+        for i in range(5):
+            assert checker.check_url(f"{server.url}/ok/{i}").ok
+
+        assert server.connections == 1
+
+    def test_limits_requests_in_flight_per_host(self, server):
+        """Should never have more than per_host requests open to a host."""
+        checker = LinkChecker(workers=16, per_host=3, use_cache=False)
+        try:
+            results = checker.check(f"{server.url}/busy/{i}" for i in range(24))
+        finally:
+            checker.close()
+
+        assert all(status.ok for status in results.values())
+        assert 1 < server.max_in_flight <= 3
+        assert server.connections <= 3
+
+    def test_busy_host_does_not_starve_others(self, server, other_server):
+        """Should check other hosts while one host's links queue up."""
+        checker = LinkChecker(workers=2, per_host=1, use_cache=False)
+        urls = [f"{server.url}/busy/{i}" for i in range(6)]
+        try:
+            results = checker.check(urls + [f"{other_server.url}/ok"])
+        finally:
+            checker.close()
+
+        assert all(status.ok for status in results.values())
+        # The other host was checked alongside, not after the busy one
+        assert other_server.request_times[0] < server.request_times[-1]
+
+    def test_skips_duplicates_and_unchecked_schemes(self, server, checker):
+        """Should check each http(s) URL once and leave the rest out."""
+        url = f"{server.url}/ok"
+        results = checker.check([url, "#slide=id.p2", url, "mailto:a@b.c"])
+
+        assert list(results) == [url]
+        assert server.requests == [("HEAD", "/ok")]
+
+    def test_reuses_cached_results(self, server, checker):
+        """Should answer from the cache without contacting the server."""
+        urls = [f"{server.url}/ok", f"{server.url}/missing"]
+        first = checker.check(urls)
+        server.requests.clear()
+
+        again = LinkChecker().check(urls)
+
+        assert server.requests == []
+        assert again == first
+
+    def test_rechecks_expired_results(self, server):
+        """Should not trust cached results older than the TTL."""
+        url = f"{server.url}/ok"
+        LinkChecker(ttl=60).check([url])
+        server.requests.clear()
+
+        LinkChecker(ttl=0).check([url])
+
+        assert server.requests == [("HEAD", "/ok")]
+
+    def test_keeps_results_when_cache_is_unwritable(
+        self, server, checker, isolated_cache
+    ):
+        """Should return the results and note why they weren't cached."""
+        isolated_cache.write_text("a file where the cache dir should be")
+
+        results = checker.check([f"{server.url}/ok"])
+
+        assert results[f"{server.url}/ok"].ok
+        assert isinstance(checker.cache_error, OSError)
+
+    def test_overlapping_checks_keep_each_others_results(self, server):
+        """Should add to results another check cached meanwhile."""
+        first, second = LinkChecker(), LinkChecker()
+        check_lane = first._check_lane
+
+        def check_other_deck_first(lane):
+            second.check([f"{server.url}/missing"])
+            return check_lane(lane)
+
+        with patch.object(first, "_check_lane", side_effect=check_other_deck_first):
+            first.check([f"{server.url}/ok"])
+
+        assert set(load_link_statuses()) == {
+            f"{server.url}/ok",
+            f"{server.url}/missing",
+        }
+
+
+class TestLinkStatus:
+    """Tests for LinkStatus."""
+
+    def test_describe_prefers_error(self):
+        """Should explain a failure by its error, else its status."""
+        assert LinkStatus("u", False, error="timed out").describe() == "timed out"
+        assert LinkStatus("u", False, status=500).describe() == "HTTP 500"
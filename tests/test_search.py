@@ -0,0 +1,98 @@
+"""Tests for search module."""
+
+from google_slidebot.search import SearchIndex, scan
+from google_slidebot.slides import Link, Slide
+
+
+def _deck() -> list[Slide]:
+    return [
+        Slide(1, "Welcome", [Link("Agenda", "https://example.com/agenda")]),
+        Slide(2, "Architecture Overview", [Link("Design doc", "https://docs/design")]),
+        Slide(3, "Rollout plan", [Link("Agenda", "https://example.com/agenda")]),
+        Slide(4, "Questions", []),
+    ]
+
+
+class TestSearchIndex:
+    """Tests for SearchIndex."""
+
+    def test_matches_titles_link_text_and_urls(self):
+        """Should search every indexed field, ignoring case."""
+        index = SearchIndex(_deck())
+
+        assert [s.number for s in index.search("ARCHITECTURE")] == [2]
+        assert [s.number for s in index.search("design doc")] == [2]
+        assert [s.number for s in index.search("example.com")] == [1, 3]
+
+    def test_matches_substrings_of_any_length(self):
+        """Should match short and long terms anywhere in the text."""
+        index = SearchIndex(_deck())
+
+        assert [s.number for s in index.search("q")] == [4]
+        assert [s.number for s in index.search("ollou")] == [3]
+
+    def test_requires_every_term(self):
+        """Should only return slides matching all query words."""
+        index = SearchIndex(_deck())
+
+        assert [s.number for s in index.search("agenda rollout")] == [3]
+        assert index.search("agenda questions") == []
+
+    def test_empty_query_returns_all_slides(self):
+        """Should list the whole deck for a blank query."""
+        deck = _deck()
+        assert SearchIndex(deck).search("  ") == deck
+
+    def test_narrows_as_query_is_typed(self):
+        """Should give the same results typing incrementally or at once."""
+        index = SearchIndex(_deck())
+
+        for query in ("a", "ag", "age", "agen", "agenda", "agenda r", "agenda ro"):
+            typed = [s.number for s in index.search(query)]
+            fresh = [s.number for s in SearchIndex(_deck()).search(query)]
+            assert typed == fresh
+
+        # Deleting back to a shorter query searches afresh
+        assert [s.number for s in index.search("a")] == [1, 2, 3]
+
+    def test_update_reindexes_slide_changed_in_place(self):
+        """Should drop old text and URLs of a slide changed in place."""
+        deck = _deck()
+        index = SearchIndex(deck)
+
+        deck[3].title = "Q&A"
+        deck[3].links = [Link("Feedback", "https://example.com/agenda")]
+        deck[0].links = []
+        index.update(deck[3])
+        index.update(deck[0])
+
+        assert index.search("questions") == []
+        assert [s.number for s in index.search("feedback")] == [4]
+        assert [s.number for s in index.slides_using("https://example.com/agenda")] == [
+            3,
+            4,
+        ]
+
+    def test_slides_using_url(self):
+        """Should map a URL to every slide linking to it, once each."""
+        deck = _deck()
+        deck[0].links.append(Link("Again", "https://example.com/agenda"))
+        index = SearchIndex(deck)
+
+        assert [s.number for s in index.slides_using("https://example.com/agenda")] == [
+            1,
+            3,
+        ]
+        assert index.slides_using("https://unknown") == []
+
+
+class TestScan:
+    """Tests for scan."""
+
+    def test_matches_like_the_index(self):
+        """Should find the same slides as a built index."""
+        deck = _deck()
+        index = SearchIndex(deck)
+
+        for query in ("ARCHITECTURE", "example.com", "agenda rollout", "q", ""):
+            assert scan(deck, query) == index.search(query)
@@ -1,6 +1,9 @@
 """Tests for Google Slides module."""
 
 import json
+import threading
+from datetime import datetime, timedelta, timezone
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -10,9 +13,21 @@ from google_slidebot.slides import (
     store_token,
     delete_stored_token,
     get_credentials,
+    extract_slide,
     extract_slides_from_presentation,
     fetch_presentation,
+    iter_slides_from_presentation,
+    CredentialManager,
+    PresentationWatcher,
+    diff_slides,
+    PAGE_FIELDS,
+    PRESENTATION_FIELDS,
+    SLIDE_INDEX_FIELDS,
+    PageLoader,
+    Link,
+    Slide,
 )
+from google_slidebot.cache import load_cached_presentation, store_cached_presentation
 
 
 class TestExtractPresentationId:
@@ -44,16 +59,21 @@ class TestExtractPresentationId:
             extract_presentation_id("")
 
 
+@pytest.fixture
+def mock_keyring():
+    """Replace the keyring module that slides.py imports on use."""
+    with patch.dict("sys.modules", {"keyring": MagicMock()}) as modules:
+        yield modules["keyring"]
+
+
 class TestTokenStorage:
     """Tests for keyring token storage."""
 
-    @patch("google_slidebot.slides.keyring")
     def test_get_stored_token_returns_none_when_missing(self, mock_keyring):
         """Should return None when no token stored."""
         mock_keyring.get_password.return_value = None
         assert get_stored_token() is None
 
-    @patch("google_slidebot.slides.keyring")
     def test_get_stored_token_returns_dict_when_present(self, mock_keyring):
         """Should return parsed token dict when stored."""
         token_data = {"token": "abc", "refresh_token": "xyz"}
@@ -61,7 +81,6 @@ class TestTokenStorage:
         result = get_stored_token()
         assert result == token_data
 
-    @patch("google_slidebot.slides.keyring")
     def test_store_token_serializes_to_json(self, mock_keyring):
         """Should store token as JSON string."""
         token_data = {"token": "abc", "refresh_token": "xyz"}
@@ -71,7 +90,6 @@ class TestTokenStorage:
         stored_json = call_args[0][2]
         assert json.loads(stored_json) == token_data
 
-    @patch("google_slidebot.slides.keyring")
     def test_delete_stored_token_calls_keyring(self, mock_keyring):
         """Should call keyring delete."""
         delete_stored_token()
@@ -82,7 +100,7 @@ class TestGetCredentials:
     """Tests for get_credentials function."""
 
     @patch("google_slidebot.slides.get_stored_token")
-    @patch("google_slidebot.slides.Credentials")
+    @patch("google.oauth2.credentials.Credentials")
     def test_returns_valid_credentials_from_keyring(
         self, mock_creds_class, mock_get_token
     ):
@@ -98,11 +116,16 @@ class TestGetCredentials:
         mock_creds_class.from_authorized_user_info.assert_called_once()
 
     @patch("google_slidebot.slides.get_stored_token")
-    @patch("google_slidebot.slides.Credentials")
+    @patch("google.oauth2.credentials.Credentials")
     @patch("google_slidebot.slides.store_token")
-    @patch("google_slidebot.slides.Request")
+    @patch("google.auth.transport.requests.Request")
     def test_refreshes_expired_credentials(
-        self, mock_request, mock_store, mock_creds_class, mock_get_token
+        self,
+        mock_request,
+        mock_store,
+        mock_creds_class,
+        mock_get_token,
+        fresh_credentials,
     ):
         """Should refresh and store when token expired but has refresh_token."""
         mock_get_token.return_value = {"token": "old", "refresh_token": "xyz"}
@@ -114,6 +137,7 @@ class TestGetCredentials:
         mock_creds_class.from_authorized_user_info.return_value = mock_creds
 
         get_credentials()
+        fresh_credentials.flush()
 
         mock_creds.refresh.assert_called_once()
         mock_store.assert_called_once()
@@ -129,6 +153,108 @@ class TestGetCredentials:
             get_credentials()
 
 
+def _utcnow() -> datetime:
+    """Naive UTC now, as used by Credentials.expiry."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class TestCredentialManager:
+    """Tests for in-process credential caching and background refresh."""
+
+    @patch("google_slidebot.slides.get_stored_token")
+    @patch("google.oauth2.credentials.Credentials")
+    def test_reads_keyring_once(self, mock_creds_class, mock_get_token):
+        """Should reuse the credentials instead of re-reading the keyring."""
+        mock_get_token.return_value = {"token": "abc", "refresh_token": "xyz"}
+        mock_creds = MagicMock(valid=True)
+        mock_creds_class.from_authorized_user_info.return_value = mock_creds
+        manager = CredentialManager()
+
+        assert manager.get() is mock_creds
+        assert manager.get() is mock_creds
+
+        mock_get_token.assert_called_once()
+
+    @patch("google_slidebot.slides.get_stored_token")
+    @patch("google.oauth2.credentials.Credentials")
+    @patch("google_slidebot.slides.store_token")
+    @patch("google.auth.transport.requests.Request")
+    def test_refreshes_in_background_before_expiry(
+        self, mock_request, mock_store, mock_creds_class, mock_get_token
+    ):
+        """Should return a still-valid token at once and refresh it off-thread."""
+        mock_get_token.return_value = {"token": "abc", "refresh_token": "xyz"}
+        mock_creds = MagicMock(valid=True, refresh_token="xyz")
+        mock_creds.expiry = _utcnow() + timedelta(minutes=5)
+        mock_creds.to_json.return_value = '{"token": "new"}'
+        stored = threading.Event()
+        refresh_threads = []
+
+        def refresh(request):
+            refresh_threads.append(threading.current_thread())
+            mock_creds.expiry = _utcnow() + timedelta(hours=1)
+
+        mock_creds.refresh.side_effect = refresh
+        mock_store.side_effect = lambda token: stored.set()
+        mock_creds_class.from_authorized_user_info.return_value = mock_creds
+        manager = CredentialManager()
+
+        assert manager.get() is mock_creds
+
+        assert stored.wait(timeout=5)
+        manager.close()
+        assert refresh_threads[0] is not threading.current_thread()
+        mock_store.assert_called_once_with({"token": "new"})
+
+    @patch("google_slidebot.slides.get_stored_token")
+    @patch("google.oauth2.credentials.Credentials")
+    @patch("google_slidebot.slides.store_token")
+    @patch("google.auth.transport.requests.Request")
+    def test_records_background_refresh_failure(
+        self, mock_request, mock_store, mock_creds_class, mock_get_token
+    ):
+        """Should keep a failed background refresh instead of dropping it."""
+        mock_get_token.return_value = {"token": "abc", "refresh_token": "xyz"}
+        mock_creds = MagicMock(valid=True, refresh_token="xyz")
+        mock_creds.expiry = _utcnow() + timedelta(minutes=5)
+
+        def refresh(request):
+            raise RuntimeError("token revoked")
+
+        mock_creds.refresh.side_effect = refresh
+        mock_creds_class.from_authorized_user_info.return_value = mock_creds
+        manager = CredentialManager()
+
+        manager.get()
+        manager._timer.join(timeout=5)
+
+        assert str(manager.refresh_error) == "token revoked"
+        mock_store.assert_not_called()
+
+    @patch("google_slidebot.slides.get_stored_token")
+    @patch("google.oauth2.credentials.Credentials")
+    @patch("google_slidebot.slides.store_token")
+    @patch("google.auth.transport.requests.Request")
+    def test_does_not_wait_for_keyring_write(
+        self, mock_request, mock_store, mock_creds_class, mock_get_token
+    ):
+        """Should return refreshed credentials before the keyring write ends."""
+        mock_get_token.return_value = {"token": "old", "refresh_token": "xyz"}
+        mock_creds = MagicMock(valid=False, expired=True, refresh_token="xyz")
+        mock_creds.to_json.return_value = "{}"
+        mock_creds_class.from_authorized_user_info.return_value = mock_creds
+        write_may_finish = threading.Event()
+        mock_store.side_effect = lambda token: write_may_finish.wait(timeout=5)
+        manager = CredentialManager()
+
+        assert manager.get() is mock_creds
+        assert any(writer.is_alive() for writer in manager._writes)
+
+        write_may_finish.set()
+        manager.flush()
+        mock_store.assert_called_once()
+
+
 class TestExtractSlidesFromPresentation:
     """Tests for extract_slides_from_presentation."""
 
@@ -207,17 +333,167 @@ class TestExtractSlidesFromPresentation:
         assert len(slides) == 1
         assert slides[0].links == []
 
+    def test_iter_yields_slides_lazily(self):
+        """Should extract each slide only when it is requested."""
+        presentation_data = {"slides": [_text_slide("One"), {"pageElements": None}]}
+
+        slides = iter_slides_from_presentation(presentation_data)
+
+        # The malformed second slide is never touched
+        assert next(slides).title == "One"
+
     def test_handles_empty_presentation(self):
         """Should return empty list for presentation with no slides."""
         presentation_data = {"slides": []}
         slides = extract_slides_from_presentation(presentation_data)
         assert slides == []
 
+    def test_extracts_links_from_grouped_elements(self):
+        """Should find links in shapes inside nested groups, in order."""
+        slide_data = {
+            "pageElements": [
+                _shape(_run("Title")),
+                _group(
+                    _shape(_run("First", "https://first.example")),
+                    _group(_shape(_run("Second", "https://second.example"))),
+                ),
+                _shape(_run("Third", "https://third.example")),
+            ]
+        }
+
+        slide = extract_slide(1, slide_data)
+
+        assert slide.title == "Title"
+        assert [link.text for link in slide.links] == ["First", "Second", "Third"]
+
+    def test_extracts_links_from_table_cells(self):
+        """Should find links in table cells and mark them as such."""
+        table = {
+            "table": {
+                "tableRows": [
+                    {"tableCells": [{"text": _text(_run("A", "https://a.example"))}]},
+                    {
+                        "tableCells": [
+                            {},
+                            {"text": _text(_run("B", "https://b.example"))},
+                        ]
+                    },
+                ]
+            }
+        }
+
+        slide = extract_slide(1, {"pageElements": [table]})
+
+        assert [(link.text, link.source) for link in slide.links] == [
+            ("A", "table"),
+            ("B", "table"),
+        ]
+        # Table text doesn't become the title
+        assert slide.title == "Slide 1"
+
+    def test_extracts_element_level_links(self):
+        """Should find links set on whole shapes, images and lines."""
+        shape = _shape(_run("Button"))
+        shape["shape"]["shapeProperties"] = {"link": {"url": "https://shape.example"}}
+        image = {
+            "title": "Logo",
+            "image": {"imageProperties": {"link": {"url": "https://image.example"}}},
+        }
+        line = {"line": {"lineProperties": {"link": {"url": "https://line.example"}}}}
+
+        slide = extract_slide(1, {"pageElements": [shape, image, line]})
+
+        assert [(link.text, link.url, link.source) for link in slide.links] == [
+            ("https://shape.example", "https://shape.example", "shape"),
+            ("Logo", "https://image.example", "image"),
+            ("https://line.example", "https://line.example", "line"),
+        ]
+
+    def test_extracts_speaker_note_links(self):
+        """Should find links in speaker notes after the slide's own links."""
+        slide_data = {
+            "slideProperties": {
+                "notesPage": {
+                    "pageElements": [_shape(_run("Notes", "https://notes.example"))]
+                }
+            },
+            "pageElements": [_shape(_run("Slide", "https://slide.example"))],
+        }
+
+        slide = extract_slide(1, slide_data)
+
+        assert slide.title == "Slide"
+        assert [(link.url, link.source) for link in slide.links] == [
+            ("https://slide.example", "text"),
+            ("https://notes.example", "notes"),
+        ]
+
+    def test_extracts_internal_slide_links(self):
+        """Should turn links to other slides into #slide fragments."""
+        slide_data = {
+            "pageElements": [
+                _shape(
+                    _run("By id", {"pageObjectId": "p7"}),
+                    _run("By index", {"slideIndex": 0}),
+                    _run("Next", {"relativeLink": "NEXT_SLIDE"}),
+                )
+            ]
+        }
+
+        links = extract_slide(1, slide_data).links
+
+        assert [link.url for link in links] == [
+            "#slide=id.p7",
+            "#slide=1",
+            "#slide=next_slide",
+        ]
+        assert all(link.internal for link in links)
+
+    def test_handles_deeply_nested_groups(self):
+        """Should not recurse, so nesting depth isn't limited by the stack."""
+        element = _shape(_run("Deep", "https://deep.example"))
+        for _ in range(5000):
+            element = _group(element)
+
+        slide = extract_slide(1, {"pageElements": [element]})
+
+        assert [link.url for link in slide.links] == ["https://deep.example"]
+
+    def test_shares_repeated_link_strings(self):
+        """Should keep one copy of a URL and label however often they recur."""
+        # Parsed JSON gives every occurrence its own string object
+        presentation = json.loads(
+            json.dumps(
+                {
+                    "slides": [
+                        {"pageElements": [_shape(_run("Repo", "https://repo.example"))]}
+                        for _ in range(3)
+                    ]
+                }
+            )
+        )
+
+        links = [
+            link
+            for slide in extract_slides_from_presentation(presentation)
+            for link in slide.links
+        ]
+
+        assert len({id(link.url) for link in links}) == 1
+        assert len({id(link.text) for link in links}) == 1
+
+    def test_slides_and_links_have_no_instance_dict(self):
+        """Should use slots, so each object is only as big as its fields."""
+        slide = Slide(number=1, title="Intro", links=[Link("Repo", "https://repo")])
+
+        assert not hasattr(slide, "__dict__")
+        assert not hasattr(slide.links[0], "__dict__")
+
 
 class TestFetchPresentation:
     """Tests for fetch_presentation."""
 
-    @patch("google_slidebot.slides.build")
+    @patch("googleapiclient.discovery.build")
     @patch("google_slidebot.slides.get_credentials")
     def test_fetches_and_extracts_slides(self, mock_get_creds, mock_build):
         """Should fetch presentation and return Slide objects."""
@@ -248,4 +524,311 @@ class TestFetchPresentation:
 
         assert len(slides) == 1
         assert slides[0].title == "Test"
-        mock_build.assert_called_once_with("slides", "v1", credentials=mock_creds)
+        mock_build.assert_called_once()
+        assert mock_build.call_args.kwargs["static_discovery"] is True
+        assert mock_build.call_args.kwargs["http"].credentials is mock_creds
+
+    @patch("googleapiclient.discovery.build")
+    @patch("google_slidebot.slides.get_credentials")
+    def test_builds_service_once_per_process(self, mock_get_creds, mock_build):
+        """Should reuse the built service and resource across fetches."""
+        mock_service = MagicMock()
+        mock_build.return_value = mock_service
+        mock_get = mock_service.presentations.return_value.get
+        mock_get.return_value.execute.return_value = CACHED_PRESENTATION
+
+        fetch_presentation("deck-one")
+        fetch_presentation("deck-two")
+
+        mock_build.assert_called_once()
+        mock_get_creds.assert_called_once()
+        mock_service.presentations.assert_called_once()
+
+    @patch("googleapiclient.discovery.build")
+    @patch("google_slidebot.slides.get_credentials")
+    def test_fetches_when_cache_is_unwritable(
+        self, mock_get_creds, mock_build, isolated_cache
+    ):
+        """Should still return the deck when it can't be cached."""
+        isolated_cache.write_text("a file where the cache dir should be")
+        mock_service = MagicMock()
+        mock_build.return_value = mock_service
+        mock_get = mock_service.presentations.return_value.get
+        mock_get.return_value.execute.return_value = CACHED_PRESENTATION
+
+        slides = fetch_presentation("deck-id")
+
+        assert [slide.title for slide in slides] == ["Cached"]
+
+    @patch("googleapiclient.discovery.build")
+    @patch("google_slidebot.slides.get_credentials")
+    def test_reuses_cache_when_revision_unchanged(self, mock_get_creds, mock_build):
+        """Should skip the full download when the revision matches the cache."""
+        store_cached_presentation("deck-id", CACHED_PRESENTATION, PRESENTATION_FIELDS)
+        mock_service = MagicMock()
+        mock_build.return_value = mock_service
+        mock_get = mock_service.presentations.return_value.get
+        mock_get.return_value.execute.return_value = {"revisionId": "rev1"}
+
+        slides = fetch_presentation("deck-id")
+
+        assert slides[0].title == "Cached"
+        mock_get.assert_called_once_with(presentationId="deck-id", fields="revisionId")
+
+    @patch("googleapiclient.discovery.build")
+    @patch("google_slidebot.slides.get_credentials")
+    def test_refetches_when_revision_changed(self, mock_get_creds, mock_build):
+        """Should download and re-cache the presentation on a new revision."""
+        store_cached_presentation("deck-id", CACHED_PRESENTATION, PRESENTATION_FIELDS)
+        fresh = {
+            "revisionId": "rev2",
+            "slides": [_text_slide("Fresh")],
+        }
+        mock_service = MagicMock()
+        mock_build.return_value = mock_service
+        mock_get = mock_service.presentations.return_value.get
+        mock_get.return_value.execute.side_effect = [{"revisionId": "rev2"}, fresh]
+
+        slides = fetch_presentation("deck-id")
+
+        assert slides[0].title == "Fresh"
+        assert load_cached_presentation("deck-id", PRESENTATION_FIELDS) == fresh
+
+    @patch("googleapiclient.discovery.build")
+    @patch("google_slidebot.slides.get_credentials")
+    def test_requests_only_consumed_fields(self, mock_get_creds, mock_build):
+        """Should fetch with the field mask rather than the full resource."""
+        mock_service = MagicMock()
+        mock_build.return_value = mock_service
+        mock_get = mock_service.presentations.return_value.get
+        mock_get.return_value.execute.return_value = CACHED_PRESENTATION
+
+        fetch_presentation("deck-id")
+
+        mock_get.assert_called_once_with(
+            presentationId="deck-id", fields=PRESENTATION_FIELDS
+        )
+
+    @patch("googleapiclient.discovery.build")
+    @patch("google_slidebot.slides.get_credentials")
+    def test_ignores_cache_with_other_field_mask(self, mock_get_creds, mock_build):
+        """Should refetch when the cache was filled with a different mask."""
+        store_cached_presentation("deck-id", CACHED_PRESENTATION, "*")
+        mock_service = MagicMock()
+        mock_build.return_value = mock_service
+        mock_get = mock_service.presentations.return_value.get
+        mock_get.return_value.execute.return_value = CACHED_PRESENTATION
+
+        fetch_presentation("deck-id")
+
+        mock_get.assert_called_once_with(
+            presentationId="deck-id", fields=PRESENTATION_FIELDS
+        )
+
+    @patch("google_slidebot.slides.get_credentials")
+    def test_offline_uses_cache_without_network(self, mock_get_creds):
+        """Should trust the cache and never authenticate when offline."""
+        store_cached_presentation("deck-id", CACHED_PRESENTATION, PRESENTATION_FIELDS)
+
+        slides = fetch_presentation("deck-id", offline=True)
+
+        assert slides[0].title == "Cached"
+        mock_get_creds.assert_not_called()
+
+    def test_offline_raises_when_not_cached(self):
+        """Should raise FileNotFoundError when offline with no cached copy."""
+        with pytest.raises(FileNotFoundError, match="cached"):
+            fetch_presentation("deck-id", offline=True)
+
+
+class TestDiffSlides:
+    """Tests for diff_slides."""
+
+    def test_reports_changed_and_added_slides(self):
+        """Should list positions whose slide differs or is new."""
+        old = [Slide(1, "Intro"), Slide(2, "Plan", [Link("Doc", "https://d")])]
+        new = [
+            Slide(1, "Intro"),
+            Slide(2, "Plan", [Link("Doc", "https://d2")]),
+            Slide(3, "Extra"),
+        ]
+
+        assert diff_slides(old, new) == [1, 2]
+
+    def test_ignores_removed_slides(self):
+        """Should report nothing when the deck only got shorter."""
+        old = [Slide(1, "Intro"), Slide(2, "Plan")]
+        assert diff_slides(old, old[:1]) == []
+
+
+class TestPresentationWatcher:
+    """Tests for PresentationWatcher."""
+
+    @patch("googleapiclient.discovery.build")
+    @patch("google_slidebot.slides.get_credentials")
+    def test_only_polls_revision_while_unchanged(self, mock_get_creds, mock_build):
+        """Should start from the cached revision and fetch nothing more."""
+        store_cached_presentation("deck-id", CACHED_PRESENTATION, PRESENTATION_FIELDS)
+        mock_get = mock_build.return_value.presentations.return_value.get
+        mock_get.return_value.execute.return_value = {"revisionId": "rev1"}
+        watcher = PresentationWatcher("deck-id", interval=10)
+
+        assert watcher.check() is None
+        assert watcher.check() is None
+
+        assert mock_get.call_count == 2
+        mock_get.assert_called_with(presentationId="deck-id", fields="revisionId")
+
+    @patch("googleapiclient.discovery.build")
+    @patch("google_slidebot.slides.get_credentials")
+    def test_refetches_on_new_revision(self, mock_get_creds, mock_build):
+        """Should return the edited slides once, then go quiet again."""
+        store_cached_presentation("deck-id", CACHED_PRESENTATION, PRESENTATION_FIELDS)
+        edited = {"revisionId": "rev2", "slides": [_text_slide("Edited")]}
+        mock_get = mock_build.return_value.presentations.return_value.get
+        mock_get.return_value.execute.side_effect = [
+            {"revisionId": "rev2"},
+            edited,
+            {"revisionId": "rev2"},
+        ]
+        watcher = PresentationWatcher("deck-id", interval=10)
+
+        slides = watcher.check()
+
+        assert [slide.title for slide in slides] == ["Edited"]
+        assert load_cached_presentation("deck-id", PRESENTATION_FIELDS) == edited
+        assert watcher.check() is None
+
+
+class TestPageLoader:
+    """Tests for lazy per-page loading."""
+
+    def _make_loader(self, mock_build, pages):
+        """Create a loader whose service serves an index and the given pages."""
+        mock_service = MagicMock()
+        mock_build.return_value = mock_service
+        mock_get = mock_service.presentations.return_value.get
+        mock_get.return_value.execute.return_value = {
+            "slides": [
+                dict(_text_slide(f"Title {i}"), objectId=object_id)
+                for i, object_id in enumerate(pages, start=1)
+            ]
+        }
+        mock_pages_get = mock_service.presentations.return_value.pages.return_value.get
+        mock_pages_get.side_effect = lambda **kwargs: MagicMock(
+            execute=MagicMock(return_value=pages[kwargs["pageObjectId"]])
+        )
+        return PageLoader("deck-id", radius=1), mock_service, mock_pages_get
+
+    @patch("googleapiclient.discovery.build")
+    @patch("google_slidebot.slides.get_credentials")
+    def test_fetch_index_returns_unloaded_slides(self, mock_get_creds, mock_build):
+        """Should fetch only IDs and titles and mark slides unloaded."""
+        loader, service, _ = self._make_loader(mock_build, {"p1": {}, "p2": {}})
+
+        slides = loader.fetch_index()
+
+        assert [s.title for s in slides] == ["Title 1", "Title 2"]
+        assert [s.object_id for s in slides] == ["p1", "p2"]
+        assert not any(s.loaded for s in slides)
+        service.presentations.return_value.get.assert_called_once_with(
+            presentationId="deck-id", fields=SLIDE_INDEX_FIELDS
+        )
+        loader.close()
+
+    @patch("googleapiclient.discovery.build")
+    @patch("google_slidebot.slides.get_credentials")
+    def test_load_fetches_page_content(self, mock_get_creds, mock_build):
+        """Should fill in links from a per-page request."""
+        page = {"objectId": "p1", "pageElements": [_link_element("Docs", "https://d")]}
+        loader, _, mock_pages_get = self._make_loader(mock_build, {"p1": page})
+        loaded = []
+        loader.on_loaded = loaded.append
+        slide = loader.fetch_index()[0]
+
+        loader.load(slide)
+
+        assert slide.loaded
+        assert slide.links[0].url == "https://d"
+        assert loaded == [slide]
+        mock_pages_get.assert_called_once_with(
+            presentationId="deck-id", pageObjectId="p1", fields=PAGE_FIELDS
+        )
+        loader.close()
+
+    @patch("googleapiclient.discovery.build")
+    @patch("google_slidebot.slides.get_credentials")
+    def test_prefetch_loads_neighbours(self, mock_get_creds, mock_build):
+        """Should load slides within the radius, and only those."""
+        pages = {f"p{i}": {"pageElements": []} for i in range(1, 5)}
+        loader, _, mock_pages_get = self._make_loader(mock_build, pages)
+        slides = loader.fetch_index()
+
+        loader.prefetch(slides, 1)
+        loader._executor.shutdown(wait=True)
+
+        assert [s.loaded for s in slides] == [True, False, True, False]
+        assert mock_pages_get.call_count == 2
+
+    def test_load_skips_loaded_slides(self):
+        """Should not make a request for an already loaded slide."""
+        loader = PageLoader("deck-id")
+        slide = Slide(number=1, title="Done")
+
+        assert loader.load(slide) is slide
+        assert loader._pending == {}
+        loader.close()
+
+
+def _link_element(text: str, url: str) -> dict:
+    """Build a page element holding a single linked text run."""
+    return {
+        "shape": {
+            "text": {
+                "textElements": [
+                    {"textRun": {"content": text, "style": {"link": {"url": url}}}}
+                ]
+            }
+        }
+    }
+
+
+def _text_slide(content: str) -> dict:
+    """Build a minimal slide with a single text run."""
+    return {
+        "pageElements": [
+            {
+                "shape": {
+                    "text": {
+                        "textElements": [{"textRun": {"content": content, "style": {}}}]
+                    }
+                }
+            }
+        ]
+    }
+
+
+def _run(content: str, link: str | dict | None = None) -> dict:
+    """Build a text element, optionally linked to a URL or Link object."""
+    style = {}
+    if link is not None:
+        style["link"] = {"url": link} if isinstance(link, str) else link
+    return {"textRun": {"content": content, "style": style}}
+
+
+def _text(*runs: dict) -> dict:
+    """Build a text body from text elements."""
+    return {"textElements": list(runs)}
+
+
+def _shape(*runs: dict) -> dict:
+    """Build a shape page element holding the given text elements."""
+    return {"shape": {"text": _text(*runs)}}
+
+
+def _group(*children: dict) -> dict:
+    """Build a group page element."""
+    return {"elementGroup": {"children": list(children)}}
+
+
+CACHED_PRESENTATION = {"revisionId": "rev1", "slides": [_text_slide("Cached")]}
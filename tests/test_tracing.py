@@ -0,0 +1,136 @@
+"""Tests for tracing module."""
+
+import json
+import threading
+from unittest.mock import AsyncMock
+
+import pytest
+
+from google_slidebot import tracing
+from google_slidebot.cache import store_cached_presentation
+from google_slidebot.slides import PRESENTATION_FIELDS, fetch_presentation
+from google_slidebot.tracing import mark, span
+from google_slidebot.zoom_chat import ZoomChat
+
+
+@pytest.fixture
+def tracer():
+    """Record spans for one test."""
+    tracer = tracing.enable()
+    yield tracer
+    tracing.disable()
+
+
+def _spans(tracer) -> dict[str, dict]:
+    return {event["name"]: event for event in tracer.events if event["ph"] == "X"}
+
+
+class TestSpan:
+    """Tests for span and mark."""
+
+    def test_records_nothing_while_disabled(self):
+        """Should be a no-op until tracing is enabled."""
+        with span("quiet") as quiet:
+            quiet.set(detail=1)
+        mark("moment")
+
+        tracer = tracing.enable()
+        tracing.disable()
+        assert tracer.events == []
+
+    def test_records_nested_spans_with_attributes(self, tracer):
+        """Should time each span, with the details given."""
+        with span("outer", deck="abc") as outer:
+            with span("inner"):
+                pass
+            outer.set(slides=3)
+
+        spans = _spans(tracer)
+        outer, inner = spans["outer"], spans["inner"]
+        assert outer["args"] == {"deck": "abc", "slides": 3}
+        assert outer["ts"] <= inner["ts"]
+        assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+    def test_records_errors(self, tracer):
+        """Should note the exception that ended a span, and re-raise it."""
+        with pytest.raises(ValueError), span("failing"):
+            raise ValueError("bad")
+
+        assert _spans(tracer)["failing"]["args"] == {"error": "ValueError"}
+
+    def test_writes_chrome_trace_timeline(self, tracer, tmp_path):
+        """Should save spans, marks and thread names as trace JSON."""
+
+        def fetch():
+            with span("in.worker"):
+                pass
+
+        worker = threading.Thread(target=fetch, name="fetcher")
+        with span("in.main"):
+            worker.start()
+            worker.join()
+        mark("ready", slides=2)
+
+        path = tmp_path / "trace.json"
+        tracing.write_timeline(path)
+        events = json.loads(path.read_text())["traceEvents"]
+
+        names = {e["args"]["name"] for e in events if e["ph"] == "M"}
+        assert "fetcher" in names
+        by_name = {e["name"]: e for e in events if e["ph"] != "M"}
+        assert by_name["in.worker"]["tid"] != by_name["in.main"]["tid"]
+        assert by_name["ready"]["ph"] == "i"
+        assert by_name["ready"]["args"] == {"slides": 2}
+
+
+class TestInstrumentation:
+    """Tests for the spans around startup and send phases."""
+
+    def test_fetch_presentation_spans(self, tracer):
+        """Should time loading the cache and extracting slides."""
+        store_cached_presentation(
+            "deck-id", {"revisionId": "r1", "slides": [{}]}, PRESENTATION_FIELDS
+        )
+
+        fetch_presentation("deck-id", offline=True)
+
+        spans = _spans(tracer)
+        assert spans["slides.fetch_presentation"]["args"] == {
+            "offline": True,
+            "from_cache": True,
+        }
+        assert spans["slides.extract"]["args"] == {"slides": 1}
+        assert "slides.load_cache" in spans
+
+    async def test_send_message_span(self, tracer):
+        """Should time each send."""
+        chat = ZoomChat()
+        chat.page = AsyncMock()
+        chat.page.evaluate = AsyncMock(return_value={"success": True})
+
+        await chat.send_message("Hello")
+
+        assert _spans(tracer)["zoom.send_message"]["args"] == {
+            "chars": 5,
+            "success": True,
+        }
+
+
+class TestProfiling:
+    """Tests for start_profiling and stop_profiling."""
+
+    def test_writes_profile_and_snapshots(self, tmp_path):
+        """Should save cProfile stats, a snapshot per mark and a summary."""
+        tracing.start_profiling(tmp_path / "profile")
+        sum(range(1000))
+        mark("loaded")
+        tracing.stop_profiling()
+
+        files = sorted(p.name for p in (tmp_path / "profile").iterdir())
+        assert files == [
+            "00-loaded.tracemalloc",
+            "01-exit.tracemalloc",
+            "session.prof",
+            "summary.txt",
+        ]
+        assert "Top allocations" in (tmp_path / "profile" / "summary.txt").read_text()
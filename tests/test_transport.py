@@ -0,0 +1,184 @@
+"""Tests for transport module, against a local fake Slides API."""
+
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from google_slidebot import slides
+from google_slidebot.slides import configure_transport, fetch_presentation
+from google_slidebot.transport import TransportOptions
+
+PRESENTATION = {
+    "revisionId": "rev1",
+    "slides": [
+        {
+            "objectId": "p1",
+            "pageElements": [
+                {
+                    "shape": {
+                        "text": {
+                            "textElements": [
+                                {
+                                    "textRun": {
+                                        "content": "Docs " * 200,
+                                        "style": {"link": {"url": "https://docs"}},
+                                    }
+                                }
+                            ]
+                        }
+                    }
+                }
+            ],
+        }
+    ],
+}
+
+
+class FakeSlidesServer(ThreadingHTTPServer):
+    """Serves presentations.get like the Slides API, and records requests."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeSlidesHandler)
+        self.connections = 0
+        self.requests: list[dict] = []
+        self.failures: list[int] = []  # statuses to answer with first
+        self.delay = 0.0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}/"
+
+
+class FakeSlidesHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        parts = urlsplit(self.path)
+        server.requests.append(
+            {"path": parts.path}
+            | {name.lower(): value for name, value in self.headers.items()}
+        )
+        time.sleep(server.delay)
+
+        if server.failures:
+            status, body = server.failures.pop(0), b'{"error": {}}'
+        elif parts.path == "/v1/presentations/deck":
+            status = 200
+            fields = parse_qs(parts.query).get("fields", [""])[0]
+            payload = {"revisionId": "rev1"} if fields == "revisionId" else PRESENTATION
+            body = json.dumps(payload).encode()
+        else:
+            status, body = 404, b'{"error": {}}'
+
+        headers = {"Content-Type": "application/json"}
+        # Like Google, compress only for clients that say gzip in both places
+        if "gzip" in self.headers.get("Accept-Encoding", "") and "(gzip)" in (
+            self.headers.get("User-Agent", "")
+        ):
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    server = FakeSlidesServer()
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def use_server(server):
+    """Point the Slides client at the fake server."""
+
+    def configure(**options):
+        configure_transport(
+            TransportOptions(endpoint=server.url, authorize=False, **options)
+        )
+
+    configure()
+    yield configure
+    configure_transport(TransportOptions())
+
+
+class TestTransport:
+    """Tests for requests made through the pooled transport."""
+
+    def test_fetches_through_configured_endpoint(self, server, use_server):
+        """Should send real API requests to the configured endpoint."""
+        slides_ = fetch_presentation("deck")
+
+        assert slides_[0].links[0].url == "https://docs"
+        assert server.requests[0]["path"] == "/v1/presentations/deck"
+
+    def test_requests_compressed_responses(self, server, use_server):
+        """Should ask for gzip the way Google requires, and name the app."""
+        fetch_presentation("deck")
+
+        request = server.requests[0]
+        assert "gzip" in request["accept-encoding"]
+        assert "(gzip)" in request["user-agent"]
+        assert request["user-agent"].startswith("google-slidebot/")
+
+    def test_reuses_connection_across_calls_and_threads(self, server, use_server):
+        """Should keep one connection open for calls from successive threads."""
+        fetch_presentation("deck")
+        for _ in range(3):
+            worker = threading.Thread(target=slides.fetch_revision_id, args=("deck",))
+            worker.start()
+            worker.join()
+
+        assert len(server.requests) == 4
+        assert server.connections == 1
+
+    def test_retries_transient_failures(self, server, use_server):
+        """Should retry rate limiting and server errors, then succeed."""
+        server.failures = [503, 429]
+
+        with patch("googleapiclient.http.random.random", return_value=0.0):
+            assert slides.fetch_revision_id("deck") == "rev1"
+
+        assert len(server.requests) == 3
+
+    def test_gives_up_after_timeout(self, server, use_server):
+        """Should not wait on a hung response past the timeout."""
+        use_server(timeout=0.1, retries=0)
+        server.delay = 0.5
+
+        with pytest.raises(TimeoutError):
+            slides.fetch_revision_id("deck")
+
+    def test_clear_service_cache_closes_sessions(self, server, use_server):
+        """Should open a fresh connection after the cache is cleared."""
+        slides.fetch_revision_id("deck")
+        slides.clear_service_cache()
+        slides.fetch_revision_id("deck")
+
+        assert server.connections == 2
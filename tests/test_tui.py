@@ -1,7 +1,16 @@
 """Tests for TUI module."""
 
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
 from google_slidebot.slides import Slide, Link
-from google_slidebot.tui import SlideListScreen, LinkPreviewScreen, SlidebotApp
+from google_slidebot.zoom_chat import ChatReadiness
+from google_slidebot.tui import (
+    SlideList,
+    SlideListScreen,
+    LinkPreviewScreen,
+    SlidebotApp,
+)
 
 
 class TestSlideListScreen:
@@ -19,13 +28,207 @@ class TestSlideListScreen:
             ),
         ]
         screen = SlideListScreen(slides)
-        items = screen._build_list_items()
+        items = [screen._format_item(slide) for slide in slides]
 
         assert len(items) == 3
         assert "(1 link)" in items[0] or "1 link" in items[0]
         assert "(0 links)" in items[1] or "0 links" in items[1]
         assert "(2 links)" in items[2] or "2 links" in items[2]
 
+    def test_marks_unloaded_slides(self):
+        """Should not claim a link count for slides not yet loaded."""
+        slides = [Slide(number=1, title="Lazy", loaded=False)]
+        screen = SlideListScreen(slides)
+        item = screen._format_item(slides[0])
+
+        assert "?" in item
+        assert "0 links" not in item
+
+    def test_counts_broken_links(self):
+        """Should say how many of a slide's links are broken."""
+        slides = [
+            Slide(
+                number=1,
+                title="Refs",
+                links=[Link("a", "http://a.com"), Link("b", "http://b.com")],
+            )
+        ]
+        screen = SlideListScreen(slides, {"http://b.com": "HTTP 404"})
+
+        assert "(2 links, 1 broken)" in screen._format_item(slides[0])
+
+
+class TestSlideList:
+    """Tests for the virtualized SlideList widget."""
+
+    async def test_formats_only_visible_rows(self):
+        """Should not format a row per slide in a large deck."""
+        slides = [Slide(number=i, title=f"Slide {i}") for i in range(1, 10001)]
+        app = SlidebotApp(slides=slides, zoom_chat=None)
+
+        with patch.object(
+            SlideListScreen, "_format_item", side_effect=lambda slide: slide.title
+        ) as mock_format:
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                slide_list = app.screen.query_one(SlideList)
+
+                assert slide_list.virtual_size.height == 10000
+                assert 0 < mock_format.call_count < 200
+
+    async def test_moves_cursor_and_opens_slide(self):
+        """Should scroll with the cursor and open the selected slide."""
+        slides = [Slide(number=i, title=f"Slide {i}") for i in range(1, 501)]
+        app = SlidebotApp(slides=slides, zoom_chat=None)
+
+        async with app.run_test() as pilot:
+            slide_list = app.screen.query_one(SlideList)
+            await pilot.press("end")
+            assert slide_list.index == 499
+            assert slide_list.scroll_offset.y > 0
+
+            await pilot.press("home", "down", "down", "enter")
+            await pilot.pause()
+
+            assert isinstance(app.screen, LinkPreviewScreen)
+            assert app.screen.slide.number == 3
+
+    async def test_prefetches_around_highlighted_slide(self):
+        """Should ask the app to prefetch as the cursor moves."""
+        slides = [Slide(number=i, title=f"Slide {i}") for i in range(1, 11)]
+        app = SlidebotApp(slides=slides, zoom_chat=None)
+
+        with patch.object(SlidebotApp, "prefetch_pages") as mock_prefetch:
+            async with app.run_test() as pilot:
+                await pilot.press("down")
+                await pilot.pause()
+
+        assert [c.args for c in mock_prefetch.call_args_list] == [(0,), (1,)]
+
+
+class TestSlideSearch:
+    """Tests for searching the slide list."""
+
+    async def test_filters_list_as_search_is_typed(self):
+        """Should show only matching slides and open the chosen one."""
+        slides = [
+            Slide(1, "Intro", [Link("Docs", "https://docs.example.com")]),
+            Slide(2, "Pricing", []),
+            Slide(3, "Quotas", [Link("Docs", "https://docs.example.com")]),
+        ]
+        app = SlidebotApp(slides=slides, zoom_chat=None)
+
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.press("slash", *"docs q")
+            screen = app.slide_list
+
+            assert [s.number for s in screen.shown_slides] == [3]
+
+            await pilot.press("enter", "enter")
+            await pilot.pause()
+            assert app.screen.slide.number == 3
+
+    async def test_survives_highlights_posted_before_filtering(self):
+        """Should ignore a queued highlight whose row has been filtered away."""
+        slides = [Slide(i, f"Intro {i}", []) for i in range(1, 6)]
+        app = SlidebotApp(slides=slides, zoom_chat=None)
+
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            app.slide_list._filter("intro 4")
+            app.slide_list._filter("zzz")
+            await pilot.pause()
+
+            assert app.slide_list.shown_slides == []
+            assert app.is_running
+
+    async def test_searches_before_index_is_built(self):
+        """Should scan the slides while the search index is being built."""
+        slides = [Slide(1, "Intro", []), Slide(2, "Pricing", [])]
+        started = threading.Event()
+        release = threading.Event()
+
+        class SlowIndexApp(SlidebotApp):
+            def _build_search_index(self, slides):
+                started.set()
+                release.wait(timeout=5)
+                super()._build_search_index(slides)
+
+        app = SlowIndexApp(slides=slides, zoom_chat=None)
+
+        async with app.run_test() as pilot:
+            started.wait(timeout=5)
+            await pilot.press("slash", *"pri")
+            assert [s.number for s in app.slide_list.shown_slides] == [2]
+
+            release.set()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert app.search_ready
+            assert [s.number for s in app.slide_list.shown_slides] == [2]
+
+    async def test_indexes_pages_loaded_while_building(self):
+        """Should not lose links from pages that load during an index build."""
+        from google_slidebot.search import SearchIndex
+
+        slides = [Slide(1, "Intro", []), Slide(2, "Pricing", [], loaded=False)]
+        built = threading.Event()
+        release = threading.Event()
+
+        class SlowIndexApp(SlidebotApp):
+            def _build_search_index(self, slides):
+                index = SearchIndex(slides)
+                built.set()
+                release.wait(timeout=5)
+                self.call_from_thread(self._use_search_index, index)
+
+        app = SlowIndexApp(slides=slides, zoom_chat=None)
+
+        async with app.run_test() as pilot:
+            built.wait(timeout=5)
+            slides[1].links = [Link("Plans", "https://plans.example.com")]
+            slides[1].loaded = True
+            app._refresh_slide(slides[1])
+
+            release.set()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert app.search_ready
+            assert app.find_slides("plans.example") == [slides[1]]
+
+    async def test_escape_clears_search(self):
+        """Should close the search and show every slide again."""
+        slides = [Slide(1, "Intro", []), Slide(2, "Pricing", [])]
+        app = SlidebotApp(slides=slides, zoom_chat=None)
+
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.press("slash", *"pri")
+            assert len(app.slide_list.shown_slides) == 1
+
+            await pilot.press("escape")
+
+            assert len(app.slide_list.shown_slides) == 2
+            assert app.is_running
+
+    async def test_shows_other_slides_using_a_url(self):
+        """Should list where else each link's URL appears."""
+        slides = [
+            Slide(1, "Intro", [Link("Docs", "https://docs.example.com")]),
+            Slide(2, "Pricing", [Link("Plans", "https://plans.example.com")]),
+            Slide(3, "Quotas", [Link("Docs", "https://docs.example.com")]),
+        ]
+        app = SlidebotApp(slides=slides, zoom_chat=None)
+
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.press("enter", "u")
+            content = app.screen._build_content()
+
+        assert "also on slide 3" in content
+
 
 class TestLinkPreviewScreen:
     """Tests for LinkPreviewScreen."""
@@ -57,6 +260,68 @@ class TestLinkPreviewScreen:
 
         assert "no links" in content.lower()
 
+    def test_displays_loading_message(self):
+        """Should say links are loading for a slide not yet loaded."""
+        slide = Slide(number=4, title="Later", loaded=False)
+        screen = LinkPreviewScreen(slide)
+        content = screen._build_content()
+
+        assert "loading" in content.lower()
+        assert "no links" not in content.lower()
+
+    def test_marks_speaker_note_links_as_not_sent(self):
+        """Should show note links, saying they stay out of chat."""
+        slide = Slide(1, "Demo", [Link("Runbook", "https://private", "notes")])
+        screen = LinkPreviewScreen(slide)
+
+        assert "Runbook (speaker notes, not sent to chat)" in screen._build_content()
+
+    def test_marks_broken_links(self):
+        """Should say why a broken link failed next to it."""
+        slide = Slide(
+            number=1,
+            title="Refs",
+            links=[Link("Old", "https://gone.example"), Link("New", "https://ok")],
+        )
+        screen = LinkPreviewScreen(slide, {"https://gone.example": "HTTP 404"})
+        content = screen._build_content()
+
+        assert "1. Old [broken: HTTP 404]" in content
+        assert "2. New\n" in content
+
+    def test_paginates_long_link_lists(self):
+        """Should only render one page of links at a time."""
+        links = [Link(f"Ref {i}", f"https://ref.example/{i}") for i in range(1, 46)]
+        screen = LinkPreviewScreen(Slide(number=5, title="Refs", links=links))
+
+        first = screen._build_content()
+        assert "1. Ref 1" in first
+        assert "Ref 21" not in first
+        assert "Page 1 of 3" in first
+
+        screen.page = 2
+        last = screen._build_content()
+        assert "41. Ref 41" in last
+        assert "45. Ref 45" in last
+        assert "Ref 40\n" not in last
+        assert "Page 3 of 3" in last
+
+    async def test_turns_pages_with_keys(self):
+        """Should move between pages and stop at either end."""
+        links = [Link(f"Ref {i}", f"https://ref.example/{i}") for i in range(30)]
+        slide = Slide(number=1, title="Refs", links=links)
+        app = SlidebotApp(slides=[slide], zoom_chat=None)
+
+        async with app.run_test() as pilot:
+            await pilot.press("enter")
+            await pilot.pause()
+            screen = app.screen
+
+            await pilot.press("n", "n")
+            assert screen.page == 1
+            await pilot.press("p", "p")
+            assert screen.page == 0
+
 
 class TestSlidebotApp:
     """Tests for SlidebotApp."""
@@ -72,3 +337,311 @@ class TestSlidebotApp:
         slides = [Slide(number=1, title="Test", links=[])]
         app = SlidebotApp(slides=slides, zoom_chat=None)
         assert app.slides == slides
+
+
+class TestDeckWatch:
+    """Tests for patching the slide list with deck edits."""
+
+    async def test_patches_changed_rows_and_keeps_cursor(self):
+        """Should replace only edited slides without moving the cursor."""
+        slides = [Slide(i, f"Slide {i}", []) for i in range(1, 6)]
+        original = list(slides)
+        edited = [Slide(i, f"Slide {i}", []) for i in range(1, 6)]
+        edited[1] = Slide(2, "Renamed", [Link("New", "https://new.example")])
+        app = SlidebotApp(slides=slides, zoom_chat=None)
+
+        async with app.run_test() as pilot:
+            await pilot.press("down", "down", "down")
+            slide_list = app.slide_list.query_one(SlideList)
+
+            app._apply_deck_edits(edited)
+            await pilot.pause()
+
+            assert slide_list.index == 3
+            assert app.slides[1].title == "Renamed"
+            # Unchanged slides keep their identity
+            assert app.slides[0] is original[0]
+            assert app.slides[4] is original[4]
+            assert [s.number for s in app.search.search("renamed")] == [2]
+
+    async def test_refilters_search_with_edited_slides(self):
+        """Should show the edited slides, and match on their new content."""
+        slides = [
+            Slide(1, "Intro", [Link("Docs", "https://old.example")]),
+            Slide(2, "Pricing", [Link("Plans", "https://plans.example")]),
+        ]
+        edited = [
+            Slide(1, "Intro", [Link("Docs", "https://new.example")]),
+            Slide(2, "Pricing", [Link("Plans", "https://docs.example")]),
+        ]
+        app = SlidebotApp(slides=slides, zoom_chat=None)
+
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.press("slash", *"docs")
+
+            app._apply_deck_edits(edited)
+            await pilot.pause()
+
+            shown = app.slide_list.shown_slides
+            assert shown == edited
+            assert shown[0].links[0].url == "https://new.example"
+
+    async def test_grows_and_shrinks_with_the_deck(self):
+        """Should add and drop rows as slides are added or deleted."""
+        slides = [Slide(i, f"Slide {i}", []) for i in range(1, 4)]
+        app = SlidebotApp(slides=slides, zoom_chat=None)
+
+        async with app.run_test() as pilot:
+            slide_list = app.slide_list.query_one(SlideList)
+            await pilot.press("end")
+
+            app._apply_deck_edits(slides[:1] + [Slide(2, "New", [])])
+            await pilot.pause()
+
+            assert [s.title for s in app.slides] == ["Slide 1", "New"]
+            assert slide_list.virtual_size.height == 2
+            assert slide_list.index == 1
+
+    async def test_polls_watcher_in_background(self):
+        """Should apply the slides a watcher check returns."""
+        watcher = MagicMock(interval=0.01)
+        watcher.check.side_effect = [[Slide(1, "Edited", [])], None, None, None]
+        app = SlidebotApp(
+            slides=[Slide(1, "Intro", [])], zoom_chat=None, watcher=watcher
+        )
+
+        async with app.run_test() as pilot:
+            for _ in range(50):
+                await pilot.pause(0.01)
+                if app.slides[0].title == "Edited":
+                    break
+
+            assert app.slides[0].title == "Edited"
+
+
+class TestFollowPresenter:
+    """Tests for following the presented slide."""
+
+    def _app(self, auto_send=False):
+        slides = [
+            Slide(1, "Intro", [], object_id="p1"),
+            Slide(2, "Docs", [Link("Docs", "https://docs.example.com")], "p2"),
+            Slide(3, "Agenda", [Link("Next", "#slide=id.p4")], object_id="p3"),
+        ]
+        zoom_chat = MagicMock(connected=True)
+        zoom_chat.queue_message = AsyncMock(return_value=5.0)
+        zoom_chat.disconnect = AsyncMock()
+        return SlidebotApp(
+            slides=slides,
+            zoom_chat=zoom_chat,
+            follow_presentation_id="deck",
+            auto_send=auto_send,
+        )
+
+    async def test_moves_selection_to_presented_slide(self):
+        """Should select the slide the presenter moved to, without sending."""
+        app = self._app()
+
+        async with app.run_test() as pilot:
+            app._on_presenter_slide("id.p3")
+            await pilot.pause()
+
+            assert app.slide_list.query_one(SlideList).index == 2
+            app.zoom_chat.queue_message.assert_not_called()
+
+    async def test_auto_sends_each_slide_once(self):
+        """Should send a presented slide's links the first time only."""
+        app = self._app(auto_send=True)
+
+        async with app.run_test() as pilot:
+            for ref in ("id.p1", "id.p2", "id.p3", "id.p2"):
+                app._on_presenter_slide(ref)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+        # Slides without external links are skipped silently
+        app.zoom_chat.queue_message.assert_awaited_once()
+        assert "docs.example.com" in app.zoom_chat.queue_message.call_args.args[0]
+
+    async def test_does_not_send_slide_without_chat_links(self):
+        """Should warn rather than post "no links" for a slide of slide links."""
+        app = self._app()
+
+        async with app.run_test() as pilot:
+            assert app.send_links(app.slides[2]) is False
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+        app.zoom_chat.queue_message.assert_not_called()
+
+    async def test_clears_search_hiding_presented_slide(self):
+        """Should close a search so the presented slide can be selected."""
+        app = self._app()
+
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.press("slash", *"intro")
+            app._on_presenter_slide("id.p2")
+            await pilot.pause()
+
+            assert len(app.slide_list.shown_slides) == 3
+            assert app.slide_list.query_one(SlideList).index == 1
+
+
+class TestLinkCheck:
+    """Tests for checking links in the background."""
+
+    async def test_marks_broken_links_once_checked(self):
+        """Should check every link and flag the broken ones."""
+        from google_slidebot.linkcheck import LinkStatus
+
+        slides = [
+            Slide(1, "Intro", [Link("Home", "https://ok.example")]),
+            Slide(2, "Refs", [Link("Old", "https://gone.example")]),
+        ]
+        checker = MagicMock()
+        checker.check.return_value = {
+            "https://ok.example": LinkStatus("https://ok.example", True, 200),
+            "https://gone.example": LinkStatus("https://gone.example", False, 404),
+        }
+        app = SlidebotApp(slides=slides, zoom_chat=None, link_checker=checker)
+
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert checker.check.call_args.args[0] == [
+                "https://ok.example",
+                "https://gone.example",
+            ]
+            assert app.broken_links == {"https://gone.example": "HTTP 404"}
+            assert "1 broken" in app.slide_list._format_item(slides[1])
+            assert "broken" not in app.slide_list._format_item(slides[0])
+
+        checker.close.assert_called_once()
+
+    async def test_warns_when_results_cannot_be_cached(self, isolated_cache):
+        """Should still mark broken links, and say once that caching failed."""
+        from google_slidebot.linkcheck import LinkChecker, LinkStatus
+
+        isolated_cache.write_text("a file where the cache dir should be")
+        slides = [Slide(1, "Refs", [Link("Old", "https://gone.example")])]
+        checker = LinkChecker()
+        app = SlidebotApp(slides=slides, zoom_chat=None, link_checker=checker)
+        app.notify = MagicMock()
+        gone = LinkStatus("https://gone.example", False, 404)
+
+        with patch.object(checker, "_check_lane", return_value=[gone]):
+            async with app.run_test() as pilot:
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                app._check_links(slides)
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+
+                assert app.is_running
+                assert app.broken_links == {"https://gone.example": "HTTP 404"}
+
+        warnings = [
+            call.args[0]
+            for call in app.notify.call_args_list
+            if "cache link results" in call.args[0]
+        ]
+        assert len(warnings) == 1
+
+    async def test_survives_a_failed_check(self):
+        """Should report a link check error instead of exiting."""
+        slides = [Slide(1, "Refs", [Link("Old", "https://gone.example")])]
+        checker = MagicMock()
+        checker.check.side_effect = NotADirectoryError("cache")
+        app = SlidebotApp(slides=slides, zoom_chat=None, link_checker=checker)
+        app.notify = MagicMock()
+
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert app.is_running
+
+        app.notify.assert_any_call("Couldn't check links: cache", severity="warning")
+
+
+class TestSlidebotAppStartup:
+    """Tests for concurrent startup inside the app's event loop."""
+
+    async def test_connects_zoom_while_slides_load(self):
+        """Should connect to Zoom without waiting for the slide fetch."""
+        release_fetch = threading.Event()
+
+        def load_slides():
+            release_fetch.wait(timeout=5)
+            return [Slide(number=1, title="Intro", links=[])]
+
+        zoom_chat = MagicMock(connected=False)
+        fetch_pending_at_connect = []
+
+        async def connect(wait=0):
+            fetch_pending_at_connect.append(not release_fetch.is_set())
+            zoom_chat.connected = True
+            return ChatReadiness(iframe=True, input=True, send_button=True)
+
+        zoom_chat.connect = connect
+        zoom_chat.disconnect = AsyncMock()
+        app = SlidebotApp(slides=[], zoom_chat=zoom_chat, load_slides=load_slides)
+
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            assert fetch_pending_at_connect == [True]
+            assert "Loading slides" in app.sub_title
+
+            release_fetch.set()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert [s.title for s in app.slides] == ["Intro"]
+            assert "1 slides" in app.sub_title
+            assert "Zoom: chat ready" in app.sub_title
+
+        zoom_chat.disconnect.assert_awaited_once()
+
+    async def test_exits_with_error_when_fetch_fails(self):
+        """Should stop the app and return the fetch error."""
+
+        def load_slides():
+            raise RuntimeError("quota exceeded")
+
+        app = SlidebotApp(slides=[], zoom_chat=None, load_slides=load_slides)
+
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+        assert "quota exceeded" in app.return_value
+
+    async def test_reports_zoom_connection_failure(self):
+        """Should keep running and show Zoom as not connected."""
+        zoom_chat = MagicMock(connected=False)
+        zoom_chat.connect = AsyncMock(side_effect=RuntimeError("No Zoom page"))
+        zoom_chat.disconnect = AsyncMock()
+        app = SlidebotApp(slides=[Slide(1, "Intro", [])], zoom_chat=zoom_chat)
+
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert "not connected" in app.sub_title
+
+    async def test_survives_unexpected_zoom_errors(self):
+        """Should treat any connection error as not connected, not crash."""
+        zoom_chat = MagicMock(connected=False)
+        zoom_chat.connect = AsyncMock(side_effect=Exception("Target closed"))
+        zoom_chat.disconnect = AsyncMock()
+        app = SlidebotApp(slides=[Slide(1, "Intro", [])], zoom_chat=zoom_chat)
+
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert app.is_running
+            assert "not connected" in app.sub_title
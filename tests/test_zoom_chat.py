@@ -1,9 +1,27 @@
 """Tests for Zoom chat module."""
 
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 
-from google_slidebot.zoom_chat import ZoomChat, format_links_message
+from google_slidebot.zoom_chat import (
+    PREPARE_CALL,
+    ChatReadiness,
+    SEND_CALL,
+    SENDER_SCRIPT,
+    TokenBucket,
+    ZoomChat,
+    MessageCache,
+    format_links_message,
+    is_zoom_url,
+    normalize_to_ascii,
+    list_page_targets,
+)
 from google_slidebot.slides import Slide, Link
 
 
@@ -11,10 +29,14 @@ class TestZoomChatConnect:
     """Tests for ZoomChat.connect."""
 
     @pytest.mark.asyncio
-    @patch("google_slidebot.zoom_chat.async_playwright")
-    async def test_connect_finds_zoom_page(self, mock_playwright):
+    @patch("google_slidebot.zoom_chat.list_page_targets")
+    @patch("playwright.async_api.async_playwright")
+    async def test_connect_finds_zoom_page(self, mock_playwright, mock_targets):
         """Should connect to Chrome and find Zoom page."""
         # Setup mocks
+        mock_targets.return_value = [
+            {"type": "page", "url": "https://app.zoom.us/wc/123/join"}
+        ]
         mock_pw = AsyncMock()
         mock_playwright.return_value.start = AsyncMock(return_value=mock_pw)
 
@@ -28,17 +50,34 @@ class TestZoomChatConnect:
         mock_page.url = "https://app.zoom.us/wc/123/join"
         mock_context.pages = [mock_page]
 
+        mock_page.evaluate = AsyncMock(
+            side_effect=[None, {"iframe": True, "input": True, "sendButton": True}]
+        )
+
         # Test
         chat = ZoomChat()
-        await chat.connect()
+        readiness = await chat.connect()
 
         assert chat.page == mock_page
         mock_pw.chromium.connect_over_cdp.assert_called_once()
 
+        # The send routine is installed once, for this and later page loads
+        mock_page.add_init_script.assert_awaited_once_with(SENDER_SCRIPT)
+        assert mock_page.evaluate.await_args_list[0].args == (SENDER_SCRIPT,)
+
+        # The chat panel is prepared before the first send
+        assert mock_page.evaluate.await_args_list[1].args == (PREPARE_CALL,)
+        assert readiness.ready
+        assert chat.readiness is readiness
+
     @pytest.mark.asyncio
-    @patch("google_slidebot.zoom_chat.async_playwright")
-    async def test_connect_raises_when_no_zoom_page(self, mock_playwright):
+    @patch("google_slidebot.zoom_chat.list_page_targets")
+    @patch("playwright.async_api.async_playwright")
+    async def test_connect_raises_when_no_zoom_page(
+        self, mock_playwright, mock_targets
+    ):
         """Should raise when Zoom page not found."""
+        mock_targets.return_value = [{"type": "page", "url": "https://google.com"}]
         mock_pw = AsyncMock()
         mock_playwright.return_value.start = AsyncMock(return_value=mock_pw)
 
@@ -56,6 +95,195 @@ class TestZoomChatConnect:
         with pytest.raises(RuntimeError, match="Zoom"):
             await chat.connect()
 
+        # The target list alone shows there is no Zoom tab
+        mock_pw.chromium.connect_over_cdp.assert_not_called()
+
+    @patch("google_slidebot.zoom_chat.list_page_targets")
+    @patch("playwright.async_api.async_playwright")
+    async def test_connect_raises_when_chrome_unreachable(
+        self, mock_playwright, mock_targets
+    ):
+        """Should explain how to start Chrome when it isn't listening."""
+        mock_targets.side_effect = ConnectionRefusedError()
+
+        with pytest.raises(RuntimeError, match="remote-debugging-port"):
+            await ZoomChat().connect()
+
+        mock_playwright.assert_not_called()
+
+    @patch("google_slidebot.zoom_chat.list_page_targets")
+    @patch("playwright.async_api.async_playwright")
+    async def test_connect_wraps_page_errors(self, mock_playwright, mock_targets):
+        """Should turn Playwright errors into RuntimeError and disconnect."""
+        mock_targets.return_value = [{"type": "page", "url": "https://app.zoom.us/wc"}]
+        mock_pw = AsyncMock()
+        mock_playwright.return_value.start = AsyncMock(return_value=mock_pw)
+        mock_browser = AsyncMock()
+        mock_pw.chromium.connect_over_cdp = AsyncMock(return_value=mock_browser)
+        mock_page = AsyncMock()
+        mock_page.url = "https://app.zoom.us/wc"
+        mock_browser.contexts = [MagicMock(pages=[mock_page])]
+        mock_page.add_init_script.side_effect = Exception(
+            "Execution context was destroyed"
+        )
+
+        chat = ZoomChat()
+        with pytest.raises(RuntimeError, match="Execution context"):
+            await chat.connect()
+
+        assert not chat.connected
+        mock_pw.stop.assert_awaited_once()
+
+    @patch("google_slidebot.zoom_chat.list_page_targets")
+    @patch("playwright.async_api.async_playwright")
+    async def test_connect_waits_for_zoom_tab(self, mock_playwright, mock_targets):
+        """Should pick up a Zoom tab opened after connecting, via events."""
+        mock_targets.return_value = []
+        mock_pw = AsyncMock()
+        mock_playwright.return_value.start = AsyncMock(return_value=mock_pw)
+        mock_browser = AsyncMock()
+        mock_pw.chromium.connect_over_cdp = AsyncMock(return_value=mock_browser)
+
+        handlers = {}
+        mock_context = MagicMock()
+        mock_context.pages = []
+        mock_context.on.side_effect = lambda event, handler: handlers.setdefault(
+            event, handler
+        )
+        mock_browser.contexts = [mock_context]
+
+        new_page = AsyncMock()
+        new_page.on = MagicMock()
+        new_page.remove_listener = MagicMock()
+        new_page.url = "https://app.zoom.us/wc/456/join"
+        new_page.evaluate = AsyncMock(
+            side_effect=[None, {"iframe": True, "input": True, "sendButton": True}]
+        )
+
+        chat = ZoomChat()
+        connecting = asyncio.create_task(chat.connect(wait=5))
+        await asyncio.sleep(0.01)
+        assert not connecting.done()
+
+        handlers["page"](new_page)
+        readiness = await connecting
+
+        assert chat.page is new_page
+        assert readiness.ready
+        mock_context.remove_listener.assert_called_once_with("page", handlers["page"])
+
+    @patch("google_slidebot.zoom_chat.list_page_targets")
+    @patch("playwright.async_api.async_playwright")
+    async def test_connect_gives_up_after_wait(self, mock_playwright, mock_targets):
+        """Should raise if no Zoom tab appears within the wait."""
+        mock_targets.return_value = []
+        mock_pw = AsyncMock()
+        mock_playwright.return_value.start = AsyncMock(return_value=mock_pw)
+        mock_browser = AsyncMock()
+        mock_pw.chromium.connect_over_cdp = AsyncMock(return_value=mock_browser)
+        mock_context = MagicMock()
+        mock_context.pages = []
+        mock_browser.contexts = [mock_context]
+
+        chat = ZoomChat()
+        with pytest.raises(RuntimeError, match="Zoom"):
+            await chat.connect(wait=0.01)
+
+        assert not chat.connected
+        mock_pw.stop.assert_awaited_once()
+
+
+class TestListPageTargets:
+    """Tests for list_page_targets against a local DevTools stand-in."""
+
+    async def test_lists_only_pages(self):
+        """Should return page targets from /json/list."""
+        targets = [
+            {"type": "page", "url": "https://app.zoom.us/wc/1/join"},
+            {"type": "service_worker", "url": "https://app.zoom.us/sw.js"},
+        ]
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = json.dumps(targets).encode()
+                self.send_response(200 if self.path == "/json/list" else 404)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            result = await list_page_targets(f"http://127.0.0.1:{server.server_port}")
+        finally:
+            server.shutdown()
+
+        assert result == targets[:1]
+
+
+class TestIsZoomUrl:
+    """Tests for is_zoom_url."""
+
+    def test_matches_zoom_hosts(self):
+        """Should accept zoom.us and its subdomains."""
+        assert is_zoom_url("https://app.zoom.us/wc/123/join")
+        assert is_zoom_url("https://zoom.us/j/123")
+
+    def test_rejects_other_hosts(self):
+        """Should not be fooled by zoom.us elsewhere in the URL."""
+        assert not is_zoom_url("https://google.com/search?q=zoom.us")
+        assert not is_zoom_url("https://notzoom.us/")
+        assert not is_zoom_url("about:blank")
+
+
+class TestChatReadiness:
+    """Tests for ZoomChat.check_readiness and ChatReadiness."""
+
+    async def test_reports_missing_elements(self):
+        """Should report which chat elements are missing."""
+        chat = ZoomChat()
+        chat.page = AsyncMock()
+        chat.page.evaluate = AsyncMock(
+            return_value={"iframe": True, "input": False, "sendButton": False}
+        )
+
+        readiness = await chat.check_readiness()
+
+        assert not readiness.ready
+        assert "chat input" in readiness.summary()
+        assert "send button" in readiness.summary()
+        assert "meeting iframe" not in readiness.summary()
+
+    async def test_reinstalls_routine_when_missing(self):
+        """Should reinstall the page routine if it is gone."""
+        chat = ZoomChat()
+        chat.page = AsyncMock()
+        chat.page.evaluate = AsyncMock(
+            side_effect=[
+                {"installed": False},
+                None,
+                {"iframe": True, "input": True, "sendButton": True},
+            ]
+        )
+
+        readiness = await chat.check_readiness()
+
+        assert readiness.ready
+        assert chat.page.evaluate.await_args_list[1].args == (SENDER_SCRIPT,)
+
+    async def test_raises_when_not_connected(self):
+        """Should raise when there is no page to check."""
+        with pytest.raises(RuntimeError, match="[Nn]ot connected"):
+            await ZoomChat().check_readiness()
+
+    def test_summary_when_ready(self):
+        """Should say the chat is ready when everything was found."""
+        readiness = ChatReadiness(iframe=True, input=True, send_button=True)
+        assert readiness.summary() == "chat ready"
+
 
 class TestZoomChatSendMessage:
     """Tests for ZoomChat.send_message."""
@@ -74,6 +302,38 @@ class TestZoomChatSendMessage:
         call_args = str(chat.page.evaluate.call_args)
         assert "Hello from test!" in call_args or chat.page.evaluate.called
 
+    @pytest.mark.asyncio
+    async def test_send_message_passes_only_text(self):
+        """Should call the installed routine rather than resend its source."""
+        chat = ZoomChat()
+        chat.page = AsyncMock()
+        chat.page.evaluate = AsyncMock(return_value={"success": True})
+
+        await chat.send_message("Hello")
+
+        chat.page.evaluate.assert_awaited_once_with(SEND_CALL, "Hello")
+        assert len(SEND_CALL) < 200
+        assert chat.last_send_ms is not None and chat.last_send_ms >= 0
+
+    @pytest.mark.asyncio
+    async def test_send_message_reinstalls_missing_routine(self):
+        """Should reinstall the routine if the page lost it, then retry."""
+        chat = ZoomChat()
+        chat.page = AsyncMock()
+        chat.page.evaluate = AsyncMock(
+            side_effect=[{"installed": False}, None, {"success": True}]
+        )
+
+        await chat.send_message("Hello")
+
+        assert chat.page.evaluate.await_args_list[1].args == (SENDER_SCRIPT,)
+        assert chat.page.evaluate.await_args_list[-1].args == (SEND_CALL, "Hello")
+
+    def test_sender_waits_on_dom_events_not_fixed_sleeps(self):
+        """Should wait with MutationObserver rather than hard-coded sleeps."""
+        assert "MutationObserver" in SENDER_SCRIPT
+        assert "setTimeout(r," not in SENDER_SCRIPT
+
     @pytest.mark.asyncio
     async def test_send_message_raises_when_not_connected(self):
         """Should raise when not connected."""
@@ -83,6 +343,153 @@ class TestZoomChatSendMessage:
             await chat.send_message("Hello")
 
 
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    async def test_allows_burst_then_limits_rate(self):
+        """Should pass a burst immediately and then pace acquisitions."""
+        bucket = TokenBucket(rate=20, capacity=2)
+
+        start = time.monotonic()
+        await bucket.acquire()
+        await bucket.acquire()
+        burst_time = time.monotonic() - start
+        await bucket.acquire()
+        total_time = time.monotonic() - start
+
+        assert burst_time < 0.04
+        assert total_time >= 0.045
+
+
+class TestZoomChatSendQueue:
+    """Tests for ZoomChat's ordered, rate-limited send queue."""
+
+    def _chat(self, **kwargs) -> tuple[ZoomChat, list[str]]:
+        """ZoomChat whose sends are recorded instead of reaching a page."""
+        chat = ZoomChat(rate=1000, burst=1000, **kwargs)
+        sent = []
+        in_flight = []
+
+        async def send_message(text):
+            assert not in_flight, "sends overlapped"
+            in_flight.append(text)
+            await asyncio.sleep(0.01)
+            in_flight.remove(text)
+            sent.append(text)
+            chat.last_send_ms = 10.0
+
+        chat.send_message = send_message
+        return chat, sent
+
+    async def test_sends_one_at_a_time_in_order(self):
+        """Should never interleave sends and keep queueing order."""
+        chat, sent = self._chat()
+
+        await asyncio.gather(*(chat.queue_message(f"m{i}") for i in range(5)))
+
+        assert sent == ["m0", "m1", "m2", "m3", "m4"]
+        await chat.disconnect()
+
+    async def test_coalesces_queued_messages(self):
+        """Should join messages that queued up behind a send."""
+        chat, sent = self._chat(coalesce=True)
+
+        first = asyncio.create_task(chat.queue_message("m0"))
+        await asyncio.sleep(0.005)  # m0 is now being sent
+        results = await asyncio.gather(
+            first, chat.queue_message("m1"), chat.queue_message("m2")
+        )
+
+        assert sent == ["m0", "m1\n\nm2"]
+        assert results == [10.0, 10.0, 10.0]
+        await chat.disconnect()
+
+    async def test_applies_backpressure_when_full(self):
+        """Should make callers wait while the queue is full."""
+        chat, sent = self._chat(queue_size=1)
+        release = asyncio.Event()
+        send = chat.send_message
+
+        async def blocked_send(text):
+            await release.wait()
+            await send(text)
+
+        chat.send_message = blocked_send
+        tasks = [asyncio.create_task(chat.queue_message(f"m{i}")) for i in range(3)]
+        await asyncio.sleep(0.01)
+
+        # m0 is being sent, m1 fills the queue and m2's caller is waiting
+        assert chat._queue.full()
+        assert sent == []
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert sent == ["m0", "m1", "m2"]
+        await chat.disconnect()
+
+    async def test_disconnect_fails_pending_messages(self):
+        """Should fail in-flight and queued messages rather than hang."""
+        chat, _sent = self._chat()
+        never = asyncio.Event()
+
+        async def hung_send(text):
+            await never.wait()
+
+        chat.send_message = hung_send
+        tasks = [asyncio.create_task(chat.queue_message(f"m{i}")) for i in range(3)]
+        await asyncio.sleep(0.01)  # m0 is being sent, m1 and m2 are queued
+
+        await chat.disconnect()
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*tasks, return_exceptions=True), timeout=1
+        )
+        assert [str(result) for result in results] == ["Disconnected"] * 3
+        assert chat._queue.empty()
+
+    async def test_propagates_send_errors(self):
+        """Should raise the send's error to the caller that queued it."""
+        chat = ZoomChat()
+
+        with pytest.raises(RuntimeError, match="[Nn]ot connected"):
+            await chat.queue_message("Hello")
+        await chat.disconnect()
+
+
+class TestNormalizeToAscii:
+    """Tests for normalize_to_ascii."""
+
+    def test_replaces_typographic_punctuation(self):
+        """Should map smart quotes, dashes, ellipses and bullets."""
+        text = "\u201cHi\u201d \u2014 it\u2019s \u2022 done\u2026"
+        assert normalize_to_ascii(text) == '"Hi" - it\'s * done...'
+
+    def test_strips_accents(self):
+        """Should fall back to decomposition for accented letters."""
+        assert normalize_to_ascii("Caf\u00e9 na\u00efve \u00c5ngstr\u00f6m") == (
+            "Cafe naive Angstrom"
+        )
+
+    def test_handles_letters_without_decomposition(self):
+        """Should transliterate letters NFKD leaves alone."""
+        assert normalize_to_ascii("Stra\u00dfe \u0141\u00f3d\u017a") == "Strasse Lodz"
+
+    def test_unfolds_compatibility_forms(self):
+        """Should unfold ligatures, full-width letters and fractions."""
+        assert normalize_to_ascii("\ufb01le \uff26ull \u00bd") == "file Full 1/2"
+
+    def test_output_is_always_ascii(self):
+        """Should drop characters with no ASCII form."""
+        result = normalize_to_ascii("Launch \U0001f680 \u4e2d\u6587 \u200bnow")
+        assert result.isascii()
+        assert result == "Launch   now"
+
+    def test_returns_ascii_input_unchanged(self):
+        """Should pass plain ASCII straight through."""
+        text = "https://example.com/path?q=1"
+        assert normalize_to_ascii(text) is text
+
+
 class TestFormatLinksMessage:
     """Tests for format_links_message."""
 
@@ -119,3 +526,81 @@ class TestFormatLinksMessage:
         slide = Slide(number=2, title="No Links", links=[])
         result = format_links_message(slide)
         assert "no links" in result.lower() or result == ""
+
+    def test_leaves_out_internal_slide_links(self):
+        """Should only send links that work outside the presentation."""
+        slide = Slide(
+            number=4,
+            title="Agenda",
+            links=[
+                Link(text="Next", url="#slide=id.p5"),
+                Link(text="Docs", url="https://docs.example.com"),
+            ],
+        )
+        result = format_links_message(slide)
+        assert "#slide" not in result
+        assert "https://docs.example.com" in result
+
+    def test_never_sends_blank_title_or_labels(self):
+        """Should drop text that has no ASCII form, not leave it blank."""
+        slide = Slide(2, "Введение", [Link("Документация", "https://docs.example")])
+
+        assert format_links_message(slide) == (
+            "Links from Slide 2\n- https://docs.example"
+        )
+        assert format_links_message(Slide(3, "日本語", [])) == ("Slide 3 has no links.")
+
+    def test_leaves_out_speaker_note_links(self):
+        """Should keep the presenter's notes out of the meeting chat."""
+        slide = Slide(
+            number=5,
+            title="Demo",
+            links=[
+                Link(text="Runbook", url="https://private.example", source="notes"),
+                Link(text="Docs", url="https://docs.example.com"),
+            ],
+        )
+        result = format_links_message(slide)
+        assert "private.example" not in result
+        assert "https://docs.example.com" in result
+
+
+class TestMessageCache:
+    """Tests for MessageCache."""
+
+    def test_renders_once_per_slide(self):
+        """Should reuse the rendered message while the slide is unchanged."""
+        slide = Slide(number=1, title="Intro", links=[Link("Docs", "https://d")])
+        cache = MessageCache()
+
+        with patch(
+            "google_slidebot.zoom_chat.format_links_message", return_value="msg"
+        ) as mock_format:
+            cache.warm([slide])
+            assert cache.get(slide) == "msg"
+            assert cache.get(slide) == "msg"
+
+        mock_format.assert_called_once_with(slide)
+
+    def test_rerenders_after_slide_changes(self):
+        """Should notice new links or title assigned to the slide."""
+        slide = Slide(number=1, title="Intro", links=[Link("Docs", "https://d")])
+        cache = MessageCache()
+        cache.get(slide)
+
+        slide.links = [Link("API", "https://api")]
+        assert "https://api" in cache.get(slide)
+
+        slide.title = "Renamed"
+        assert "Renamed" in cache.get(slide)
+
+    def test_invalidate_forces_rerender(self):
+        """Should render again after explicit invalidation."""
+        slide = Slide(number=1, title="Intro", links=[Link("Docs", "https://d")])
+        cache = MessageCache()
+        cache.get(slide)
+        slide.links.append(Link("API", "https://api"))
+
+        cache.invalidate(slide)
+
+        assert "https://api" in cache.get(slide)